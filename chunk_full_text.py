@@ -4,7 +4,6 @@ This enables answering ANY question about funds, not just the 7 specific fields
 """
 import json
 import csv
-import re
 from pathlib import Path
 from typing import List, Dict
 
@@ -37,7 +36,7 @@ def chunk_text(text: str, source_id: str, source_meta: Dict, chunk_size: int = C
     chunks = []
     
     # Clean text first (faster - just normalize whitespace)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(text.split())
     
     if len(text) < chunk_size:
         # Single chunk for short text
@@ -416,7 +416,7 @@ def extract_benchmark(text: str) -> Optional[str]:
             benchmark = match.group(1).strip()
             # Clean up common artifacts
             benchmark = re.sub(r"\b(website|subjectto|fields)\b", "", benchmark, flags=re.IGNORECASE)
-            benchmark = re.sub(r"\s+", " ", benchmark).strip()
+            benchmark = " ".join(benchmark.split())
             if len(benchmark) > 3:
                 return benchmark
     
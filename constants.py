@@ -2,8 +2,16 @@
 Constants and Configuration
 Centralized constants to avoid duplication and magic strings
 """
+import json
 from typing import Dict
 
+# Use orjson for data file parsing if installed (several times faster), else stdlib json
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Scheme tag mappings
 SCHEME_TAG_MAP = {
     'largecap': 'LARGE_CAP',
@@ -42,6 +50,14 @@ SOURCE_AUTHORITY = {
     'groww': 0.6
 }
 
+# Strict-extraction rank by source type (lower = more authoritative, unknown types rank 5)
+SOURCE_AUTHORITY_RANK = {
+    'sid_pdf': 1,
+    'kim_pdf': 2,
+    'factsheet_consolidated': 3,
+    'scheme_overview': 4
+}
+
 # Field source priorities (order matters - first is highest priority)
 FIELD_SOURCE_PRIORITY = {
     'exit_load': ['sid_pdf', 'kim_pdf', 'factsheet_consolidated', 'scheme_overview'],
@@ -62,6 +78,17 @@ DEFAULT_TOP_K = 5
 SEARCH_K_MULTIPLIER = 3
 FIELD_FILTER_THRESHOLD = 3  # Minimum chunks for field filtering (was 5)
 
+# IVF-PQ index settings (rebuild_index.py keeps exact flat search below IVF_PQ_MIN_VECTORS,
+# where there is too little data to train the coarse and product quantizers)
+IVF_PQ_MIN_VECTORS = 50000
+IVF_PQ_NLIST = 256
+IVF_PQ_M = 16  # Sub-quantizers (must divide the embedding dimension, 384 for all-MiniLM-L6-v2)
+IVF_PQ_NBITS = 8
+IVF_DEFAULT_NPROBE = 16
+IVF_NPROBE_BY_QUERY_TYPE = {
+    'entity': 32  # Entity queries search more broadly
+}
+
 # Scraper settings
 MAX_CONCURRENT_REQUESTS = 10
 CACHE_TTL_HOURS = 24
@@ -76,6 +103,9 @@ MAX_ANSWER_SENTENCES = {
     'general': 4
 }
 
+# Max seconds to wait for LLM rephrasing of a metric answer before using the extracted fact as-is
+METRIC_REPHRASE_TIMEOUT = 1.5
+
 # Date formats to try
 DATE_FORMATS = [
     "%m/%d/%Y",      # 11/17/2025
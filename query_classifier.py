@@ -2,6 +2,7 @@
 Query Classification System - Categorizes user queries for specialized handling
 """
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 
@@ -55,6 +56,10 @@ class QueryClassifier:
             'what is': ['expense ratio', 'exit load', 'minimum sip', 'benchmark'],
             'how to': ['download', 'redeem', 'invest', 'apply', 'get statement']
         }
+        
+        # Per-instance LRUs keyed by the lowercased query (retrieval and answer generation classify the same query repeatedly)
+        self._classify_lower = lru_cache(maxsize=2048)(self._classify_lower)
+        self._expanded_keywords_lower = lru_cache(maxsize=2048)(self._expanded_keywords_lower)
     
     def classify(self, query: str) -> str:
         """
@@ -66,8 +71,10 @@ class QueryClassifier:
         Returns:
             Query type string
         """
-        query_lower = query.lower()
-        
+        return self._classify_lower(query.lower())
+    
+    def _classify_lower(self, query_lower: str) -> str:
+        """Classify an already-lowercased query (wrapped in an LRU cache in __init__)"""
         # Check each pattern type
         for query_type, patterns in self.patterns.items():
             for pattern in patterns:
@@ -120,7 +127,11 @@ class QueryClassifier:
         Returns:
             List of keywords to boost in retrieval
         """
-        query_lower = query.lower()
+        # Copy so callers can't mutate the cached keywords
+        return list(self._expanded_keywords_lower(query.lower()))
+    
+    def _expanded_keywords_lower(self, query_lower: str) -> Tuple[str, ...]:
+        """Expanded keywords for an already-lowercased query (wrapped in an LRU cache in __init__)"""
         keywords = []
         
         # Get synonyms for terms in query
@@ -129,10 +140,10 @@ class QueryClassifier:
                 keywords.extend(synonyms)
         
         # Add query type specific keywords
-        query_type = self.classify(query)
+        query_type = self._classify_lower(query_lower)
         keywords.extend(self.get_keywords_for_type(query_type))
         
-        return list(set(keywords))
+        return tuple(set(keywords))
     
     def get_keywords_for_type(self, query_type: str) -> List[str]:
         """
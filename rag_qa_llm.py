@@ -7,31 +7,793 @@ import re
 import os
 import json
 import hashlib
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from functools import lru_cache
+from itertools import islice
+import numpy as np
 from query_classifier import QueryClassifier
 from conflict_detector import ConflictDetector
 from clarification_handler import ClarificationHandler
 from constants import (
     SCHEME_TAG_MAP, SCHEME_DISPLAY_NAMES, FIELD_DISPLAY_NAMES,
-    DATE_FORMATS, OUTPUT_DATE_FORMAT, MAX_ANSWER_SENTENCES
+    DATE_FORMATS, OUTPUT_DATE_FORMAT, MAX_ANSWER_SENTENCES, METRIC_REPHRASE_TIMEOUT,
+    SOURCE_AUTHORITY_RANK, json_loads as _json_loads
 )
 
 
+# Scheme keyword -> (display name, chunk scheme_tag), in precedence order (first keyword found in the text wins)
+SCHEME_KEYWORDS = (
+    ("large cap", "HDFC Large Cap Fund", "LARGE_CAP"),
+    ("flexi cap", "HDFC Flexi Cap Fund", "FLEXI_CAP"),
+    ("flexicap", "HDFC Flexi Cap Fund", "FLEXI_CAP"),
+    ("elss", "HDFC TaxSaver (ELSS)", "ELSS"),
+    ("taxsaver", "HDFC TaxSaver (ELSS)", "ELSS"),
+    ("tax saver", "HDFC TaxSaver (ELSS)", "ELSS"),
+    ("hybrid", "HDFC Hybrid Equity Fund", "HYBRID"),
+)
+
+# Lookup tables derived from SCHEME_KEYWORDS (keep scheme edits in the table above)
+QUERY_SCHEME_KEYWORDS = {keyword: (scheme_name, scheme_tag) for keyword, scheme_name, scheme_tag in SCHEME_KEYWORDS}
+SCHEME_NAME_KEYWORDS = tuple((keyword, scheme_name) for keyword, scheme_name, _ in SCHEME_KEYWORDS)
+SCHEME_TAG_KEYWORDS = tuple((keyword, scheme_tag) for keyword, _, scheme_tag in SCHEME_KEYWORDS)
+ELSS_NAME_KEYWORDS = tuple(keyword for keyword, _, scheme_tag in SCHEME_KEYWORDS if scheme_tag == "ELSS")
+
+# Query phrases that identify a metric field
+QUERY_FIELD_KEYWORDS = {
+    'exit_load': ['exit load', 'redemption charge', 'exit charge'],
+    'expense_ratio': ['expense ratio', 'ter', 'total expense ratio'],
+    'minimum_sip': ['minimum sip', 'min sip', 'minimum investment'],
+    'min_lumpsum': ['minimum lumpsum', 'min lumpsum', 'minimum application', 'min application'],
+    'lock_in': ['lock-in', 'lock in', 'lockin'],
+    'benchmark': ['benchmark', 'benchmark index'],
+    'riskometer': ['riskometer', 'risk-o-meter', 'risk meter']
+}
+
+
+def _score_kernel(relevance_scores: np.ndarray, term_overlaps: np.ndarray,
+                  keyword_matches: np.ndarray, source_boosts: np.ndarray) -> tuple:
+    """Blend per-chunk features into final scores and rank them (stable, best first)"""
+    final_scores = relevance_scores * 0.6                          # Primary: retrieval relevance
+    final_scores += np.minimum(term_overlaps * 0.15, 0.3) * 0.2     # Query term matching (cap 0.3)
+    final_scores += np.minimum(keyword_matches * 0.1, 0.2) * 0.15   # Type-specific keywords (cap 0.2)
+    final_scores += source_boosts * 0.05                            # Source authority
+    # Ties keep retrieval order
+    ranking = np.argsort(-final_scores, kind='stable')
+    return final_scores, ranking
+
+
+# Static answers (returned as-is, no per-request string building)
+RISKOMETER_DEFINITION_ANSWER = (
+    "The **Riskometer** is a standardized risk measurement scale introduced by **SEBI (Securities and Exchange Board of India)** for mutual funds. "
+    "It helps investors understand the risk level associated with a mutual fund scheme.\n\n"
+    "The Riskometer classifies risk into **six levels**:\n\n"
+    "1. **Low** - Lowest risk\n"
+    "2. **Low to Moderate** - Slightly higher than low risk\n"
+    "3. **Moderate** - Medium risk\n"
+    "4. **Moderately High** - Higher than moderate risk\n"
+    "5. **High** - High risk\n"
+    "6. **Very High** - Highest risk\n\n"
+    "The Riskometer is displayed on all mutual fund documents (SID, KIM, Factsheet) to help investors make informed decisions based on their risk tolerance."
+)
+ADVISORY_REFUSAL_ANSWER = (
+    "Answer: I cannot provide investment advice. I can only provide factual information from documents. Consult a registered financial advisor.\n"
+    "Can help with: expense ratio, exit load, lock-in period, benchmark, riskometer, minimum SIP amount."
+)
+UNRELATED_TOPIC_ANSWER = (
+    "I only provide information about HDFC Mutual Funds. I don't have information about that topic. "
+    "Please ask me about HDFC schemes, expense ratios, exit loads, fund managers, or other mutual fund-related questions."
+)
+
+
+# Background workers for LLM metric rephrasing (bounded by METRIC_REPHRASE_TIMEOUT)
+_REPHRASE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="metric-rephrase")
+
+# Trigger phrases for special query handlers (group name = handler category), checked in priority order
+SPECIAL_QUERY_PATTERN = re.compile(
+    r'(?P<comparison>compare)'
+    r'|(?P<contradiction>contradict)'
+    r'|(?P<canonical>canonical|facts row)'
+    r'|(?P<business_rule>can i redeem|can redeem|if i redeem|redeem after)'
+)
+SPECIAL_QUERY_PRIORITY = ('comparison', 'contradiction', 'canonical', 'business_rule')
+
+# Final answer cleanup: chunk separators, document headers and fund type labels in one pass
+ANSWER_ARTIFACT_RE = re.compile(
+    r'(?P<separator>\s*---\s*)'                             # Chunk separators (also bare "---")
+    r'|SCHEME\s+INFORMATION\s+DOCUMENT\s*'                  # Document headers
+    r'|\b(?:Hybrid\s+)?DIRECT\s+REGULAR\b\s*',              # Fund type labels
+    re.IGNORECASE
+)
+# "equityequity" / "equity equity" runs -> "equity" (run on the result, so repeats joined by a removal collapse too)
+EQUITY_RUN_RE = re.compile(r'equity(?:\s*equity)+', re.IGNORECASE)
+# Incomplete sentences at the end (one end-anchored alternation); an "Investors should consult"
+# tail that itself ends in a truncated fragment also absorbs that fragment's trailing whitespace
+TRUNCATED_TAIL_RE = re.compile(
+    r'\s+(?:whet\s*|if in doubt about\s*'
+    r'|Investors should consult(?:.*?\s+(?:whet|if in doubt about)\s*|.*?))$',
+    re.IGNORECASE | re.DOTALL
+)
+LEADING_A_HDFC_RE = re.compile(r'^A\s+HDFC\s+', re.IGNORECASE)
+# Substrings (lowercase) that every match of the cleanup patterns above must contain
+ANSWER_ARTIFACT_MARKERS = ('---', 'scheme', 'regular', 'whet', 'if in doubt about', 'investors should consult')
+HSPACE_RUN_RE = re.compile(r'[ \t]+')
+EXTRA_NEWLINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+
+def _has_artifact_markers(text: str) -> bool:
+    """Cheap substring gate: False guarantees the artifact/tail/"A HDFC" cleanup regexes would not match"""
+    # Lowercase substring checks only mirror IGNORECASE on ASCII text (e.g. 'ſ' matches 's')
+    if not text.isascii():
+        return True
+    text_lower = text.lower()
+    return (
+        any(marker in text_lower for marker in ANSWER_ARTIFACT_MARKERS)
+        or text_lower.count('equity') > 1
+        or text_lower.startswith('a')
+    )
+
+
+def _artifact_replacement(match) -> str:
+    """Replacement for ANSWER_ARTIFACT_RE matches"""
+    if match.group('separator') is not None:
+        return ' '
+    return ''
+
+
+def _remove_answer_artifacts(text: str) -> str:
+    """Remove separators, headers and fund type labels, then collapse the "equity" runs that remain"""
+    return EQUITY_RUN_RE.sub('equity', ANSWER_ARTIFACT_RE.sub(_artifact_replacement, text))
+
+
+# Numeric value patterns per metric field for _extract_numeric_pattern
+_NUMERIC_FIELD_PATTERN_SOURCES = {
+    'exit_load': (
+        r'exit\s*load[^.]*?([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%',
+        r'([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%\s*exit\s*load',
+        r'exit\s*load[^.]*?nil',
+    ),
+    'expense_ratio': (
+        # Avoid "reduction" - look for TER as standalone or in specific contexts
+        r'(?:total\s*)?expense\s*ratio\s*(?:\(ter\))?[^.]*?(?:is|of|:)\s*([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%(?!\s*reduction)',
+        r'ter\s*(?:is|of|:)\s*([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%(?!\s*reduction)',
+        r'([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%\s*(?:total\s*)?expense\s*ratio(?!\s*reduction)',
+        # Look for TER in overview pages (current values)
+        r'(?:current\s*)?(?:total\s*)?expense\s*ratio[^.]*?([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%(?!\s*reduction)',
+    ),
+    'minimum_sip': (
+        r'minimum\s*(?:sip|application)[^.]*?(?:₹|Rs\.?|INR)?\s?([0-9,]+)',
+        r'([0-9,]+)\s*(?:₹|Rs\.?|INR)?\s*minimum\s*(?:sip|application)',
+    ),
+    'lock_in': (
+        r'lock[^.]*?(\d+)\s*(?:year|years|yr|yrs)',
+        r'(\d+)\s*(?:year|years|yr|yrs)[^.]*?lock',
+    ),
+    'benchmark': (
+        r'benchmark[^.]*?([A-Z][A-Z0-9\s]+(?:Index|TRI|Total Returns Index))',
+        r'benchmarked?\s*against\s*([A-Z][A-Z0-9\s]+(?:Index|TRI|Total Returns Index))',
+        r'([A-Z][A-Z0-9\s]+(?:Index|TRI|Total Returns Index))\s*(?:\(as per|as per|\(TRI\)|TRI)',
+    ),
+    'riskometer': (
+        r'riskometer[^.]*?(low|moderate|high|very\s*high|moderately\s*high|low\s*to\s*moderate)',
+        r'risk[^.]*?level[^.]*?(low|moderate|high|very\s*high|moderately\s*high|low\s*to\s*moderate)',
+        r'scheme\s*riskometer[^.]*?(low|moderate|high|very\s*high|moderately\s*high|low\s*to\s*moderate)',
+    ),
+    'min_lumpsum': (
+        r'minimum\s*(?:lumpsum|application|amount)[^.]*?(?:₹|Rs\.?|INR)?\s?([0-9,]+)',
+        r'([0-9,]+)\s*(?:₹|Rs\.?|INR)?\s*minimum\s*(?:lumpsum|application|amount)',
+    ),
+}
+NUMERIC_FIELD_PATTERNS = {
+    field: tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in sources)
+    for field, sources in _NUMERIC_FIELD_PATTERN_SOURCES.items()
+}
+# Quick reject per field: every pattern above needs at least one of these in the (ASCII) lowercased text
+NUMERIC_FIELD_REQUIRED_KEYWORDS = {
+    'exit_load': ('exit',),
+    'expense_ratio': ('ratio', 'ter'),
+    'minimum_sip': ('minimum',),
+    'lock_in': ('lock',),
+    'benchmark': ('benchmark', 'index', 'tri'),
+    'riskometer': ('risk',),
+    'min_lumpsum': ('minimum',),
+}
+
+
+# "Field Name: Value. Source: ..." value extractors for metric chunks, tried in order
+METRIC_VALUE_PATTERNS = (
+    re.compile(r':\s*([^.]*?)(?:\.|Source)', re.IGNORECASE),  # "Field: Value. Source"
+    re.compile(r':\s*([^.]*?)(?:\.|$)', re.IGNORECASE),        # "Field: Value."
+    re.compile(r'\(TER\):\s*([^.]*?)(?:\.|Source)', re.IGNORECASE),  # "TER): Value. Source"
+)
+
+
+# Redemption answer quality checks: one alternation scan per phrase set over the lowercased answer
+def _literal_alternation(phrases) -> re.Pattern:
+    """Compile literal phrases into a single alternation regex (longest first)"""
+    return re.compile('|'.join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)))
+
+
+EXIT_LOAD_INDICATOR_RE = _literal_alternation([
+    'exit load', 'exit charge', 'payable if units are redeemed',
+    'redeemed/switched-out', 'within 1 year', 'after 1 year',
+    'date of allotment', 'no exit load is payable'
+])
+REDEMPTION_STEPS_RE = _literal_alternation([
+    'log in', 'navigate to', 'redeem section', 'submit', 'before 3 pm',
+    'credited to your bank', '3-5 business days', 'follow these steps',
+    'withdraw section', 'enter the number', 'redemption request', 'proceeds will be credited'
+])
+POOR_REDEMPTION_ANSWER_RE = _literal_alternation([
+    'can be redeemedswitched', 'can be redeemed/switched', 'nav based',
+    'can invest in sip', 'lump sum', 'minimum application amount',
+    'can be redeemedswitched out', 'redeemedswitched out', 'business day at nav'
+])
+
+
+# Hallucinated fund-list guards (bullet "HDFC ..." lines and capitalised HDFC names)
+HDFC_BULLET_RE = re.compile(r'[*•]\s*HDFC\s+', re.IGNORECASE)
+HDFC_BULLET_NAME_RE = re.compile(r'[*•]\s*HDFC\s+\w+', re.IGNORECASE)
+HDFC_BULLET_LINE_RE = re.compile(r'[*•]\s*HDFC\s+[^\n]+', re.IGNORECASE)
+HDFC_NAME_RE = re.compile(r'HDFC\s+[A-Z][a-z]+')
+HDFC_FUND_NAME_RE = re.compile(r'HDFC\s+[A-Z][a-z]+\s+Fund', re.IGNORECASE)
+
+
+# _clean_answer_metadata ladders (applied in order): SEBI circulars, document and role metadata,
+# then exit-load noise stripped from fund manager answers
+# Entries are (pattern, replacement, keywords), see _apply_keyword_gated_subs
+ANSWER_METADATA_SUBS = (
+    # Remove SEBI circular references
+    (re.compile(r'SEBI\s+Circular\s+No\.?\s*[A-Z0-9/]+\s+dated\s+[^,\.]+', re.IGNORECASE), '', ('circular',)),
+    (re.compile(r'CIR/\d+/\d+/\d+\s+dated\s+[^,\.]+', re.IGNORECASE), '', ('cir/',)),
+    (re.compile(r'MRD/[^,\.]+dated\s+[^,\.]+', re.IGNORECASE), '', ('mrd/',)),
+    (re.compile(r'notifying\s+fram[^\.]*', re.IGNORECASE), '', ('fram',)),
+    # Remove document metadata patterns - MORE AGGRESSIVE
+    (re.compile(r'Top\s+\d+\s+Holdings\s+Downloads?', re.IGNORECASE), '', ('holdings',)),
+    (re.compile(r'Fund\s+Facts\s*-\s*[^\.]*?\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    (re.compile(r'Presentation\s+[^\.]*?\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    (re.compile(r'Leaflet\s*\([^)]+\)', re.IGNORECASE), '', ('leaflet',)),
+    (re.compile(r'[A-Z][^\.]*?\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    (re.compile(r'\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    (re.compile(r'As\s+of\s+\w+\s+\d{4}', re.IGNORECASE), '', None),
+    (re.compile(r'As\s+on\s+\d{1,2}\s+\w+\s+\d{4}', re.IGNORECASE), '', None),
+    (re.compile(r'Downloads?\s*$', re.IGNORECASE | re.MULTILINE), '', ('download',)),
+    (re.compile(r'Top\s+\d+\s+Holdings', re.IGNORECASE), '', ('holdings',)),
+    # Remove position/role metadata and Franklin Templeton mentions. Every branch deletes up to
+    # the next period, so one alternation pass removes the same text as four sequential subs
+    (re.compile(r'Last\s+Position\s+Held:\s*[^\.]*|\*\s*excluding\s+[^\.]*|\^\s*Cut-off\s+date[^\.]*'
+                r'|Franklin\s+Templeton[^\.]*', re.IGNORECASE),
+     '', ('held:', 'excluding', 'cut-off', 'templeton')),
+)
+MANAGER_ANSWER_NOISE_SUBS = (
+    (re.compile(r'\s+Exit\s+Load[^\.]*\.', re.IGNORECASE), '', ('exit',)),
+    (re.compile(r'\s+In\s+respect\s+of\s+each\s+purchase[^\.]*\.', re.IGNORECASE), '', ('respect',)),
+    (re.compile(r'\s+OVERSEAS[^\.]*\.', re.IGNORECASE), '', ('overseas',)),
+    (re.compile(r'\s+is\s+payable\s+if[^\.]*\.', re.IGNORECASE), '', ('payable',)),
+    (re.compile(r'\s+redeemed\s+/\s+switched-out[^\.]*\.', re.IGNORECASE), '', ('switched-out',)),
+    (re.compile(r'\s+within\s+\d+\s+year[^\.]*\.', re.IGNORECASE), '', ('within',)),
+    # Remove fragments like "nd Manager - Equities" or ")00%"
+    (re.compile(r'nd\s+Manager[^\.]*\.', re.IGNORECASE), '', ('manager',)),
+    (re.compile(r'\)\d+%'), '', ('%',)),
+    (re.compile(r'Equity\s+Analyst\s+and\s+Fund\s+Manager\s+for\s+Overseas', re.IGNORECASE), '', ('analyst',)),
+)
+
+
+# Fund names outside our four schemes that show up in hallucinated answers
+_INVALID_FUND_NAME_SOURCES = (
+    "HDFC Banking & Financial Services Fund",
+    "HDFC Business Cycle Fund",
+    "HDFC Value Fund",
+    "HDFC Defence Fund",
+    "HDFC Dividend Yield Fund",
+    "HDFC Focused 30 Fund",
+    "HDFC Housing Opportunities Fund",
+    "HDFC Infrastructure Fund",
+    "HDFC Large and Mid Cap Fund",
+    "HDFC Manufacturing Fund",
+    "HDFC Mid-Cap Opportunities Fund",
+    "HDFC MNC Fund",
+    "HDFC Multi Cap Fund",
+    "HDFC Non-Cyclical Consumption Fund",
+    "HDFC Non-Cyclical",
+    "HDFC Hybrid Debt Fund",
+    "HDFC Income Fund",
+    "HDFC Liquid Fund",
+    "HDFC Long Duration Debt Fund",
+    "HDFC Low Duration Fund",
+    "HDFC Medium Term Debt Fund",
+    "HDFC Money Market Fund",
+    "HDFC Multi-Asset Fund",
+    "HDFC Retirement Saving",
+    "HDFC Retirement Saving fund",
+    "HDFC Children's Fund",
+    "HDFC Technology Fund",
+    "HDFC Arbitrage Fund",
+)
+
+
+def _unique_longest_first(names) -> list:
+    """Names deduplicated case-insensitively (first spelling kept), longest first"""
+    unique = {}
+    for name in names:
+        unique.setdefault(name.lower(), name)
+    return sorted(unique.values(), key=len, reverse=True)
+
+
+# (name, lowercase, removal pattern), longest first so "HDFC Retirement Saving fund" is matched
+# and removed whole rather than leaving " fund" behind after its "HDFC Retirement Saving" prefix
+INVALID_FUND_NAMES = tuple(
+    (name, name.lower(), re.compile(re.escape(name), re.IGNORECASE))
+    for name in _unique_longest_first(_INVALID_FUND_NAME_SOURCES)
+)
+
+
+def _find_invalid_funds(text_lower: str) -> list:
+    """INVALID_FUND_NAMES entries mentioned in lowercased text (in table order, longest first)"""
+    # Every invalid name starts with "hdfc", so only test the names at each "hdfc" occurrence
+    # (one scan of the text instead of one per name); the longest name matching there wins
+    found = set()
+    pos = text_lower.find('hdfc')
+    while pos != -1:
+        for entry in INVALID_FUND_NAMES:
+            if text_lower.startswith(entry[1], pos):
+                found.add(entry[1])
+                break
+        pos = text_lower.find('hdfc', pos + 4)
+    return [entry for entry in INVALID_FUND_NAMES if entry[1] in found] if found else []
+
+
+# Regexes used by the contradiction handler, _post_process_answer and _improve_answer_presentation
+AFTER_N_YEARS_RE = re.compile(r'after\s*(\d+)\s*(?:year|years)')
+DECIMAL_OR_PERCENT_RE = re.compile(r'\d+\.\d+%?|\d+%')  # Decimal or percentage
+TER_CONTEXT_PATTERNS = (
+    re.compile(r'(?:expense ratio|ter|total expense ratio)[:\s]+(\d+\.\d+%?)', re.IGNORECASE),
+    re.compile(r'(\d+\.\d+%?)\s*(?:expense ratio|ter|total expense ratio)', re.IGNORECASE),
+)
+EXIT_LOAD_CONTEXT_PATTERNS = (
+    re.compile(r'(?:exit load|redemption charge)[:\s]+(\d+\.?\d*%?)', re.IGNORECASE),
+    re.compile(r'(\d+\.?\d*%?)\s*(?:exit load|redemption charge)', re.IGNORECASE),
+)
+MANAGER_NAME_PATTERNS = (
+    re.compile(r'(?:Fund\s+Manager|Manager|Investment\s+Manager)[:\s]+(?:Mr\.|Ms\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
+    re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?:Fund\s+Manager|Manager|Investment\s+Manager|Equity\s+Analyst)', re.IGNORECASE),
+    re.compile(r'(?:Mr\.|Ms\.|Mrs\.|Dr\.)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
+)
+LIST_STRUCTURE_RE = re.compile(r'[0-9]+\.|•|-\s+[A-Z]')
+LIST_ITEM_RE = re.compile(r'([A-Z][^.!?]*(?:\([^)]+\))?)')
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?]) ')  # Same-line sentence break, as in the old '. ' split
+# (pattern, replacement, lowercase keyword the pattern needs); keywords avoid i/k/s, whose
+# IGNORECASE matches include non-ASCII letters that str.lower() leaves alone
+PRESENTATION_HEADER_SUBS = (
+    (re.compile(r'SCHEME INFORMATION DOCUMENT\s+', re.IGNORECASE), '', 'document'),
+    (re.compile(r'DIRECT REGULAR\s*', re.IGNORECASE), '', 'regular'),
+    (re.compile(r'An open ended hybrid scheme\s+', re.IGNORECASE), 'An open-ended hybrid scheme ', 'open ended'),
+)
+PAGE_TITLE_SUBS = (
+    (re.compile(r'HDFC\s+Large\s+Cap\s+Fund\s+Direct\s+Growth\s*-\s*NAV.*?Performance', re.IGNORECASE), ''),
+    (re.compile(r'HDFC\s+Mutual\s+Funds\s+HDFC\s+', re.IGNORECASE), 'HDFC '),
+    (re.compile(r'Equity\s+DIRECT\s+REGULAR', re.IGNORECASE), ''),
+)
+
+
+@lru_cache(maxsize=32)
+def _exit_load_after_year_re(year: str) -> re.Pattern:
+    """Compiled 'exit load ... after <year> ... N%' matcher for contradiction checks (year is digits)"""
+    return re.compile(r'exit\s*load[^.]*?after\s*' + year + r'[^.]*?([0-9.]+)\s?%')
+
+
+# _clean_chunk_text subs are (pattern, replacement, keywords): a pattern only runs when one of its
+# lowercase keywords is present (None = always run), see _apply_keyword_gated_subs
+# SEBI circulars and document lists, applied before _remove_pdf_names (in order)
+CHUNK_METADATA_SUBS = (
+    (re.compile(r'SEBI\s+Circular\s+No\.?\s*[A-Z0-9/]+\s+dated\s+[^,]+', re.IGNORECASE), '', ('circular',)),
+    (re.compile(r'CIR/\d+/\d+/\d+\s+dated\s+[^,]+', re.IGNORECASE), '', ('cir/',)),
+    (re.compile(r'MRD/[^,]+dated\s+[^,]+', re.IGNORECASE), '', ('mrd/',)),
+    (re.compile(r'notifying\s+fram[^.]*', re.IGNORECASE), '', ('fram',)),
+    # "p 10 Holdings As on 31 Oct 2025 Downloads..."
+    # (a trailing lazy [^.]*? always matches empty, so it is left off)
+    (re.compile(r'^p\s+\d+\s+[A-Z][^.]*?Downloads', re.IGNORECASE | re.MULTILINE), '', ('download',)),
+    # Document lists like "SID - HDFC Large Cap Fund dated May 30, 2025 KIM..."
+    # (one separator char suffices: [\s\-:]+ followed by [^.]*? only multiplied the backtracking)
+    (re.compile(r'(?:SID|KIM|Leaflet|Presentation|Fund Facts)[\s\-:][^.]*?(?:dated|as on|as of)[^.]*?(?:\d{4}|\d{1,2}\s+\w+\s+\d{4})', re.IGNORECASE), '', ('dated', 'as on', 'as of')),
+)
+# Applied after _remove_pdf_names: remaining document references, dates and holdings headers (in order)
+CHUNK_DOCUMENT_SUBS = (
+    (re.compile(r'Fund\s+Facts\s*-\s*[^.]*?\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    (re.compile(r'Presentation\s+[^.]*?\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    (re.compile(r'Leaflet\s*\([^)]+\)', re.IGNORECASE), '', ('leaflet',)),
+    (re.compile(r'\.pdf', re.IGNORECASE), '', ('.pdf',)),
+    # "As on 31 Oct 2025" or "As of September 2025" standalone
+    (re.compile(r'As\s+on\s+\d{1,2}\s+\w+\s+\d{4}', re.IGNORECASE), '', None),
+    (re.compile(r'As\s+of\s+\w+\s+\d{4}', re.IGNORECASE), '', None),
+    # Standalone dates at start of line
+    (re.compile(r'^\d{1,2}\s+\w+\s+\d{4}\s*', re.MULTILINE), '', None),
+    # "Holdings" headers with dates and "Top 10 Holdings Downloads"
+    (re.compile(r'Holdings\s+As\s+on[^.]*', re.IGNORECASE), '', ('holdings',)),
+    (re.compile(r'Top\s+\d+\s+Holdings\s+Downloads?', re.IGNORECASE), '', ('holdings',)),
+    (re.compile(r'Downloads?\s*$', re.IGNORECASE | re.MULTILINE), '', ('download',)),
+    (re.compile(r'Top\s+\d+\s+Holdings', re.IGNORECASE), '', ('holdings',)),
+)
+CHUNK_ENTITY_NOISE_SUBS = (
+    (re.compile(r'Exit\s+Load[^.]*\.', re.IGNORECASE | re.DOTALL), '', ('exit',)),
+    (re.compile(r'In\s+respect\s+of\s+each\s+purchase[^.]*\.', re.IGNORECASE | re.DOTALL), '', ('respect',)),
+    (re.compile(r'OVERSEAS[^.]*\.', re.IGNORECASE | re.DOTALL), '', ('overseas',)),
+    (re.compile(r'is\s+payable\s+if[^.]*\.', re.IGNORECASE | re.DOTALL), '', ('payable',)),
+    (re.compile(r'redeemed\s+/\s+switched-out[^.]*\.', re.IGNORECASE | re.DOTALL), '', ('switched-out',)),
+    (re.compile(r'within\s+\d+\s+year[^.]*\.', re.IGNORECASE | re.DOTALL), '', ('within',)),
+)
+# Position/role metadata; each branch runs to the next period, so a single pass matches sequential subs
+CHUNK_ROLE_METADATA_SUBS = (
+    (re.compile(r'Last\s+Position\s+Held:\s*[^.]*|\*\s*excluding\s+[^.]*|\^\s*Cut-off\s+date[^.]*', re.IGNORECASE),
+     '', ('held:', 'excluding', 'cut-off')),
+)
+CHUNK_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\,\:\-\(\)]')
+# The ASCII characters CHUNK_SPECIAL_CHARS_RE removes, for bytes.translate on ASCII text
+CHUNK_SPECIAL_ASCII_BYTES = bytes(c for c in range(128) if CHUNK_SPECIAL_CHARS_RE.match(chr(c)))
+PDF_EXTENSION_RE = re.compile(r'\.pdf', re.IGNORECASE)
+PDF_NAME_START_RE = re.compile(r'[A-Z]', re.IGNORECASE)
+
+
+def _apply_keyword_gated_subs(text: str, subs) -> str:
+    """Apply (pattern, replacement, keywords) subs in order, skipping patterns none of whose keywords occur"""
+    # Lowercase substring checks only mirror IGNORECASE on ASCII text (e.g. 'ſ' matches 's')
+    if not text.isascii():
+        for pattern, replacement, _ in subs:
+            text = pattern.sub(replacement, text)
+        return text
+    text_lower = text.lower()
+    for pattern, replacement, keywords in subs:
+        if keywords is None or any(keyword in text_lower for keyword in keywords):
+            text, count = pattern.subn(replacement, text)
+            if count:
+                # A removal can join text into a new keyword occurrence
+                text_lower = text.lower()
+    return text
+
+
+def _remove_pdf_names(text: str) -> str:
+    """Linear-time equivalent of re.sub(r'[A-Z][^.]*?\\.pdf', '', text, flags=re.IGNORECASE)"""
+    # The regex retries every letter of a period-free run that never reaches ".pdf", which is
+    # quadratic on long chunks. A name cannot span a period, so for each ".pdf" the match starts
+    # at the first letter after the previous period (or the previous removal)
+    pieces = []
+    last_end = 0
+    for extension in PDF_EXTENSION_RE.finditer(text):
+        extension_start = extension.start()
+        segment_start = max(text.rfind('.', last_end, extension_start) + 1, last_end)
+        name_start = PDF_NAME_START_RE.search(text, segment_start, extension_start)
+        if name_start is None:
+            continue
+        pieces.append(text[last_end:name_start.start()])
+        last_end = extension.end()
+    if not pieces:
+        return text
+    pieces.append(text[last_end:])
+    return ''.join(pieces)
+
+
+# Retrieved chunks recur across queries, and cleaning depends only on (text, entity query?)
+@lru_cache(maxsize=4096)
+def _clean_chunk_text_cached(text: str, is_entity_query: bool) -> str:
+    """Body of RAGQALLM._clean_chunk_text, memoized per (chunk text, entity query)"""
+    # SEBI circulars, document lists, PDF names, dates and holdings headers
+    # (each pattern is skipped unless one of its trigger keywords occurs in the text)
+    text = _apply_keyword_gated_subs(text, CHUNK_METADATA_SUBS)
+    text = _remove_pdf_names(text)
+    text = _apply_keyword_gated_subs(text, CHUNK_DOCUMENT_SUBS)
+    
+    # For entity queries, remove exit load and other irrelevant info
+    if is_entity_query:
+        text = _apply_keyword_gated_subs(text, CHUNK_ENTITY_NOISE_SUBS)
+    
+    # Remove position/role metadata that's not relevant
+    text = _apply_keyword_gated_subs(text, CHUNK_ROLE_METADATA_SUBS)
+    
+    # Clean up multiple spaces and fragments (split/join also trims the ends, which strip() below does anyway)
+    text = ' '.join(text.split())
+    # Remove special chars except basic punctuation (bytes.translate is a C loop; regex for non-ASCII text)
+    if text.isascii():
+        text = text.encode('ascii').translate(None, CHUNK_SPECIAL_ASCII_BYTES).decode('ascii')
+    else:
+        text = CHUNK_SPECIAL_CHARS_RE.sub('', text)
+    return text.strip()
+
+
+# _clean_context_for_entity: document metadata and exit-load text (in order, keyword-gated)
+ENTITY_CONTEXT_NOISE_SUBS = (
+    (re.compile(r'Top\s+\d+\s+Holdings.*?Downloads', re.IGNORECASE | re.DOTALL), '', ('downloads',)),
+    (re.compile(r'Fund\s+Facts.*?\.pdf', re.IGNORECASE | re.DOTALL), '', ('.pdf',)),
+    (re.compile(r'Exit\s+Load.*?\.', re.IGNORECASE | re.DOTALL), '', ('exit',)),
+    (re.compile(r'OVERSEAS.*?\.', re.IGNORECASE | re.DOTALL), '', ('overseas',)),
+    (re.compile(r'is\s+payable\s+if.*?\.', re.IGNORECASE | re.DOTALL), '', ('payable',)),
+    (re.compile(r'In\s+respect\s+of.*?\.', re.IGNORECASE | re.DOTALL), '', ('respect',)),
+)
+
+# _clean_answer_metadata trailing cleanup
+DOUBLE_COMMA_RE = re.compile(r',\s*,')
+LEADING_PUNCT_RE = re.compile(r'^[,\.\s]+')
+TRAILING_PUNCT_RE = re.compile(r'[,\.\s]+$')
+LEADING_LETTER_FRAGMENT_RE = re.compile(r'^[a-z]\s+', re.IGNORECASE)
+
+# _is_obviously_noise / _is_metadata_chunk (matched against lowercased text)
+NOISE_LINE_PATTERNS = (
+    re.compile(r'^downloads?$'),
+    re.compile(r'^\.pdf$'),
+    re.compile(r'^page \d+ of \d+$'),
+    re.compile(r'^table of contents$'),
+    re.compile(r'^top \d+ holdings downloads?$'),
+)
+# (literal the pattern cannot match without, pattern) - the substring test skips most regex scans
+METADATA_DOC_PATTERNS = (
+    ('dated', re.compile(r'sid\s*-\s*.*?\s+dated')),
+    ('dated', re.compile(r'kim\s*-\s*.*?\s+dated')),
+    ('presentation', re.compile(r'leaflet.*?presentation')),
+    ('october', re.compile(r'fund facts.*?october')),
+    ('downloads', re.compile(r'holdings\s+as\s+on.*?downloads')),
+)
+DAY_MONTH_YEAR_RE = re.compile(r'\d{1,2}\s+\w+\s+\d{4}')
+
+# _extract_from_context_directly
+CONTEXT_METRIC_PATTERNS = (
+    re.compile(r'(?:expense ratio|ter|total expense ratio)[:\s]+(\d+\.?\d*%?)', re.IGNORECASE),
+    re.compile(r'(?:exit load)[:\s]+(\d+\.?\d*%?)', re.IGNORECASE),
+    re.compile(r'(?:minimum sip|minimum investment)[:\s]+(?:Rs\.?|₹)?\s*(\d+(?:,\d+)*)', re.IGNORECASE),
+)
+IDEAL_FOR_RE = re.compile(r'(?:ideal for|suitable for)[:\s]+([^.\n]{10,150})', re.IGNORECASE)
+INVESTORS_SEEKING_RE = re.compile(r'(?:suitable for investors who are seeking|investors who are seeking)[:\s]+([^~]{20,300})', re.IGNORECASE)
+OBJECTIVE_TARGET_RE = re.compile(r'(?:investment objective|aims to|designed for)[:\s]+([^.\n]{30,200})', re.IGNORECASE)
+MANAGER_CONTEXT_NOISE_SUBS = (
+    (re.compile(r'Exit\s+Load.*?\.', re.IGNORECASE | re.DOTALL), '', ('exit',)),
+    (re.compile(r'Top\s+\d+\s+Holdings.*?Downloads', re.IGNORECASE | re.DOTALL), '', ('downloads',)),
+    (re.compile(r'OVERSEAS.*?\.', re.IGNORECASE | re.DOTALL), '', ('overseas',)),
+)
+CONTEXT_MANAGER_NAME_PATTERNS = (
+    MANAGER_NAME_PATTERNS[0],
+    MANAGER_NAME_PATTERNS[1],
+    re.compile(r'(?:Name\s+of\s+the\s+Fund\s+Manager|Fund\s+Manager\s+Name)[:\s]+(?:Mr\.|Ms\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE),
+    MANAGER_NAME_PATTERNS[2],
+)
+MANAGER_TENURE_RE = re.compile(r'(?:since|from|tenure)[:\s]+(\d{4})', re.IGNORECASE)
+
+# Overview-file fund manager lookup, in priority order
+OVERVIEW_MANAGER_PATTERNS = (
+    re.compile(r'Fund\s+Managers?\s+(?:Ms\.|Mr\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'(?:Ms\.|Mr\.|Mrs\.|Dr\.)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)\s*\n\s*Senior\s+Fund\s+Manager', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'(?:Ms\.|Mr\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)[^.]*?(?:Senior\s+)?Fund\s+Manager', re.IGNORECASE | re.DOTALL),
+)
+
+
+# Extra boost keywords for fund manager and redemption queries
+MANAGER_BOOST_KEYWORDS = ['fund manager', 'manager', 'investment manager', 'portfolio manager', 'equity analyst', 'manages', 'managed by', 'senior fund manager']
+REDEMPTION_BOOST_KEYWORDS = ['redeem', 'redemption', 'withdraw', 'sell', 'units', 'proceeds', 'credited', 'submit', 'request', 'cut-off', 'cutoff', 'business day']
+
+
+@lru_cache(maxsize=64)
+def _scheme_keyword_pattern(scheme_name: str):
+    """Compiled alternation of a scheme name's significant words (len > 3), or None if there are none"""
+    keywords = [kw for kw in scheme_name.lower().split() if len(kw) > 3]
+    if not keywords:
+        return None
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+def _bounded_join(parts, sep: str, limit: int) -> str:
+    """Same as sep.join(parts)[:limit], but stops consuming parts once the limit is reached"""
+    buf = []
+    used = 0
+    for part in parts:
+        if used >= limit:
+            break
+        if buf:
+            used += len(sep)
+        buf.append(part)
+        used += len(part)
+    return sep.join(buf)[:limit]
+
+
+@lru_cache(maxsize=1)
+def _load_sources() -> tuple:
+    """Parse data_raw/sources_loaded.json once (shared by scheme list and source metadata)"""
+    with open("data_raw/sources_loaded.json", "rb") as f:
+        return tuple(_json_loads(f.read()))
+
+
+@lru_cache(maxsize=2048)
+def _parse_source_date(date_str: str) -> Optional[str]:
+    """Parse a source date (from constants.DATE_FORMATS) into OUTPUT_DATE_FORMAT, or None"""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime(OUTPUT_DATE_FORMAT)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=256)
+def _mdy_date_to_iso(date_str: str) -> Optional[str]:
+    """Convert an MM/DD/YYYY source date to YYYY-MM-DD (cached; few distinct dates), or None"""
+    try:
+        return datetime.strptime(date_str, '%m/%d/%Y').strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _scheme_from_query_lower(query_lower: str) -> tuple:
+    """Cached scheme lookup keyed by the lowercased query"""
+    for keyword, (scheme_name, scheme_tag) in QUERY_SCHEME_KEYWORDS.items():
+        if keyword in query_lower:
+            return scheme_name, scheme_tag
+    return None, None
+
+
+def _scheme_name_from_query_lower(query_lower: str, default: Optional[str] = None) -> Optional[str]:
+    """First scheme display name whose keyword appears in the lowercased query"""
+    for keyword, scheme_name in SCHEME_NAME_KEYWORDS:
+        if keyword in query_lower:
+            return scheme_name
+    return default
+
+
+# AMC overview page per scheme (riskometer and fund manager lookups)
+SCHEME_OVERVIEW_FILES = {
+    "HDFC Large Cap Fund": "data_processed/amc_largecap_overview.txt",
+    "HDFC Flexi Cap Fund": "data_processed/amc_flexicap_overview.txt",
+    "HDFC TaxSaver (ELSS)": "data_processed/amc_elss_overview.txt",
+    "HDFC Hybrid Equity Fund": "data_processed/amc_hybrid_overview.txt",
+}
+
+# "Riskometer" line on an overview page, and the levels it may name (most specific first)
+RISKOMETER_LINE_RE = re.compile(r"Riskometer\s*[:\n]?\s*([^\n]+)", re.IGNORECASE)
+RISKOMETER_LEVELS = tuple(
+    (level, level.lower())
+    for level in ("Very High", "Moderately High", "High", "Moderate", "Low to Moderate", "Low")
+)
+
+
+@lru_cache(maxsize=8)
+def _read_overview_text(file_path: str) -> str:
+    """Contents of an overview file (static between index rebuilds, so read once per process)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# Step-by-step redemption fallback answer per scheme (built once)
+REDEMPTION_FALLBACK_ANSWERS = {
+    scheme_name: f"To redeem your **{scheme_name}** units, follow these steps:\n\n1. **Log in** to your account on the AMC website or distributor platform (like Groww)\n2. Navigate to the **'Redeem'** or **'Withdraw'** section and select the fund\n3. Enter the number of units or amount you want to redeem\n4. **Submit** the redemption request **before 3 PM** on any business day\n5. The proceeds will be credited to your registered bank account within **3-5 business days**\n\n**Important:** Redemption requests submitted after 3 PM will be processed on the next business day."
+    for scheme_name in dict.fromkeys(scheme_name for _, scheme_name in SCHEME_NAME_KEYWORDS)
+}
+
+
+@lru_cache(maxsize=256)
+def _scheme_tag_from_name_lower(name_lower: str) -> Optional[str]:
+    """Chunk scheme_tag for a lowercased scheme name (None if unrecognised)"""
+    for keyword, scheme_tag in SCHEME_TAG_KEYWORDS:
+        if keyword in name_lower:
+            return scheme_tag
+    return None
+
+
+def _chunk_text_lower(chunk: Dict) -> str:
+    """Lowercased chunk text, memoized on the chunk as '_text_lower' (retriever chunks already carry it)"""
+    text_lower = chunk.get('_text_lower')
+    if text_lower is None:
+        text_lower = chunk['_text_lower'] = chunk.get('text', '').lower()
+    return text_lower
+
+
+# Query keywords that mark a metric question (gates the strict regex fallback)
+METRIC_QUERY_KEYWORDS = (
+    'minimum sip', 'minimum lumpsum', 'exit load', 'lock-in', 'lock in',
+    'expense ratio', 'ter', 'benchmark', 'riskometer', 'nav', 'amount',
+    'percentage', 'percent', '%'
+)
+
+# One literal alternation per field, in QUERY_FIELD_KEYWORDS (precedence) order
+FIELD_QUERY_PATTERNS = tuple(
+    (field, _literal_alternation(keywords)) for field, keywords in QUERY_FIELD_KEYWORDS.items()
+)
+
+
+# Canonical facts row field -> metric field name used to build its extraction query
+CANONICAL_FACT_QUERY_FIELDS = {
+    'min_sip': 'minimum_sip',
+    'ter': 'expense_ratio',
+    'lock_in': 'lock_in'
+}
+
+# Technical term -> beginner-style explanation for the 'beginner' response style
+BEGINNER_TERM_EXPLANATIONS = (
+    ('expense ratio', 'expense ratio (the annual fee charged by the fund)'),
+    ('exit load', 'exit load (a charge when you withdraw money early)'),
+    ('lock-in period', 'lock-in period (the minimum time you must keep your investment)'),
+    ('benchmark', 'benchmark (a standard index used to compare fund performance)'),
+)
+BEGINNER_TERM_RE = _literal_alternation(term for term, _ in BEGINNER_TERM_EXPLANATIONS)
+
+
+def _continuation_ok(continuation: str) -> bool:
+    """Whether text following a matched phrase is usable to complete a truncated answer"""
+    return len(continuation) > 10 and not continuation.startswith(('http', 'www', '---'))
+
+
+def _find_sentence_continuation(context: str, search_phrase: str) -> Optional[str]:
+    """Rest of the first '.'-delimited context sentence (> phrase + 30 chars) containing the lowercase phrase"""
+    min_len = len(search_phrase) + 30
+    context_lower = context.lower()
+    if len(context_lower) != len(context) or not search_phrase or '.' in search_phrase:
+        # Lowercasing changed offsets (rare non-ASCII case) or odd phrase - fall back to per-sentence scan
+        for sentence in context.split('.'):
+            sentence_lower = sentence.lower()
+            if search_phrase in sentence_lower and len(sentence) > min_len:
+                continuation = sentence[sentence_lower.find(search_phrase) + len(search_phrase):].strip()
+                if _continuation_ok(continuation):
+                    return continuation
+        return None
+    
+    # Jump between phrase occurrences with str.find instead of splitting the whole context
+    pos = context_lower.find(search_phrase)
+    while pos != -1:
+        start = context.rfind('.', 0, pos) + 1
+        end = context.find('.', pos)
+        if end == -1:
+            end = len(context)
+        if end - start > min_len:
+            continuation = context[pos + len(search_phrase):end].strip()
+            if _continuation_ok(continuation):
+                return continuation
+        pos = context_lower.find(search_phrase, end)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _field_from_query_lower(query_lower: str) -> Optional[str]:
+    """Cached field lookup keyed by the lowercased query"""
+    for field, pattern in FIELD_QUERY_PATTERNS:
+        if pattern.search(query_lower):
+            return field
+    return None
+
+
 class RAGQALLM:
-    def __init__(self, llm_provider: str = "openai", api_key: Optional[str] = None):
+    def __init__(self, llm_provider: str = "openai", api_key: Optional[str] = None, retriever=None):
         """
         Initialize Q&A system with LLM
         
         Args:
             llm_provider: "openai", "gemini", or "local"
             api_key: API key for the provider (if needed)
+            retriever: Optional shared RAGRetriever used for retry retrievals (created lazily if None)
         """
         self.llm_provider = llm_provider
         self.api_key = api_key or os.getenv("OPENAI_API_KEY") or os.getenv("GEMINI_API_KEY")
         self.llm = None
         
+        # Retriever for retry retrievals - reuse one instance instead of reloading the model per call
+        self._retriever = retriever
+        
+        # Boost keyword tables per (query_type, manager, redemption), built on first use
+        self._boost_keyword_cache = {}
+        
+        # In-memory index over chunks_clean.jsonl for direct metric lookups, loaded on first use
+        self._direct_chunk_index = None
+        # Formatted direct metric answers per (field, scheme_name) - source data is static
+        self._metric_answer_cache = {}
+        # Fund manager answers per scheme name (None if not found) - files are static
+        self._manager_answer_cache = {}
+        
+        # Special query handlers keyed by SPECIAL_QUERY_PATTERN group name
+        self._special_query_handlers = {
+            'comparison': self._handle_comparison_query,        # SID vs KIM, SID vs factsheet
+            'contradiction': self._handle_contradiction_query,  # Contradiction detection
+            'canonical': self._handle_canonical_facts_query,    # Canonical facts rows
+            'business_rule': self._handle_business_rule_query,  # Can I redeem, etc.
+        }
+        
         # Initialize query classifier
         self.query_classifier = QueryClassifier()
         
@@ -45,6 +807,10 @@ class RAGQALLM:
         # Keep for backward compatibility during migration
         self.response_cache = {}
         self.cache_max_size = 100  # Max cached responses
+        # Single-question answers keyed by query, retrieved chunks, chat context and answer date
+        self._answer_cache = {}
+        # Per-thread flag set when an answer falls back because the LLM timed out or failed (such answers aren't memoized)
+        self._llm_fallback_state = threading.local()
         
         # More specific advisory patterns - only flag actual advice requests
         self.advisory_keywords = [
@@ -68,6 +834,36 @@ class RAGQALLM:
         # Riskometer data cache (scheme_name -> riskometer_level)
         self.riskometer_data = self._load_riskometer_data()
         
+        # Static answers built from the scheme list once (schemes don't change at runtime)
+        self._schemes_list = ", ".join(self.actual_schemes)
+        self._schemes_prompt_bullets = "\n".join(f"- {s}" for s in self.actual_schemes)
+        # (lowercased name, scheme_tag, is ELSS alias) per actual scheme for strict metric filtering
+        self._actual_scheme_tags = tuple(
+            (s_lower, _scheme_tag_from_name_lower(s_lower), any(kw in s_lower for kw in ELSS_NAME_KEYWORDS))
+            for s_lower in (s.lower() for s in self.actual_schemes)
+        )
+        # (name, lowercased name, case-insensitive name pattern) per actual scheme for wrong-fund replacement
+        self._actual_scheme_patterns = tuple(
+            (s, s.lower(), re.compile(re.escape(s), re.IGNORECASE)) for s in self.actual_schemes
+        )
+        self._fund_list_answer = (
+            "I have information about the following **4 HDFC mutual fund schemes**:\n\n"
+            + "\n".join(f"- **{scheme}**" for scheme in self.actual_schemes)
+            + "\n\nI can answer factual questions about **expense ratios**, **exit loads**, **fund managers**, **investment strategies**, "
+            "and other details for these schemes. I provide information only, not investment advice."
+        )
+        self._scheme_prompt_answer = (
+            "I can help you with that! However, I need to know which scheme you're asking about. "
+            f"I have information about these 4 HDFC schemes: {self._schemes_list}. "
+            "Please specify the scheme name in your question, for example: 'What is the exit load of HDFC Hybrid Equity Fund?'"
+        )
+        self._riskometer_all_answer = (
+            "The riskometer scores for the HDFC schemes I have information about are:\n\n"
+            + "\n".join(f"• {scheme}: {self.riskometer_data.get(scheme, 'Not available')}" for scheme in self.actual_schemes)
+            + "\n\nThe riskometer is a standardized risk measurement scale introduced by SEBI for mutual funds. "
+            "It classifies risk into six levels: Low, Low to Moderate, Moderate, Moderately High, High, and Very High."
+        )
+        
         # Chat context - track last mentioned scheme
         self.chat_context = {
             'last_scheme': None,  # Last scheme mentioned in conversation
@@ -77,46 +873,33 @@ class RAGQALLM:
         # Load source metadata for last_updated dates
         self.source_metadata = {}
         try:
-            with open("data_raw/sources_loaded.json", "r", encoding="utf-8") as f:
-                sources = json.load(f)
-                for source in sources:
-                    self.source_metadata[source['source_id']] = {
-                        'last_fetched_date': source.get('last_fetched_date', ''),
-                        'source_type': source.get('source_type', ''),
-                        'source_url': source.get('source_url', '')
-                    }
+            for source in _load_sources():
+                self.source_metadata[source['source_id']] = {
+                    'last_fetched_date': source.get('last_fetched_date', ''),
+                    'source_type': source.get('source_type', ''),
+                    'source_url': source.get('source_url', '')
+                }
         except Exception as e:
             import logging
             logging.getLogger(__name__).warning(f"Could not load source metadata: {e}")
     
     def _load_riskometer_data(self) -> Dict[str, str]:
         """Load riskometer data from overview pages"""
-        import re
         riskometer_data = {}
-        scheme_files = {
-            "HDFC Large Cap Fund": "data_processed/amc_largecap_overview.txt",
-            "HDFC Flexi Cap Fund": "data_processed/amc_flexicap_overview.txt",
-            "HDFC TaxSaver (ELSS)": "data_processed/amc_elss_overview.txt",
-            "HDFC Hybrid Equity Fund": "data_processed/amc_hybrid_overview.txt"
-        }
         
-        riskometer_levels = ["Very High", "Moderately High", "High", "Moderate", "Low to Moderate", "Low"]
-        
-        for scheme_name, file_path in scheme_files.items():
+        for scheme_name, file_path in SCHEME_OVERVIEW_FILES.items():
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    text = f.read()
+                text = _read_overview_text(file_path)
                 
                 # Look for "Riskometer" followed by a risk level
-                pattern = r"Riskometer\s*[:\n]?\s*([^\n]+)"
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = RISKOMETER_LINE_RE.search(text)
                 
                 if match:
-                    risk_text = match.group(1).strip()
+                    risk_text_lower = match.group(1).strip().lower()
                     # Check which level it matches
                     found_level = None
-                    for level in riskometer_levels:
-                        if level.lower() in risk_text.lower():
+                    for level, level_lower in RISKOMETER_LEVELS:
+                        if level_lower in risk_text_lower:
                             found_level = level
                             break
                     
@@ -130,9 +913,7 @@ class RAGQALLM:
     def _load_actual_schemes(self) -> List[str]:
         """Load actual schemes from sources to prevent hallucination"""
         try:
-            import json
-            with open("data_raw/sources_loaded.json", "r", encoding="utf-8") as f:
-                sources = json.load(f)
+            sources = _load_sources()
             
             schemes = set()
             scheme_name_map = {
@@ -185,6 +966,36 @@ class RAGQALLM:
         except Exception as e:
             print(f"⚠️  Gemini initialization failed: {e}")
     
+    def _get_retriever(self):
+        """Return the shared retriever, creating it on first use"""
+        if self._retriever is None:
+            from rag_retriever import RAGRetriever
+            self._retriever = RAGRetriever()
+        return self._retriever
+    
+    def _ensure_chunks(self, chunks: List[Dict], retry_query: str, min_k: int = 5, top_k: int = 20) -> List[Dict]:
+        """Return chunks as-is if there are enough, else re-retrieve with retry_query (keeping chunks if that finds nothing)"""
+        if chunks and len(chunks) >= min_k:
+            return chunks
+        retry_chunks = self._get_retriever().retrieve(retry_query, top_k=top_k)
+        return retry_chunks or chunks
+    
+    def _get_boost_keywords(self, query_type: str, is_manager_query: bool, is_redemption_query: bool) -> tuple:
+        """Return (distinct lowercase boost keywords, per-keyword weights), built once per combination"""
+        cache_key = (query_type, is_manager_query, is_redemption_query)
+        cached = self._boost_keyword_cache.get(cache_key)
+        if cached is None:
+            boost_keywords = list(self.query_classifier.get_keywords_for_type(query_type))
+            if is_manager_query:
+                boost_keywords.extend(MANAGER_BOOST_KEYWORDS)
+            if is_redemption_query:
+                boost_keywords.extend(REDEMPTION_BOOST_KEYWORDS)
+            # Duplicates counted twice before, so keep their multiplicity as a weight
+            keyword_counts = Counter(kw.lower() for kw in boost_keywords)
+            cached = (tuple(keyword_counts), np.fromiter(keyword_counts.values(), dtype=np.int64, count=len(keyword_counts)))
+            self._boost_keyword_cache[cache_key] = cached
+        return cached
+    
     def is_advisory_question(self, query: str) -> bool:
         """Check if query asks for investment advice (improved detection)"""
         query_lower = query.lower()
@@ -338,7 +1149,6 @@ CLEANED ANSWER (using ONLY information from the answer above):"""
         """Format answer with citation and timestamp (preserves markdown)"""
         # If answer is empty, return early with just timestamp
         if not answer or not answer.strip():
-            from datetime import datetime
             today = datetime.now()
             formatted_date = today.strftime(OUTPUT_DATE_FORMAT)
             return f"Last updated from sources: {formatted_date}."
@@ -372,7 +1182,6 @@ CLEANED ANSWER (using ONLY information from the answer above):"""
         #     answer += f"\n\n[Source]({source_url})"
         
         # Add timestamp with proper format (from constants)
-        from datetime import datetime
         today = datetime.now()
         formatted_date = today.strftime(OUTPUT_DATE_FORMAT)
         
@@ -387,25 +1196,11 @@ CLEANED ANSWER (using ONLY information from the answer above):"""
     def _format_date(self, date_str: str) -> str:
         """Format date string to 'DD MMM, YYYY' format (e.g., '17 Nov, 2025')"""
         if not date_str or date_str == '.' or date_str.strip() == '':
-            from datetime import datetime
             return datetime.now().strftime(OUTPUT_DATE_FORMAT)
         
-        try:
-            from datetime import datetime
-            
-            # Try different date formats (from constants)
-            for fmt in DATE_FORMATS:
-                try:
-                    dt = datetime.strptime(date_str.strip(), fmt)
-                    return dt.strftime(OUTPUT_DATE_FORMAT)
-                except ValueError:
-                    continue
-            
-            # If no format matches, return current date
-            return datetime.now().strftime(OUTPUT_DATE_FORMAT)
-        except Exception:
-            from datetime import datetime
-            return datetime.now().strftime(OUTPUT_DATE_FORMAT)
+        # Parsed dates are memoized; unparseable ones fall back to the current date (not cached)
+        formatted = _parse_source_date(date_str.strip())
+        return formatted or datetime.now().strftime(OUTPUT_DATE_FORMAT)
     
     def _get_cache_key(self, query: str, context: str) -> str:
         """Generate cache key from query and context (first 500 chars)"""
@@ -466,13 +1261,14 @@ Answer (using ONLY the context above):"""
             return response.choices[0].message.content.strip()
         except Exception as e:
             print(f"OpenAI error: {e}")
+            self._mark_llm_fallback()
             return self._extract_answer_from_context(query, context)
     
     def _get_prompt_for_query_type(self, query: str, query_type: str, context: str) -> str:
         """Get specialized prompt based on query type with examples"""
         
-        # Get actual schemes list for this query type
-        schemes_list = ", ".join(self.actual_schemes)
+        # Get actual schemes list for this query type (prebuilt at init)
+        schemes_list = self._schemes_list
         
         base_instructions = f"""You are a FACTS-ONLY assistant for mutual fund information. Provide CLEAN answers from the context.
 
@@ -506,7 +1302,7 @@ Answer (using ONLY the context above):"""
    - Clean, readable structure
 
 AVAILABLE SCHEMES (ONLY these 4):
-{chr(10).join(f"- {s}" for s in self.actual_schemes)}
+{self._schemes_prompt_bullets}
 
 If asked "what funds do you have information about" or similar, ONLY list the schemes above."""
         
@@ -605,7 +1401,7 @@ IMPORTANT FOR GENERAL QUERIES:
         # For queries about available funds, add explicit scheme list to context
         query_lower = query.lower()
         if any(phrase in query_lower for phrase in ["what funds", "which funds", "what schemes", "which schemes", "have information about", "available"]):
-            schemes_context = f"\n\nIMPORTANT: I only have information about these 4 HDFC schemes: {', '.join(self.actual_schemes)}. Do NOT mention any other funds."
+            schemes_context = f"\n\nIMPORTANT: I only have information about these 4 HDFC schemes: {self._schemes_list}. Do NOT mention any other funds."
         else:
             schemes_context = ""
         
@@ -626,7 +1422,7 @@ IMPORTANT FOR GENERAL QUERIES:
         # Add specific instruction for strategy queries
         strategy_instruction = ""
         scheme_name, _ = self._extract_scheme_from_query(query)
-        if any(phrase in query.lower() for phrase in ['investment strategy', 'strategy', 'investment approach']) and scheme_name:
+        if any(phrase in query_lower for phrase in ['investment strategy', 'strategy', 'investment approach']) and scheme_name:
             strategy_instruction = f"\n\nIMPORTANT: The question is about **{scheme_name}**. Make sure your answer is specifically about this fund, not other funds. Extract the investment strategy, asset allocation, and investment approach for {scheme_name} only."
         
         return f"""{base_instructions}
@@ -669,8 +1465,38 @@ Answer (from context only, filter metadata, factual, COMPLETE - ensure full sent
                 
         except Exception as e:
             print(f"Gemini error: {e}")
+            self._mark_llm_fallback()
             return self._extract_answer_from_context(query, context)
     
+    def _rephrase_metric_answer_bounded(self, query: str, extracted_fact: str, context: str, scheme_name: Optional[str] = None) -> str:
+        """Run _rephrase_metric_answer in the background and fall back to the extracted fact if it is slow"""
+        if not self.llm:
+            # No LLM round-trip to wait on
+            return self._rephrase_metric_answer(query, extracted_fact, context, scheme_name)
+        
+        future = _REPHRASE_EXECUTOR.submit(self._rephrase_metric_answer_tracked, query, extracted_fact, context, scheme_name)
+        try:
+            rephrased, llm_failed = future.result(timeout=METRIC_REPHRASE_TIMEOUT)
+        except FuturesTimeoutError:
+            import logging
+            logging.getLogger(__name__).warning(f"Metric rephrasing exceeded {METRIC_REPHRASE_TIMEOUT}s, using extracted fact")
+            self._mark_llm_fallback()
+            return extracted_fact
+        if llm_failed:
+            # The worker thread's fallback flag doesn't reach this thread, so carry it over
+            self._mark_llm_fallback()
+        return rephrased
+    
+    def _rephrase_metric_answer_tracked(self, query: str, extracted_fact: str, context: str, scheme_name: Optional[str] = None) -> Tuple[str, bool]:
+        """Run _rephrase_metric_answer on a worker thread and report whether it fell back after an LLM failure"""
+        self._llm_fallback_state.used = False
+        rephrased = self._rephrase_metric_answer(query, extracted_fact, context, scheme_name)
+        return rephrased, self._llm_fallback_state.used
+    
+    def _mark_llm_fallback(self):
+        """Record that the answer being built used a fallback because the LLM timed out or failed"""
+        self._llm_fallback_state.used = True
+    
     def _rephrase_metric_answer(self, query: str, extracted_fact: str, context: str, scheme_name: Optional[str] = None) -> str:
         """Rephrase extracted metric answer naturally using LLM while preserving accuracy"""
         if not self.llm:
@@ -720,6 +1546,7 @@ Rephrased answer (keep it concise and natural):"""
                         else:
                             # LLM changed the value, return original
                             return extracted_fact
+                self._mark_llm_fallback()
                 return extracted_fact
             elif self.llm == "openai":
                 response = self.openai_client.chat.completions.create(
@@ -741,6 +1568,7 @@ Rephrased answer (keep it concise and natural):"""
         except Exception as e:
             print(f"Rephrasing error: {e}")
             # On error, return original fact
+            self._mark_llm_fallback()
             return extracted_fact
     
     def _extract_answer_from_context(self, query: str, context: str) -> str:
@@ -1037,7 +1865,7 @@ Respond in JSON:
         
         if query_understanding.get('intent') == 'off_topic':
             return {
-                'answer': "I only provide information about HDFC Mutual Funds. I don't have information about that topic. Please ask me about HDFC schemes, expense ratios, exit loads, fund managers, or other mutual fund-related questions.",
+                'answer': UNRELATED_TOPIC_ANSWER,
                 'source_url': None,
                 'refused': True,
                 'query_type': 'general'
@@ -1089,7 +1917,7 @@ Respond in JSON:
         
         if is_unrelated and not is_about_mf:
             return {
-                'answer': "I only provide information about HDFC Mutual Funds. I don't have information about that topic. Please ask me about HDFC schemes, expense ratios, exit loads, fund managers, or other mutual fund-related questions.",
+                'answer': UNRELATED_TOPIC_ANSWER,
                 'source_url': None,
                 'refused': True,
                 'query_type': 'general'
@@ -1113,14 +1941,15 @@ Respond in JSON:
         questions = self._split_multiple_questions(query)
         if len(questions) > 1:
             # Handle multiple questions - retrieve chunks for each question separately
-            from rag_retriever import RAGRetriever
-            retriever = RAGRetriever()
+            retriever = self._get_retriever()
+            
+            # Retrieve for all questions together: batched FAISS searches, with re-ranking still run concurrently
+            per_question_chunks = retriever.retrieve_batch(questions, top_k=5)
             
             answers = []
             all_source_urls = []
-            for q in questions:
-                # Retrieve chunks specific to this question
-                q_chunks = retriever.retrieve(q, top_k=5)
+            for q, q_chunks in zip(questions, per_question_chunks):
+                # Chunks specific to this question were retrieved above
                 q_result = self._generate_single_answer(q, q_chunks)
                 if q_result and not q_result.get('refused', False):
                     # Remove the date/source from individual answers to avoid duplication
@@ -1162,47 +1991,50 @@ Respond in JSON:
     
     def _extract_scheme_from_query(self, query: str) -> tuple:
         """Extract scheme name and tag from query"""
-        query_lower = query.lower()
-        
-        # Map scheme keywords to scheme names and tags
-        scheme_keywords = {
-            "large cap": ("HDFC Large Cap Fund", "LARGE_CAP"),
-            "flexi cap": ("HDFC Flexi Cap Fund", "FLEXI_CAP"),
-            "flexicap": ("HDFC Flexi Cap Fund", "FLEXI_CAP"),
-            "elss": ("HDFC TaxSaver (ELSS)", "ELSS"),
-            "taxsaver": ("HDFC TaxSaver (ELSS)", "ELSS"),
-            "tax saver": ("HDFC TaxSaver (ELSS)", "ELSS"),
-            "hybrid": ("HDFC Hybrid Equity Fund", "HYBRID"),
-            "hybrid equity": ("HDFC Hybrid Equity Fund", "HYBRID"),
-        }
-        
-        for keyword, (scheme_name, scheme_tag) in scheme_keywords.items():
-            if keyword in query_lower:
-                return scheme_name, scheme_tag
-        
-        return None, None
+        return _scheme_from_query_lower(query.lower())
     
     def _generate_single_answer(self, query: str, chunks: List[Dict]) -> Dict:
-        """Generate answer for a single question"""
+        """Generate answer for a single question (memoized for repeated queries over the same chunks)"""
+        context_before = (self.chat_context['last_scheme'], self.chat_context['last_scheme_tag'])
+        cache_key = (
+            query,
+            tuple((chunk.get('source_id'), chunk.get('text')) for chunk in chunks or ()),
+            context_before,
+            datetime.now().strftime(OUTPUT_DATE_FORMAT),  # Answers embed today's date
+        )
+        cached = self._answer_cache.get(cache_key)
+        if cached is not None:
+            result, context_after = cached
+            # Replay the chat context update the original call made
+            self.chat_context['last_scheme'], self.chat_context['last_scheme_tag'] = context_after
+            return dict(result)
+        
+        fallback_state = self._llm_fallback_state
+        outer_fallback = getattr(fallback_state, 'used', False)
+        fallback_state.used = False
+        result = self._build_single_answer(query, chunks)
+        llm_fallback = fallback_state.used
+        fallback_state.used = outer_fallback or llm_fallback
+        
+        # Conflicting-source answers are not cached so conflict reporting stays per call, and answers
+        # built after an LLM timeout/failure are not cached so the next call can get the full answer
+        if result and not result.get('conflict_detected') and not llm_fallback:
+            if len(self._answer_cache) >= self.cache_max_size:
+                # Remove oldest (simple FIFO, same policy as response_cache)
+                del self._answer_cache[next(iter(self._answer_cache))]
+            context_after = (self.chat_context['last_scheme'], self.chat_context['last_scheme_tag'])
+            self._answer_cache[cache_key] = (dict(result), context_after)
+        return result
+    
+    def _build_single_answer(self, query: str, chunks: List[Dict]) -> Dict:
+        """Build the answer for a single question"""
         query_lower = query.lower()
         refused = False
         
         # FIRST: Handle riskometer definition queries (before any other checks)
         if any(phrase in query_lower for phrase in ["what is riskometer", "definition of riskometer", "what exactly is the definition of riskometer", "what is the riskometer"]):
-            definition_answer = (
-                "The **Riskometer** is a standardized risk measurement scale introduced by **SEBI (Securities and Exchange Board of India)** for mutual funds. "
-                "It helps investors understand the risk level associated with a mutual fund scheme.\n\n"
-                "The Riskometer classifies risk into **six levels**:\n\n"
-                "1. **Low** - Lowest risk\n"
-                "2. **Low to Moderate** - Slightly higher than low risk\n"
-                "3. **Moderate** - Medium risk\n"
-                "4. **Moderately High** - Higher than moderate risk\n"
-                "5. **High** - High risk\n"
-                "6. **Very High** - Highest risk\n\n"
-                "The Riskometer is displayed on all mutual fund documents (SID, KIM, Factsheet) to help investors make informed decisions based on their risk tolerance."
-            )
             return {
-                'answer': definition_answer,
+                'answer': RISKOMETER_DEFINITION_ANSWER,
                 'source_url': "https://www.amfiindia.com/",
                 'refused': False,
                 'query_type': 'general'
@@ -1251,7 +2083,7 @@ Respond in JSON:
         
         if is_unrelated and not is_about_mf:
             return {
-                'answer': "I only provide information about HDFC Mutual Funds. I don't have information about that topic. Please ask me about HDFC schemes, expense ratios, exit loads, fund managers, or other mutual fund-related questions.",
+                'answer': UNRELATED_TOPIC_ANSWER,
                 'source_url': None,
                 'refused': True,
                 'query_type': 'general'
@@ -1265,9 +2097,6 @@ Respond in JSON:
             self.chat_context['last_scheme'] = scheme_name
             self.chat_context['last_scheme_tag'] = scheme_tag
         
-        # Check for special query types first (before context handling)
-        query_lower = query.lower()
-        
         # If no scheme mentioned but we have context, use it (only for metric/entity queries)
         if not scheme_name and self.chat_context['last_scheme']:
             # Check if query is asking about a metric/entity without specifying scheme
@@ -1277,8 +2106,7 @@ Respond in JSON:
                 scheme_name = self.chat_context['last_scheme']
                 scheme_tag = self.chat_context['last_scheme_tag']
                 # Re-retrieve chunks with scheme context for better results
-                from rag_retriever import RAGRetriever
-                retriever = RAGRetriever()
+                retriever = self._get_retriever()
                 enhanced_query = f"{scheme_name} {query}"
                 chunks = retriever.retrieve(enhanced_query, top_k=5)
                 query_lower = enhanced_query.lower()
@@ -1288,13 +2116,8 @@ Respond in JSON:
             # No scheme mentioned and no context - for metric/entity queries, ask user to specify
             query_type = self.query_classifier.classify(query)
             if query_type in ['metric', 'entity']:
-                schemes_list = ", ".join(self.actual_schemes)
                 return {
-                    'answer': (
-                        f"I can help you with that! However, I need to know which scheme you're asking about. "
-                        f"I have information about these 4 HDFC schemes: {schemes_list}. "
-                        f"Please specify the scheme name in your question, for example: 'What is the exit load of HDFC Hybrid Equity Fund?'"
-                    ),
+                    'answer': self._scheme_prompt_answer,
                     'source_url': "https://www.hdfcfund.com/",
                     'refused': False,
                     'query_type': query_type
@@ -1302,20 +2125,8 @@ Respond in JSON:
         
         # Special handling for riskometer definition queries FIRST (before other checks)
         if any(phrase in query_lower for phrase in ["what is riskometer", "definition of riskometer", "what exactly is the definition of riskometer", "what is the riskometer"]):
-            definition_answer = (
-                "The **Riskometer** is a standardized risk measurement scale introduced by **SEBI (Securities and Exchange Board of India)** for mutual funds. "
-                "It helps investors understand the risk level associated with a mutual fund scheme.\n\n"
-                "The Riskometer classifies risk into **six levels**:\n\n"
-                "1. **Low** - Lowest risk\n"
-                "2. **Low to Moderate** - Slightly higher than low risk\n"
-                "3. **Moderate** - Medium risk\n"
-                "4. **Moderately High** - Higher than moderate risk\n"
-                "5. **High** - High risk\n"
-                "6. **Very High** - Highest risk\n\n"
-                "The Riskometer is displayed on all mutual fund documents (SID, KIM, Factsheet) to help investors make informed decisions based on their risk tolerance."
-            )
             return {
-                'answer': definition_answer,
+                'answer': RISKOMETER_DEFINITION_ANSWER,
                 'source_url': "https://www.amfiindia.com/",
                 'refused': False,
                 'query_type': 'general'
@@ -1329,16 +2140,8 @@ Respond in JSON:
         ]
         if any(phrase in query_lower for phrase in riskometer_patterns) and "all" in query_lower:
             if self.riskometer_data:
-                riskometer_list = []
-                for scheme in self.actual_schemes:
-                    risk_level = self.riskometer_data.get(scheme, "Not available")
-                    riskometer_list.append(f"• {scheme}: {risk_level}")
-                
-                answer = "The riskometer scores for the HDFC schemes I have information about are:\n\n" + "\n".join(riskometer_list)
-                answer += "\n\nThe riskometer is a standardized risk measurement scale introduced by SEBI for mutual funds. It classifies risk into six levels: Low, Low to Moderate, Moderate, Moderately High, High, and Very High."
-                
                 return {
-                    'answer': answer,
+                    'answer': self._riskometer_all_answer,
                     'source_url': "https://www.hdfcfund.com/",
                     'refused': False,
                     'query_type': 'list'
@@ -1354,16 +2157,10 @@ Respond in JSON:
             "what funds do you", "which funds do you", "tell me about funds"
         ]
         if any(phrase in query_lower for phrase in fund_list_patterns):
-            schemes_list = ", ".join(self.actual_schemes)
             # Don't set context for "list all funds" queries - user hasn't selected a specific fund yet
             # Context will be set when user mentions a specific scheme
             return {
-                'answer': (
-                    f"I have information about the following **4 HDFC mutual fund schemes**:\n\n"
-                    + "\n".join([f"- **{scheme}**" for scheme in self.actual_schemes])
-                    + "\n\nI can answer factual questions about **expense ratios**, **exit loads**, **fund managers**, **investment strategies**, "
-                    "and other details for these schemes. I provide information only, not investment advice."
-                ),
+                'answer': self._fund_list_answer,
                 'source_url': "https://www.hdfcfund.com/",
                 'refused': False,
                 'query_type': 'general'
@@ -1373,10 +2170,8 @@ Respond in JSON:
         if self.is_advisory_question(query):
             refused = True
             # Use strict refusal template
-            refusal_answer = "Answer: I cannot provide investment advice. I can only provide factual information from documents. Consult a registered financial advisor.\n"
-            refusal_answer += "Can help with: expense ratio, exit load, lock-in period, benchmark, riskometer, minimum SIP amount."
             return {
-                'answer': refusal_answer,
+                'answer': ADVISORY_REFUSAL_ANSWER,
                 'source_url': None,  # No source for refused answers
                 'refused': True
             }
@@ -1388,82 +2183,26 @@ Respond in JSON:
         query_lower = query.lower()
         is_riskometer_query = any(phrase in query_lower for phrase in ['riskometer', 'risk-o-meter', 'risk meter', 'risk level', 'what is riskometer', 'definition of riskometer'])
         
-        if is_riskometer_query and (not chunks or len(chunks) < 5):
-            # Single retry with riskometer-specific query
-            from rag_retriever import RAGRetriever
-            retriever = RAGRetriever()
-            riskometer_chunks = retriever.retrieve('riskometer HDFC', top_k=20)
-            if riskometer_chunks:
-                chunks = riskometer_chunks
+        if is_riskometer_query:
+            # Single retry with riskometer-specific query if too few chunks
+            chunks = self._ensure_chunks(chunks, 'riskometer HDFC')
         
         if not chunks:
             # For metric queries, try direct lookup from file FIRST (fastest, most reliable)
             if query_type == 'metric':
                 # Extract scheme and field from query
-                query_lower = query.lower()
                 scheme_name, scheme_tag = self._extract_scheme_from_query(query)
                 field = self._identify_field_from_query(query)
                 
                 if field:
-                    # Try direct lookup from chunks_clean.jsonl
-                    direct_chunk = self._get_direct_chunk_from_file(field, scheme_name)
-                    if direct_chunk:
-                        chunk_text = direct_chunk.get('chunk_text', '')
-                        value_match = re.search(r':\s*([^.]*?)(?:\.|Source)', chunk_text, re.IGNORECASE)
-                        if value_match:
-                            value = value_match.group(1).strip()
-                            value = re.sub(r'\s+', ' ', value).strip()
-                            
-                            # Format answer - clean and beautiful
-                            field_display = field.replace('_', ' ').title()
-                            if field == 'exit_load':
-                                field_display = "Exit Load"
-                            elif field == 'expense_ratio':
-                                field_display = "Total Expense Ratio (TER)"
-                            elif field == 'minimum_sip':
-                                field_display = "Minimum SIP"
-                            elif field == 'lock_in':
-                                field_display = "Lock-in Period"
-                            elif field == 'benchmark':
-                                field_display = "Benchmark"
-                            elif field == 'riskometer':
-                                field_display = "Riskometer"
-                            
-                            scheme_name_used = scheme_name or direct_chunk.get('scheme_tag', '').replace('_', ' ')
-                            if scheme_name_used:
-                                answer = f"The {field_display.lower()} for {scheme_name_used} is {value}."
-                            else:
-                                answer = f"The {field_display.lower()} is {value}."
-                            
-                            # Format date
-                            last_updated = direct_chunk.get('last_fetched_date', '2025-11-17')
-                            formatted_date = self._format_date(last_updated)
-                            
-                            formatted_answer = answer
-                            if formatted_date:
-                                formatted_answer += f"\n\nLast updated: {formatted_date}"
-                            
-                            source_type = direct_chunk.get('source_type', '')
-                            return {
-                                'answer': formatted_answer,
-                                'source_type': source_type,
-                                'source_id': direct_chunk.get('source_id', ''),
-                                'source_url': direct_chunk.get('source_url', ''),
-                                'refused': False,
-                                'query_type': query_type
-                            }
+                    # Try direct lookup from chunks_clean.jsonl (answer memoized per field/scheme)
+                    direct_answer = self._direct_metric_answer(field, scheme_name)
+                    if direct_answer:
+                        return dict(direct_answer)
                 
                 # Phase 1: Simplified - just retrieve more chunks if needed (no complex retries)
-                if not chunks or len(chunks) < 5:
-                    from rag_retriever import RAGRetriever
-                    retriever = RAGRetriever()
-                    # Single retry with enhanced query
-                    enhanced_query = query
-                    if scheme_name:
-                        enhanced_query = f"{scheme_name} {query}"
-                    retry_chunks = retriever.retrieve(enhanced_query, top_k=20)
-                    if retry_chunks:
-                        chunks = retry_chunks
+                # Single retry with scheme-enhanced query
+                chunks = self._ensure_chunks(chunks, f"{scheme_name} {query}" if scheme_name else query)
                 
                 # If still no chunks after retry
                 if not chunks:
@@ -1475,7 +2214,7 @@ Respond in JSON:
                     }
             else:
                 # For non-metric queries, use generic suggestions
-                schemes_list = ", ".join(self.actual_schemes)
+                schemes_list = self._schemes_list
                 
                 suggestions = {
                     'entity': f"I have information about these 4 HDFC schemes: {schemes_list}. Try asking: 'Who is the fund manager of [scheme name]?' or 'Who manages [scheme name]?'",
@@ -1494,31 +2233,15 @@ Respond in JSON:
                 }
         
         # Check for special query types first (query_type already classified above at line 654)
-        query_lower = query.lower()
-        
-        # Comparison queries (SID vs KIM, SID vs factsheet)
-        if 'compare' in query_lower or ('sid' in query_lower and ('kim' in query_lower or 'factsheet' in query_lower)):
-            comparison_result = self._handle_comparison_query(query, chunks, scheme_name)
-            if comparison_result:
-                return comparison_result
-        
-        # Contradiction detection queries
-        if 'contradict' in query_lower or 'contradiction' in query_lower:
-            contradiction_result = self._handle_contradiction_query(query, chunks, scheme_name)
-            if contradiction_result:
-                return contradiction_result
-        
-        # Canonical facts queries
-        if 'canonical' in query_lower or 'facts row' in query_lower:
-            canonical_result = self._handle_canonical_facts_query(query, chunks, scheme_name)
-            if canonical_result:
-                return canonical_result
-        
-        # Business rule queries (can I redeem, etc.)
-        if any(phrase in query_lower for phrase in ['can i redeem', 'can redeem', 'if i redeem', 'redeem after']):
-            business_result = self._handle_business_rule_query(query, chunks, scheme_name)
-            if business_result:
-                return business_result
+        # Special query handlers: detect all trigger categories in one pass, then dispatch by priority
+        special_categories = {m.lastgroup for m in SPECIAL_QUERY_PATTERN.finditer(query_lower)}
+        if 'sid' in query_lower and ('kim' in query_lower or 'factsheet' in query_lower):
+            special_categories.add('comparison')  # SID vs KIM, SID vs factsheet
+        for category in SPECIAL_QUERY_PRIORITY:
+            if category in special_categories:
+                special_result = self._special_query_handlers[category](query, chunks, scheme_name)
+                if special_result:
+                    return special_result
         
         # For metric queries, try strict extraction first
         if query_type == 'metric':
@@ -1527,30 +2250,31 @@ Respond in JSON:
                 # Extract the fact from strict extraction
                 answer_text = strict_result['answer']
                 
-                # Format date properly (convert "11/17/2025" or "2025-11-17" to "17 Nov, 2025")
-                last_updated = strict_result.get('last_updated', '')
-                formatted_date = self._format_date(last_updated)
-                
                 # Check if answer is valid (not "0" or empty)
-                if answer_text and answer_text.strip() and answer_text.strip() != "0" and answer_text.strip() != "0%":
+                if answer_text and answer_text.strip() not in ('', '0', '0%'):
+                    # Format date properly (convert "11/17/2025" or "2025-11-17" to "17 Nov, 2025")
+                    last_updated = strict_result.get('last_updated', '')
+                    formatted_date = self._format_date(last_updated)
+                    
                     # Instead of returning immediately, pass to LLM for beautiful rephrasing
                     # Build context with the extracted fact and original context
                     extracted_fact = answer_text
                     source_url = strict_result['source_url']
                     confidence = strict_result['confidence']
                     
-                    # Build simple context from chunks for LLM rephrasing
-                    context_parts_simple = []
-                    for chunk in chunks[:5]:  # Use top 5 chunks for context
-                        chunk_text = chunk.get('text', '')
-                        if chunk_text:
-                            cleaned = self._clean_chunk_text(chunk_text, query_type)
-                            if cleaned:
-                                context_parts_simple.append(cleaned[:300])  # Limit each chunk
-                    context_for_rephrase = " ".join(context_parts_simple)[:1500] if context_parts_simple else ""
+                    # Build simple context from chunks for LLM rephrasing (top 5 chunks, 300 chars each, 1500 total)
+                    # Chunks are cleaned lazily, so cleaning stops once the budget is filled; without an LLM
+                    # the extracted fact is already the final wording, so no context is needed
+                    context_for_rephrase = ''
+                    if self.llm:
+                        cleaned_chunks = (
+                            self._clean_chunk_text(chunk.get('text', ''), query_type)
+                            for chunk in chunks[:5] if chunk.get('text', '')
+                        )
+                        context_for_rephrase = _bounded_join((cleaned[:300] for cleaned in cleaned_chunks if cleaned), " ", 1500)
                     
-                    # Rephrase using LLM to make it natural and beautiful
-                    rephrased_answer = self._rephrase_metric_answer(query, extracted_fact, context_for_rephrase, scheme_name)
+                    # Rephrase using LLM to make it natural and beautiful (bounded wait, see METRIC_REPHRASE_TIMEOUT)
+                    rephrased_answer = self._rephrase_metric_answer_bounded(query, extracted_fact, context_for_rephrase, scheme_name)
                     
                     # If LLM rephrasing failed or returned empty, use formatted version
                     if not rephrased_answer or len(rephrased_answer.strip()) < 10:
@@ -1596,7 +2320,6 @@ Respond in JSON:
                     'query_type': query_type,
                     'confidence': 'LOW'
                 }
-        query_lower = query.lower()
         
         # Extract key terms from query
         query_terms = set(query_lower.split())
@@ -1612,63 +2335,58 @@ Respond in JSON:
         if any(phrase in query_lower for phrase in ['redeem', 'redemption', 'withdraw', 'sell units']):
             query_terms.update(['redeem', 'redemption', 'withdraw', 'sell', 'units', 'proceeds', 'credited', 'submit', 'request'])
         
-        # Get keywords to boost for this query type
-        boost_keywords = self.query_classifier.get_keywords_for_type(query_type)
-        
-        # For entity queries (fund manager), add manager-specific keywords
-        if query_type == 'entity' and ('manager' in query_lower or 'manages' in query_lower):
-            boost_keywords.extend(['fund manager', 'manager', 'investment manager', 'portfolio manager', 'equity analyst', 'manages', 'managed by', 'senior fund manager'])
+        # Keywords to boost for this query type (plus manager/redemption extras), deduplicated with weights
+        is_manager_query = query_type == 'entity' and ('manager' in query_lower or 'manages' in query_lower)
+        is_redemption_query = any(phrase in query_lower for phrase in ['redeem', 'redemption', 'withdraw', 'sell units'])
+        boost_keywords, boost_weights = self._get_boost_keywords(query_type, is_manager_query, is_redemption_query)
+        
+        # Enhanced multi-factor scoring (vectorized over all chunks)
+        n_chunks = len(chunks)
+        # Retriever chunks carry precomputed '_text_lower'/'_token_set'; compute only for other chunks
+        chunk_texts_lower = [_chunk_text_lower(chunk) for chunk in chunks]
+        chunk_token_sets = [
+            chunk.get('_token_set') or frozenset(text.split())
+            for chunk, text in zip(chunks, chunk_texts_lower)
+        ]
         
-        # For redemption queries, add redemption-specific keywords
-        if any(phrase in query_lower for phrase in ['redeem', 'redemption', 'withdraw', 'sell units']):
-            boost_keywords.extend(['redeem', 'redemption', 'withdraw', 'sell', 'units', 'proceeds', 'credited', 'submit', 'request', 'cut-off', 'cutoff', 'business day'])
+        # 1. Vector similarity (from retrieval)
+        relevance_scores = np.fromiter(
+            (chunk.get('relevance_score', chunk.get('similarity', 0.5)) for chunk in chunks),
+            dtype=np.float64, count=n_chunks
+        )
         
-        # Enhanced multi-factor scoring
-        scored_chunks = []
-        for chunk in chunks:
-            chunk_text_lower = chunk['text'].lower()
-            chunk_terms = set(chunk_text_lower.split())
-            
-            # 1. Vector similarity (from retrieval)
-            similarity = chunk.get('similarity', 0.5)
-            relevance_score = chunk.get('relevance_score', similarity)
-            
-            # 2. Term overlap with query
-            term_overlap = len(query_terms & chunk_terms)
-            term_score = min(term_overlap * 0.15, 0.3)  # Cap at 0.3
-            
-            # 3. Keyword matching (boost keywords for query type)
-            keyword_matches = sum(1 for kw in boost_keywords if kw.lower() in chunk_text_lower)
-            keyword_score = min(keyword_matches * 0.1, 0.2)  # Cap at 0.2
-            
-            # 4. Source authority (already in relevance_score, but boost SID/KIM)
-            source_boost = 0.0
-            if 'sid' in chunk['source_id'] or 'kim' in chunk['source_id']:
-                source_boost = 0.1
-            elif 'overview' in chunk['source_id'] and query_type == 'metric':
-                source_boost = 0.08  # Overview good for current metrics
-            
-            # 5. Position boost (prefer earlier chunks from same source)
-            position_boost = 0.0
-            # This would require chunk_index, but we'll skip for now
-            
-            # Combined score
-            final_score = (
-                relevance_score * 0.6 +  # Primary: retrieval relevance
-                term_score * 0.2 +        # Query term matching
-                keyword_score * 0.15 +   # Type-specific keywords
-                source_boost * 0.05      # Source authority
-            )
-            
-            scored_chunks.append({
-                'chunk': chunk,
-                'score': final_score,
-                'term_overlap': term_overlap,
-                'keyword_matches': keyword_matches
-            })
+        # 2. Term overlap with query
+        term_overlaps = np.fromiter(
+            (len(query_terms & token_set) for token_set in chunk_token_sets),
+            dtype=np.int64, count=n_chunks
+        )
         
-        # Sort by final score
-        scored_chunks.sort(key=lambda x: x['score'], reverse=True)
+        # 3. Keyword matching (boost keywords for query type)
+        # One scan per distinct keyword; weights restore the count of duplicated keywords
+        keyword_hits = np.array(
+            [[kw in text for kw in boost_keywords] for text in chunk_texts_lower],
+            dtype=np.int64
+        ).reshape(n_chunks, len(boost_keywords))
+        keyword_matches = keyword_hits @ boost_weights
+        
+        # 4. Source authority (already in relevance_score, but boost SID/KIM)
+        source_ids = [chunk['source_id'] for chunk in chunks]
+        is_sid_kim = np.fromiter(('sid' in sid or 'kim' in sid for sid in source_ids), dtype=bool, count=n_chunks)
+        is_overview = np.fromiter(('overview' in sid for sid in source_ids), dtype=bool, count=n_chunks)
+        overview_boost = 0.08 if query_type == 'metric' else 0.0  # Overview good for current metrics
+        source_boosts = np.where(is_sid_kim, 0.1, np.where(is_overview, overview_boost, 0.0))
+        
+        # Combined score, ranked best-first
+        final_scores, ranking = _score_kernel(relevance_scores, term_overlaps, keyword_matches, source_boosts)
+        scored_chunks = [
+            {
+                'chunk': chunks[i],
+                'score': float(final_scores[i]),
+                'term_overlap': int(term_overlaps[i]),
+                'keyword_matches': int(keyword_matches[i])
+            }
+            for i in ranking
+        ]
         
         # Build context from top relevant chunks (SIMPLIFIED - Phase 1 & 2 optimization)
         # Increased context size and simplified filtering - let LLM do the intelligent filtering
@@ -1711,20 +2429,11 @@ Respond in JSON:
         # Extract scheme name for redemption fallback
         scheme_name_for_redemption = None
         if is_redemption_query:
-            if 'flexi cap' in query_lower:
-                scheme_name_for_redemption = "HDFC Flexi Cap Fund"
-            elif 'large cap' in query_lower:
-                scheme_name_for_redemption = "HDFC Large Cap Fund"
-            elif 'elss' in query_lower or 'taxsaver' in query_lower:
-                scheme_name_for_redemption = "HDFC TaxSaver (ELSS)"
-            elif 'hybrid' in query_lower:
-                scheme_name_for_redemption = "HDFC Hybrid Equity Fund"
-            else:
-                scheme_name_for_redemption = "HDFC Large Cap Fund"  # Default
+            scheme_name_for_redemption = _scheme_name_from_query_lower(query_lower, "HDFC Large Cap Fund")
         
         if is_redemption_query and (not context.strip() or len(context.strip()) < 100):
             # Use fallback immediately for redemption queries with insufficient context
-            answer = f"To redeem your **{scheme_name_for_redemption}** units, follow these steps:\n\n1. **Log in** to your account on the AMC website or distributor platform (like Groww)\n2. Navigate to the **'Redeem'** or **'Withdraw'** section and select the fund\n3. Enter the number of units or amount you want to redeem\n4. **Submit** the redemption request **before 3 PM** on any business day\n5. The proceeds will be credited to your registered bank account within **3-5 business days**\n\n**Important:** Redemption requests submitted after 3 PM will be processed on the next business day."
+            answer = REDEMPTION_FALLBACK_ANSWERS[scheme_name_for_redemption]
         elif not context.strip():
             # If context is empty, for entity queries try direct lookup first (STEP 3)
             if query_type == 'entity' and ('manager' in query_lower or 'manages' in query_lower):
@@ -1747,18 +2456,17 @@ Respond in JSON:
                 # Enhance query to ensure correct fund
                 enhanced_query = f"{scheme_name} {query}"
                 # Re-retrieve chunks with enhanced query to get correct fund info
-                from rag_retriever import RAGRetriever
-                retriever = RAGRetriever()
+                retriever = self._get_retriever()
                 strategy_chunks = retriever.retrieve(enhanced_query, top_k=20)
                 if strategy_chunks:
-                    # Filter to ensure we get chunks for the correct fund
+                    # Filter to ensure we get chunks for the correct fund (prefer chunks that mention it)
+                    scheme_pattern = _scheme_keyword_pattern(scheme_name)
                     correct_chunks = []
-                    scheme_keywords = scheme_name.lower().split()
-                    for chunk in strategy_chunks:
-                        chunk_text = chunk.get('text', '').lower()
-                        # Prefer chunks that mention the correct fund
-                        if any(kw in chunk_text for kw in scheme_keywords if len(kw) > 3):
-                            correct_chunks.append(chunk)
+                    if scheme_pattern:
+                        correct_chunks = [
+                            chunk for chunk in strategy_chunks
+                            if scheme_pattern.search(_chunk_text_lower(chunk))
+                        ]
                     if correct_chunks:
                         chunks = correct_chunks[:15]  # Use filtered chunks
                         # Rebuild context with correct fund chunks
@@ -1771,20 +2479,21 @@ Respond in JSON:
             if query_type == 'entity' and ('manager' in query_lower or 'manages' in query_lower):
                 # Check if answer doesn't contain a manager name
                 has_manager_name = any(name in answer for name in ['Roshi', 'Jain', 'Dhruv', 'Muchhal', 'Fund Manager'])
-                if not has_manager_name or not answer or len(answer.strip()) < 20 or 'not found' in answer.lower() or 'don\'t have' in answer.lower() or 'couldn\'t find' in answer.lower():
+                answer_lower = answer.lower()
+                if not has_manager_name or not answer or len(answer.strip()) < 20 or any(phrase in answer_lower for phrase in ('not found', 'don\'t have', 'couldn\'t find')):
                     manager_info = self._direct_lookup_manager(query)
                     if manager_info:
                         answer = manager_info
             
         # If LLM returned empty answer, use fallback
         if (not answer or len(answer.strip()) < 10) and is_redemption_query:
-            answer = f"To redeem your **{scheme_name_for_redemption}** units, follow these steps:\n\n1. **Log in** to your account on the AMC website or distributor platform (like Groww)\n2. Navigate to the **'Redeem'** or **'Withdraw'** section and select the fund\n3. Enter the number of units or amount you want to redeem\n4. **Submit** the redemption request **before 3 PM** on any business day\n5. The proceeds will be credited to your registered bank account within **3-5 business days**\n\n**Important:** Redemption requests submitted after 3 PM will be processed on the next business day."
+            answer = REDEMPTION_FALLBACK_ANSWERS[scheme_name_for_redemption]
         
         # Special handling for investor queries - check if answer is about fund manager instead
-        query_lower = query.lower()
         if 'investor' in query_lower:
             # Check if answer incorrectly mentions fund manager
-            if 'manager' in answer.lower() and ('fund manager' in answer.lower() or 'The fund manager is' in answer):
+            answer_lower = answer.lower()
+            if 'manager' in answer_lower and ('fund manager' in answer_lower or 'The fund manager is' in answer):
                 # Answer is about fund manager, but query asked about investors - try to extract investor info
                 investor_extracted = self._extract_from_context_directly('entity', context, query)
                 if investor_extracted and 'investor' in investor_extracted.lower():
@@ -1827,64 +2536,36 @@ Respond in JSON:
         
         # Final cleanup pass - remove any remaining artifacts (VERY AGGRESSIVE)
         if answer:
-            # Remove chunk separators (all variations)
-            answer = re.sub(r'\s*---\s*', ' ', answer)
-            answer = re.sub(r'\s*---', ' ', answer)
-            answer = re.sub(r'---\s*', ' ', answer)
-            answer = re.sub(r'---', ' ', answer)
-            
-            # Remove document headers (case-insensitive, all variations)
-            answer = re.sub(r'SCHEME\s+INFORMATION\s+DOCUMENT\s+', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'SCHEME INFORMATION DOCUMENT\s+', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'SCHEME\s+INFORMATION\s+DOCUMENT', '', answer, flags=re.IGNORECASE)
-            
-            # Remove fund type labels (all variations)
-            answer = re.sub(r'\bHybrid\s+DIRECT\s+REGULAR\b\s*', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\bDIRECT\s+REGULAR\b\s*', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\bDIRECT REGULAR\b\s*', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'DIRECT REGULAR', '', answer, flags=re.IGNORECASE)
-            
-            # Remove incomplete sentences at the end
-            answer = re.sub(r'\s+whet\s*$', '.', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+if in doubt about\s*$', '.', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+Investors should consult.*?$', '.', answer, flags=re.IGNORECASE | re.DOTALL)
-            
-            # Fix "equityequity" -> "equity"
-            answer = re.sub(r'equityequity', 'equity', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'equity\s+equity', 'equity', answer, flags=re.IGNORECASE)
-            
-            # Remove "A HDFC" at start if it appears
-            answer = re.sub(r'^A\s+HDFC\s+', 'HDFC ', answer, flags=re.IGNORECASE)
+            # Skip the regex passes entirely when no artifact marker is present (the common case)
+            if _has_artifact_markers(answer):
+                # Remove chunk separators, document headers, fund type labels, then fix "equityequity"
+                answer = _remove_answer_artifacts(answer)
+                
+                # Remove incomplete sentences at the end
+                answer = TRUNCATED_TAIL_RE.sub('.', answer)
+                
+                # Remove "A HDFC" at start if it appears
+                answer = LEADING_A_HDFC_RE.sub('HDFC ', answer)
             
             # Clean up multiple spaces
-            answer = re.sub(r'\s+', ' ', answer)
-            answer = answer.strip()
+            answer = ' '.join(answer.split())
             
             # Ensure proper ending
-            if answer and not answer.rstrip()[-1] in '.!?':
+            if answer and not answer.endswith(('.', '!', '?')):
                 answer += "."
+        # Remember the cleaned text so the post-format pass can skip it if it comes back unchanged
+        cleaned_answer = answer
         
         # SPECIAL CHECK: For redemption queries, if answer contains exit load info instead of steps, use fallback
         if is_redemption_query:
             # Check if answer is about exit load instead of redemption steps
-            exit_load_indicators = [
-                'exit load', 'exit charge', 'payable if units are redeemed',
-                'redeemed/switched-out', 'within 1 year', 'after 1 year',
-                'date of allotment', 'no exit load is payable'
-            ]
-            has_exit_load_info = any(indicator in answer.lower() for indicator in exit_load_indicators)
-            has_redemption_steps = any(phrase in answer.lower() for phrase in [
-                'log in', 'navigate to', 'redeem section', 'submit', 'before 3 pm',
-                'credited to your bank', '3-5 business days', 'follow these steps',
-                'withdraw section', 'enter the number', 'redemption request', 'proceeds will be credited'
-            ])
+            # (lowercase once; each phrase set is a single precompiled alternation scan)
+            answer_lower = answer.lower()
+            has_exit_load_info = EXIT_LOAD_INDICATOR_RE.search(answer_lower) is not None
+            has_redemption_steps = REDEMPTION_STEPS_RE.search(answer_lower) is not None
             
             # Also check for poor quality answers (mixed topics, incomplete, or just mentions "can be redeemed")
-            has_poor_quality = any(phrase in answer.lower() for phrase in [
-                'can be redeemedswitched', 'can be redeemed/switched', 'nav based',
-                'can invest in sip', 'lump sum', 'minimum application amount',
-                'can be redeemedswitched out', 'redeemedswitched out', 'business day at nav'
-            ])
+            has_poor_quality = POOR_REDEMPTION_ANSWER_RE.search(answer_lower) is not None
             
             # Check if answer is too short or doesn't have proper structure
             is_too_short = len(answer.strip()) < 100
@@ -1893,16 +2574,8 @@ Respond in JSON:
             # If answer has exit load but no redemption steps, OR has poor quality, OR is too short without structure, replace with proper fallback
             if (has_exit_load_info and not has_redemption_steps) or (has_poor_quality and not has_redemption_steps) or (is_too_short and not has_proper_structure and not has_redemption_steps):
                 # Extract scheme name for fallback
-                scheme_name_fallback = "HDFC Large Cap Fund"  # Default
-                if 'flexi cap' in query_lower:
-                    scheme_name_fallback = "HDFC Flexi Cap Fund"
-                elif 'large cap' in query_lower:
-                    scheme_name_fallback = "HDFC Large Cap Fund"
-                elif 'elss' in query_lower or 'taxsaver' in query_lower:
-                    scheme_name_fallback = "HDFC TaxSaver (ELSS)"
-                elif 'hybrid' in query_lower:
-                    scheme_name_fallback = "HDFC Hybrid Equity Fund"
-                answer = f"To redeem your **{scheme_name_fallback}** units, follow these steps:\n\n1. **Log in** to your account on the AMC website or distributor platform (like Groww)\n2. Navigate to the **'Redeem'** or **'Withdraw'** section and select the fund\n3. Enter the number of units or amount you want to redeem\n4. **Submit** the redemption request **before 3 PM** on any business day\n5. The proceeds will be credited to your registered bank account within **3-5 business days**\n\n**Important:** Redemption requests submitted after 3 PM will be processed on the next business day."
+                scheme_name_fallback = _scheme_name_from_query_lower(query_lower, "HDFC Large Cap Fund")
+                answer = REDEMPTION_FALLBACK_ANSWERS[scheme_name_fallback]
         
         # If answer was cleared and we have a redemption fallback, restore it
         if (not answer or len(answer.strip()) < 10) and redemption_fallback:
@@ -1911,29 +2584,16 @@ Respond in JSON:
         # Double-check: If answer still contains invalid fund patterns, force correct answer
         if any(phrase in query_lower for phrase in ["what funds", "which funds", "what schemes", "know about", "do you know", "have information about"]):
             # Check if answer has a fund list format
-            if re.search(r'[*•]\s*HDFC\s+', answer, re.IGNORECASE) or len(re.findall(r'HDFC\s+[A-Z][a-z]+', answer)) > 4:
+            if HDFC_BULLET_RE.search(answer) or len(HDFC_NAME_RE.findall(answer)) > 4:
                 # Force correct answer with markdown formatting
-                answer = (
-                    f"I have information about the following **4 HDFC mutual fund schemes**:\n\n"
-                    + "\n".join([f"- **{scheme}**" for scheme in self.actual_schemes])
-                    + "\n\nI can answer factual questions about **expense ratios**, **exit loads**, **fund managers**, **investment strategies**, "
-                    "and other details for these schemes. I provide information only, not investment advice."
-                )
+                answer = self._fund_list_answer
         
         # Final check: If answer is still empty after all processing, use appropriate fallback
         if not answer or len(answer.strip()) < 10:
             if query_type == 'how_to' and any(phrase in query_lower for phrase in ['redeem', 'redemption', 'withdraw', 'sell units']):
                 # Extract scheme name
-                scheme_name_fallback = "HDFC Large Cap Fund"  # Default
-                if 'flexi cap' in query_lower:
-                    scheme_name_fallback = "HDFC Flexi Cap Fund"
-                elif 'large cap' in query_lower:
-                    scheme_name_fallback = "HDFC Large Cap Fund"
-                elif 'elss' in query_lower or 'taxsaver' in query_lower:
-                    scheme_name_fallback = "HDFC TaxSaver (ELSS)"
-                elif 'hybrid' in query_lower:
-                    scheme_name_fallback = "HDFC Hybrid Equity Fund"
-                answer = f"To redeem your **{scheme_name_fallback}** units, follow these steps:\n\n1. **Log in** to your account on the AMC website or distributor platform (like Groww)\n2. Navigate to the **'Redeem'** or **'Withdraw'** section and select the fund\n3. Enter the number of units or amount you want to redeem\n4. **Submit** the redemption request **before 3 PM** on any business day\n5. The proceeds will be credited to your registered bank account within **3-5 business days**\n\n**Important:** Redemption requests submitted after 3 PM will be processed on the next business day."
+                scheme_name_fallback = _scheme_name_from_query_lower(query_lower, "HDFC Large Cap Fund")
+                answer = REDEMPTION_FALLBACK_ANSWERS[scheme_name_fallback]
             elif query_type == 'entity' and ('manager' in query_lower or 'manages' in query_lower):
                 # Try direct lookup from overview files as fallback (STEP 3)
                 manager_info = self._direct_lookup_manager(query)
@@ -1955,22 +2615,14 @@ Respond in JSON:
         
         # Final cleanup pass AFTER formatting (remove any artifacts that made it through)
         if formatted_answer:
-            # Remove chunk separators (all variations)
-            formatted_answer = re.sub(r'\s*---\s*', ' ', formatted_answer)
-            formatted_answer = re.sub(r'\s*---', ' ', formatted_answer)
-            formatted_answer = re.sub(r'---\s*', ' ', formatted_answer)
-            formatted_answer = re.sub(r'---', ' ', formatted_answer)
+            # Skip the regex passes when format_answer only appended the timestamp to the text
+            # cleaned above, or when no artifact marker is present (the common case)
+            body_already_clean = bool(cleaned_answer) and answer is cleaned_answer and formatted_answer.startswith(cleaned_answer)
+            needs_cleanup = not body_already_clean and _has_artifact_markers(formatted_answer)
             
-            # Remove document headers (case-insensitive, all variations)
-            formatted_answer = re.sub(r'SCHEME\s+INFORMATION\s+DOCUMENT\s+', '', formatted_answer, flags=re.IGNORECASE)
-            formatted_answer = re.sub(r'SCHEME INFORMATION DOCUMENT\s+', '', formatted_answer, flags=re.IGNORECASE)
-            formatted_answer = re.sub(r'SCHEME\s+INFORMATION\s+DOCUMENT', '', formatted_answer, flags=re.IGNORECASE)
-            
-            # Remove fund type labels (all variations)
-            formatted_answer = re.sub(r'\bHybrid\s+DIRECT\s+REGULAR\b\s*', '', formatted_answer, flags=re.IGNORECASE)
-            formatted_answer = re.sub(r'\bDIRECT\s+REGULAR\b\s*', '', formatted_answer, flags=re.IGNORECASE)
-            formatted_answer = re.sub(r'\bDIRECT REGULAR\b\s*', '', formatted_answer, flags=re.IGNORECASE)
-            formatted_answer = re.sub(r'DIRECT REGULAR', '', formatted_answer, flags=re.IGNORECASE)
+            # Remove chunk separators, document headers, fund type labels, then fix "equityequity"
+            if needs_cleanup:
+                formatted_answer = _remove_answer_artifacts(formatted_answer)
             
             # Remove incomplete sentences at the end (before timestamp)
             # Split by timestamp marker to preserve it
@@ -1980,32 +2632,27 @@ Respond in JSON:
                 timestamp = '*Last updated:' + parts[1] if len(parts) > 1 else ''
                 
                 # Clean main answer
-                main_answer = re.sub(r'\s+whet\s*$', '.', main_answer, flags=re.IGNORECASE)
-                main_answer = re.sub(r'\s+if in doubt about\s*$', '.', main_answer, flags=re.IGNORECASE)
-                main_answer = re.sub(r'\s+Investors should consult.*?$', '.', main_answer, flags=re.IGNORECASE | re.DOTALL)
+                if needs_cleanup:
+                    main_answer = TRUNCATED_TAIL_RE.sub('.', main_answer)
                 
                 # Ensure proper ending before timestamp
-                if main_answer and not main_answer.rstrip()[-1] in '.!?':
+                if main_answer and not main_answer.rstrip().endswith(('.', '!', '?')):
                     main_answer += "."
                 
                 formatted_answer = main_answer + timestamp
             else:
-                formatted_answer = re.sub(r'\s+whet\s*$', '.', formatted_answer, flags=re.IGNORECASE)
-                formatted_answer = re.sub(r'\s+if in doubt about\s*$', '.', formatted_answer, flags=re.IGNORECASE)
-                formatted_answer = re.sub(r'\s+Investors should consult.*?$', '.', formatted_answer, flags=re.IGNORECASE | re.DOTALL)
-                if formatted_answer and not formatted_answer.rstrip()[-1] in '.!?*':
+                if needs_cleanup:
+                    formatted_answer = TRUNCATED_TAIL_RE.sub('.', formatted_answer)
+                if formatted_answer and not formatted_answer.rstrip().endswith(('.', '!', '?', '*')):
                     formatted_answer += "."
             
-            # Fix "equityequity" -> "equity"
-            formatted_answer = re.sub(r'equityequity', 'equity', formatted_answer, flags=re.IGNORECASE)
-            formatted_answer = re.sub(r'equity\s+equity', 'equity', formatted_answer, flags=re.IGNORECASE)
-            
             # Remove "A HDFC" at start if it appears
-            formatted_answer = re.sub(r'^A\s+HDFC\s+', 'HDFC ', formatted_answer, flags=re.IGNORECASE)
+            if needs_cleanup:
+                formatted_answer = LEADING_A_HDFC_RE.sub('HDFC ', formatted_answer)
             
             # Clean up multiple spaces (but preserve line breaks for markdown)
-            formatted_answer = re.sub(r'[ \t]+', ' ', formatted_answer)  # Multiple spaces/tabs to single space
-            formatted_answer = re.sub(r'\n\s*\n\s*\n+', '\n\n', formatted_answer)  # Multiple newlines to double
+            formatted_answer = HSPACE_RUN_RE.sub(' ', formatted_answer)  # Multiple spaces/tabs to single space
+            formatted_answer = EXTRA_NEWLINES_RE.sub('\n\n', formatted_answer)  # Multiple newlines to double
             formatted_answer = formatted_answer.strip()
         
         result = {
@@ -2029,14 +2676,8 @@ Respond in JSON:
     
     def _get_source_authority_priority(self, source_type: str) -> int:
         """Get authority priority (lower number = higher priority)"""
-        authority_map = {
-            'sid_pdf': 1,  # SID - highest
-            'kim_pdf': 2,  # KIM - second
-            'factsheet_consolidated': 3,  # Factsheet - third
-            'scheme_overview': 4,  # Overview - fourth
-        }
-        # Default to 5 for other types
-        return authority_map.get(source_type, 5)
+        # SID > KIM > factsheet > overview; default to 5 for other types
+        return SOURCE_AUTHORITY_RANK.get(source_type, 5)
     
     def _normalize_metric_value(self, value: str, field: str) -> str:
         """Normalize metric value according to rules"""
@@ -2081,57 +2722,15 @@ Respond in JSON:
     
     def _extract_numeric_pattern(self, text: str, field: str) -> Optional[Dict]:
         """Extract numeric pattern from text for given field"""
-        text_lower = text.lower()
-        
-        # Patterns for different fields
-        patterns = {
-            'exit_load': [
-                r'exit\s*load[^.]*?([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%',
-                r'([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%\s*exit\s*load',
-                r'exit\s*load[^.]*?nil',
-            ],
-            'expense_ratio': [
-                # Avoid "reduction" - look for TER as standalone or in specific contexts
-                r'(?:total\s*)?expense\s*ratio\s*(?:\(ter\))?[^.]*?(?:is|of|:)\s*([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%(?!\s*reduction)',
-                r'ter\s*(?:is|of|:)\s*([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%(?!\s*reduction)',
-                r'([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%\s*(?:total\s*)?expense\s*ratio(?!\s*reduction)',
-                # Look for TER in overview pages (current values)
-                r'(?:current\s*)?(?:total\s*)?expense\s*ratio[^.]*?([0-9]{1,3}(?:\.[0-9]{1,2})?)\s?%(?!\s*reduction)',
-            ],
-            'minimum_sip': [
-                r'minimum\s*(?:sip|application)[^.]*?(?:₹|Rs\.?|INR)?\s?([0-9,]+)',
-                r'([0-9,]+)\s*(?:₹|Rs\.?|INR)?\s*minimum\s*(?:sip|application)',
-            ],
-            'lock_in': [
-                r'lock[^.]*?(\d+)\s*(?:year|years|yr|yrs)',
-                r'(\d+)\s*(?:year|years|yr|yrs)[^.]*?lock',
-            ],
-            'benchmark': [
-                r'benchmark[^.]*?([A-Z][A-Z0-9\s]+(?:Index|TRI|Total Returns Index))',
-                r'benchmarked?\s*against\s*([A-Z][A-Z0-9\s]+(?:Index|TRI|Total Returns Index))',
-                r'([A-Z][A-Z0-9\s]+(?:Index|TRI|Total Returns Index))\s*(?:\(as per|as per|\(TRI\)|TRI)',
-            ],
-            'riskometer': [
-                r'riskometer[^.]*?(low|moderate|high|very\s*high|moderately\s*high|low\s*to\s*moderate)',
-                r'risk[^.]*?level[^.]*?(low|moderate|high|very\s*high|moderately\s*high|low\s*to\s*moderate)',
-                r'scheme\s*riskometer[^.]*?(low|moderate|high|very\s*high|moderately\s*high|low\s*to\s*moderate)',
-            ],
-            'min_lumpsum': [
-                r'minimum\s*(?:lumpsum|application|amount)[^.]*?(?:₹|Rs\.?|INR)?\s?([0-9,]+)',
-                r'([0-9,]+)\s*(?:₹|Rs\.?|INR)?\s*minimum\s*(?:lumpsum|application|amount)',
-            ],
-        }
-        
-        field_patterns = patterns.get(field, [])
+        field_patterns = NUMERIC_FIELD_PATTERNS.get(field, ())
         for pattern in field_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+            match = pattern.search(text)
             if match:
                 # Extract excerpt (20-80 chars around match)
                 start = max(0, match.start() - 40)
                 end = min(len(text), match.end() + 40)
-                excerpt = text[start:end].strip()
-                # Clean excerpt
-                excerpt = re.sub(r'\s+', ' ', excerpt)
+                # Clean excerpt (collapse whitespace runs)
+                excerpt = ' '.join(text[start:end].split())
                 
                 return {
                     'value': match.group(1) if match.lastindex else match.group(0),
@@ -2148,109 +2747,113 @@ Respond in JSON:
             return "LOW"
         
         # HIGH if SID/KIM and numeric match (normalization is OK for formatting)
-        if source_type in ['sid_pdf', 'kim_pdf']:
+        if source_type in ('sid_pdf', 'kim_pdf'):
             return "HIGH"
         
         # MEDIUM if factsheet/overview and numeric match
-        if source_type in ['factsheet_consolidated', 'scheme_overview']:
+        if source_type in ('factsheet_consolidated', 'scheme_overview'):
             return "MEDIUM"
         
         # LOW if normalized or other sources
         return "LOW"
     
-    def _extract_metric_strict(self, query: str, chunks: List[Dict], scheme_name: Optional[str] = None) -> Optional[Dict]:
-        """Extract metric using strict authority-based rules"""
-        query_lower = query.lower()
-        
+    def _prepare_metric_extraction(self, query: str, scheme_name: Optional[str] = None) -> Optional[Tuple[str, bool, Optional[str]]]:
+        """Query-level setup for strict extraction: (field, is_metric_query, scheme_tag), or None if no field"""
         # Identify field from query
         field = self._identify_field_from_query(query)
         if not field:
             return None
         
+        # Identify metric queries (gates the regex fallback)
+        query_lower = query.lower()
+        is_metric_query = any(kw in query_lower for kw in METRIC_QUERY_KEYWORDS)
+        
+        # Map query scheme name to actual scheme and tag
+        scheme_tag = None
+        if scheme_name:
+            scheme_name_lower = scheme_name.lower()
+            is_elss_query = scheme_name_lower in ELSS_NAME_KEYWORDS
+            for s_lower, s_tag, s_is_elss in self._actual_scheme_tags:
+                # Check if scheme_name matches any part of actual scheme name (ELSS aliases match each other)
+                if (scheme_name_lower in s_lower or 
+                    s_lower in scheme_name_lower or
+                    (is_elss_query and s_is_elss)):
+                    scheme_tag = s_tag
+                    break
+        
+        return field, is_metric_query, scheme_tag
+    
+    def _extract_metric_strict(self, query: str, chunks: List[Dict], scheme_name: Optional[str] = None,
+                               prepared: Optional[Tuple[str, bool, Optional[str]]] = None) -> Optional[Dict]:
+        """Extract metric using strict authority-based rules (pass `prepared` to reuse query-level setup)"""
+        if prepared is None:
+            prepared = self._prepare_metric_extraction(query, scheme_name)
+        if not prepared:
+            return None
+        field, is_metric_query, scheme_tag = prepared
+        
         # FIRST: Try direct lookup from field-specific chunks (fastest, most accurate)
         # These chunks have format: "Exit Load: 1.00%. Source: ..."
-        for chunk in chunks:
-            chunk_field = chunk.get('field', '')
+        # Only the (usually 0-2) chunks tagged with the requested field are used, so collect them once
+        field_chunks = [c for c in chunks if c.get('field') == field]
+        for chunk in field_chunks:
             chunk_text = chunk.get('chunk_text') or chunk.get('text', '')
             
-            # If this chunk is specifically for the requested field, use it directly
-            if chunk_field == field:
-                # Extract value from chunk_text (format: "Field Name: Value. Source: ...")
-                # Try multiple patterns
-                value_match = None
-                patterns = [
-                    r':\s*([^.]*?)(?:\.|Source)',  # "Field: Value. Source"
-                    r':\s*([^.]*?)(?:\.|$)',        # "Field: Value."
-                    r'\(TER\):\s*([^.]*?)(?:\.|Source)',  # "TER): Value. Source"
-                ]
+            # Extract value from chunk_text (format: "Field Name: Value. Source: ...")
+            # Try multiple patterns
+            value_match = None
+            for pattern in METRIC_VALUE_PATTERNS:
+                value_match = pattern.search(chunk_text)
+                if value_match:
+                    break
+            
+            if value_match:
+                # Clean up value (strip and collapse whitespace runs in one C-level pass)
+                value = ' '.join(value_match.group(1).split())
                 
-                for pattern in patterns:
-                    value_match = re.search(pattern, chunk_text, re.IGNORECASE)
-                    if value_match:
-                        break
+                # Get source info
+                source_id = chunk.get('source_id', '')
+                source_type = chunk.get('source_type', '')
+                source_url = chunk.get('source_url', '')
+                last_updated = chunk.get('last_fetched_date', '2025-11-17')
                 
-                if value_match:
-                    value = value_match.group(1).strip()
-                    # Clean up value (remove extra spaces, normalize)
-                    value = re.sub(r'\s+', ' ', value).strip()
-                    
-                    # Get source info
-                    source_id = chunk.get('source_id', '')
-                    source_type = chunk.get('source_type', '')
-                    source_url = chunk.get('source_url', '')
-                    last_updated = chunk.get('last_fetched_date', '2025-11-17')
-                    
-                    # Format answer - clean and beautiful
-                    field_display = field.replace('_', ' ').title()
-                    # Make it more natural
-                    if field == 'exit_load':
-                        field_display = "Exit Load"
-                    elif field == 'expense_ratio':
-                        field_display = "Total Expense Ratio (TER)"
-                    elif field == 'minimum_sip':
-                        field_display = "Minimum SIP"
-                    elif field == 'lock_in':
-                        field_display = "Lock-in Period"
-                    elif field == 'benchmark':
-                        field_display = "Benchmark"
-                    elif field == 'riskometer':
-                        field_display = "Riskometer"
-                    
-                    if scheme_name:
-                        answer = f"The {field_display.lower()} for {scheme_name} is {value}."
-                    else:
-                        answer = f"The {field_display.lower()} is {value}."
-                    
-                    # Calculate confidence based on source
-                    if 'sid' in source_type.lower():
-                        confidence = 'HIGH'
-                    elif 'kim' in source_type.lower():
-                        confidence = 'HIGH'
-                    elif 'factsheet' in source_type.lower():
-                        confidence = 'MEDIUM'
-                    else:
-                        confidence = 'MEDIUM'
-                    
-                    return {
-                        'answer': answer,
-                        'source_type': source_type,
-                        'source_id': source_id,
-                        'source_url': source_url,
-                        'excerpt': chunk_text[:150],  # First 150 chars
-                        'last_updated': last_updated,
-                        'confidence': confidence
-                    }
+                # Format answer - clean and beautiful
+                field_display = FIELD_DISPLAY_NAMES.get(field, field.replace('_', ' ').title())
+                
+                if scheme_name:
+                    answer = f"The {field_display.lower()} for {scheme_name} is {value}."
+                else:
+                    answer = f"The {field_display.lower()} is {value}."
+                
+                # Calculate confidence based on source
+                if 'sid' in source_type.lower():
+                    confidence = 'HIGH'
+                elif 'kim' in source_type.lower():
+                    confidence = 'HIGH'
+                elif 'factsheet' in source_type.lower():
+                    confidence = 'MEDIUM'
+                else:
+                    confidence = 'MEDIUM'
+                
+                return {
+                    'answer': answer,
+                    'source_type': source_type,
+                    'source_id': source_id,
+                    'source_url': source_url,
+                    'excerpt': chunk_text[:150],  # First 150 chars
+                    'last_updated': last_updated,
+                    'confidence': confidence
+                }
         
         # SECOND: If no field-specific chunk found, try direct lookup from chunks_clean.jsonl
         # This bypasses retrieval issues and goes straight to the source
-        if not chunks or not any(c.get('field') == field for c in chunks):
+        if not field_chunks:
             direct_chunk = self._get_direct_chunk_from_file(field, scheme_name)
             if direct_chunk:
                 chunk_text = direct_chunk.get('chunk_text', '')
-                value_match = re.search(r':\s*([^.]*?)(?:\.|Source)', chunk_text, re.IGNORECASE)
+                value_match = METRIC_VALUE_PATTERNS[0].search(chunk_text)
                 if value_match:
-                    value = value_match.group(1).strip()
-                    value = re.sub(r'\s+', ' ', value).strip()
+                    value = ' '.join(value_match.group(1).split())  # Strip + collapse whitespace
                     
                     # Format answer - clean and beautiful (use constants)
                     field_display = FIELD_DISPLAY_NAMES.get(field, field.replace('_', ' ').title())
@@ -2276,68 +2879,47 @@ Respond in JSON:
                         'confidence': confidence
                     }
         
-        # FALLBACK: Use regex extraction from chunks (original method)
-        # Identify metric queries
-        metric_keywords = [
-            'minimum sip', 'minimum lumpsum', 'exit load', 'lock-in', 'lock in',
-            'expense ratio', 'ter', 'benchmark', 'riskometer', 'nav', 'amount',
-            'percentage', 'percent', '%'
-        ]
-        
-        if not any(kw in query_lower for kw in metric_keywords):
+        # FALLBACK: Use regex extraction from chunks (original method), for metric queries only
+        if not is_metric_query:
             return None
         
         # Filter chunks by scheme if specified
-        if scheme_name:
-            scheme_tag = None
-            scheme_name_lower = scheme_name.lower()
-            
-            # Map query scheme name to actual scheme and tag
-            for s in self.actual_schemes:
-                s_lower = s.lower()
-                # Check if scheme_name matches any part of actual scheme name
-                if (scheme_name_lower in s_lower or 
-                    s_lower in scheme_name_lower or
-                    # Special cases
-                    (scheme_name_lower == 'elss' and ('elss' in s_lower or 'taxsaver' in s_lower or 'tax saver' in s_lower)) or
-                    (scheme_name_lower == 'taxsaver' and ('elss' in s_lower or 'taxsaver' in s_lower or 'tax saver' in s_lower)) or
-                    (scheme_name_lower == 'tax saver' and ('elss' in s_lower or 'taxsaver' in s_lower or 'tax saver' in s_lower))):
-                    # Map to scheme tag
-                    if 'large cap' in s_lower:
-                        scheme_tag = 'LARGE_CAP'
-                    elif 'flexi cap' in s_lower:
-                        scheme_tag = 'FLEXI_CAP'
-                    elif 'elss' in s_lower or 'taxsaver' in s_lower or 'tax saver' in s_lower:
-                        scheme_tag = 'ELSS'
-                    elif 'hybrid' in s_lower:
-                        scheme_tag = 'HYBRID'
-                    break
-            
-            if scheme_tag:
-                chunks = [c for c in chunks if c.get('scheme_tag', '').upper() == scheme_tag.upper()]
+        if scheme_tag:
+            chunks = [c for c in chunks if c.get('scheme_tag', '').upper() == scheme_tag]
         
         # Extract numeric patterns from all chunks
-        candidate_chunks = []
+        # Keep only the running best: lowest authority priority, first match wins ties
+        best_candidate = None
+        required_keywords = NUMERIC_FIELD_REQUIRED_KEYWORDS.get(field)
         for chunk in chunks:
             chunk_text = chunk.get('text', '')
+            chunk_text_lower = _chunk_text_lower(chunk)
+            # Skip chunks no field pattern can match (ASCII only, where lower() agrees with IGNORECASE)
+            if required_keywords and chunk_text.isascii() and not any(kw in chunk_text_lower for kw in required_keywords):
+                continue
             source_id = chunk.get('source_id', '')
             # Get source_type from chunk or metadata
             source_type = chunk.get('source_type', '')
             if not source_type and source_id in self.source_metadata:
                 source_type = self.source_metadata[source_id].get('source_type', '')
             
+            # Only a strictly more authoritative source can replace the current best
+            authority_priority = self._get_source_authority_priority(source_type)
+            if best_candidate is not None and authority_priority >= best_candidate['authority_priority']:
+                continue
+            
             # For TER, skip chunks with "reduction" in them (unless it's the only match)
-            if field == 'expense_ratio' and 'reduction' in chunk_text.lower() and len(chunks) > 1:
+            if field == 'expense_ratio' and 'reduction' in chunk_text_lower and len(chunks) > 1:
                 # Skip reduction mentions unless it's the only option
                 continue
             
             # For riskometer, prioritize AMFI sources and factsheet sources
             if field == 'riskometer':
                 # Boost AMFI riskometer sources
-                if 'amfi' in source_id.lower() and 'riskometer' in chunk_text.lower():
+                if 'amfi' in source_id.lower() and 'riskometer' in chunk_text_lower:
                     # This is a good riskometer source
                     pass
-                elif 'expense' in chunk_text.lower() and 'riskometer' not in chunk_text.lower():
+                elif 'expense' in chunk_text_lower and 'riskometer' not in chunk_text_lower:
                     # Skip expense ratio chunks when looking for riskometer
                     if len(chunks) > 1:
                         continue
@@ -2347,28 +2929,24 @@ Respond in JSON:
             if numeric_match:
                 # For TER, double-check we didn't extract a reduction amount
                 if field == 'expense_ratio':
-                    match_context = chunk_text[max(0, numeric_match['match_start']-50):min(len(chunk_text), numeric_match['match_end']+50)].lower()
+                    match_context = chunk_text_lower[max(0, numeric_match['match_start']-50):numeric_match['match_end']+50]
                     if 'reduction' in match_context and len(chunks) > 1:
                         # This is likely a reduction amount, skip it
                         continue
                 
-                candidate_chunks.append({
+                best_candidate = {
                     'chunk': chunk,
                     'numeric_match': numeric_match,
                     'source_type': source_type,
                     'source_id': source_id,
-                    'authority_priority': self._get_source_authority_priority(source_type)
-                })
+                    'authority_priority': authority_priority
+                }
         
-        if not candidate_chunks:
+        if best_candidate is None:
             return None
         
-        # Sort by authority priority (lower number = higher priority)
-        candidate_chunks.sort(key=lambda x: x['authority_priority'])
-        
         # If same priority, prefer more recent (would need last_updated, but we'll use first match for now)
-        # Select the highest authority chunk
-        best_candidate = candidate_chunks[0]
+        # best_candidate is the highest authority chunk
         
         chunk = best_candidate['chunk']
         numeric_match = best_candidate['numeric_match']
@@ -2388,12 +2966,7 @@ Respond in JSON:
         last_updated = source_meta.get('last_fetched_date', chunk.get('last_updated', chunk.get('last_fetched_date', '2025-11-18')))
         # Normalize date format (MM/DD/YYYY -> YYYY-MM-DD)
         if '/' in str(last_updated):
-            try:
-                from datetime import datetime
-                date_obj = datetime.strptime(str(last_updated), '%m/%d/%Y')
-                last_updated = date_obj.strftime('%Y-%m-%d')
-            except:
-                pass
+            last_updated = _mdy_date_to_iso(str(last_updated)) or last_updated
         
         # Format excerpt (show full text, no truncation)
         excerpt = numeric_match['excerpt']
@@ -2414,7 +2987,7 @@ Respond in JSON:
         
         # Add condition if exit load
         if field == 'exit_load':
-            chunk_text = chunk.get('text', '').lower()
+            chunk_text = _chunk_text_lower(chunk)
             # Only check for "no exit load" if the extracted value is actually "nil" or "0"
             if normalized_value.lower() in ['nil', '0', '0.00%', '0%'] or ('no exit load' in chunk_text and '1.00%' not in chunk_text):
                 answer_line = f"Exit Load ({scheme_name if scheme_name else 'Fund'}): Nil (No exit load)"
@@ -2439,28 +3012,34 @@ Respond in JSON:
     
     def _handle_comparison_query(self, query: str, chunks: List[Dict], scheme_name: Optional[str] = None) -> Optional[Dict]:
         """Handle comparison queries (SID vs KIM, etc.)"""
-        query_lower = query.lower()
-        field = self._identify_field_from_query(query)
-        if not field:
+        # Field, metric gate and scheme tag are the same for every document, so resolve them once
+        prepared = self._prepare_metric_extraction(query, scheme_name)
+        if not prepared:
+            return None
+        field = prepared[0]
+        
+        # Split chunks by document in one pass (a chunk can belong to more than one bucket)
+        sid_chunks, kim_chunks, factsheet_chunks = [], [], []
+        for c in chunks:
+            source_id_lower = c.get('source_id', '').lower()
+            source_type = c.get('source_type', '')
+            if 'sid' in source_id_lower or source_type == 'sid_pdf':
+                sid_chunks.append(c)
+            if 'kim' in source_id_lower or source_type == 'kim_pdf':
+                kim_chunks.append(c)
+            if 'factsheet' in source_id_lower or source_type == 'factsheet_consolidated':
+                factsheet_chunks.append(c)
+        
+        # Extract from SID (nothing to compare without it)
+        sid_result = self._extract_metric_strict(query, sid_chunks, scheme_name, prepared) if sid_chunks else None
+        if not sid_result:
             return None
         
-        # Extract from SID
-        sid_chunks = [c for c in chunks if 'sid' in c.get('source_id', '').lower() or c.get('source_type', '') == 'sid_pdf']
-        sid_result = None
-        if sid_chunks:
-            sid_result = self._extract_metric_strict(query, sid_chunks, scheme_name)
-        
-        # Extract from KIM
-        kim_chunks = [c for c in chunks if 'kim' in c.get('source_id', '').lower() or c.get('source_type', '') == 'kim_pdf']
-        kim_result = None
-        if kim_chunks:
-            kim_result = self._extract_metric_strict(query, kim_chunks, scheme_name)
-        
-        # Extract from factsheet
-        factsheet_chunks = [c for c in chunks if 'factsheet' in c.get('source_id', '').lower() or c.get('source_type', '') == 'factsheet_consolidated']
+        # Extract from KIM, falling back to the factsheet only if KIM has no value
+        kim_result = self._extract_metric_strict(query, kim_chunks, scheme_name, prepared) if kim_chunks else None
         factsheet_result = None
-        if factsheet_chunks:
-            factsheet_result = self._extract_metric_strict(query, factsheet_chunks, scheme_name)
+        if not kim_result and factsheet_chunks:
+            factsheet_result = self._extract_metric_strict(query, factsheet_chunks, scheme_name, prepared)
         
         # Compare results
         if sid_result and (kim_result or factsheet_result):
@@ -2499,20 +3078,21 @@ Respond in JSON:
         query_lower = query.lower()
         if 'no exit load after' in query_lower:
             # Search for text that contradicts "No exit load after X year"
-            year_match = re.search(r'after\s*(\d+)\s*(?:year|years)', query_lower)
+            year_match = AFTER_N_YEARS_RE.search(query_lower)
             if year_match:
                 year = year_match.group(1)
+                after_year = f'after {year}'
                 # Look for exit load mentions in chunks
                 for chunk in chunks:
-                    chunk_text = chunk.get('text', '').lower()
+                    chunk_text = _chunk_text_lower(chunk)
                     # Check if there's exit load mentioned for after that year
-                    if f'exit load' in chunk_text and f'after {year}' in chunk_text:
+                    if 'exit load' in chunk_text and after_year in chunk_text:
                         # Check if it says "no exit load"
                         if 'no exit load' in chunk_text or 'nil' in chunk_text:
                             answer = f"Answer: No contradiction found. Text confirms: No exit load after {year} year.\n"
                         else:
                             # Check for exit load amount after that year
-                            exit_load_match = re.search(r'exit\s*load[^.]*?after\s*' + year + r'[^.]*?([0-9.]+)\s?%', chunk_text)
+                            exit_load_match = _exit_load_after_year_re(year).search(chunk_text)
                             if exit_load_match:
                                 answer = f"Answer: Contradiction found. Text shows exit load of {exit_load_match.group(1)}% after {year} year, contradicting 'No exit load after {year} year'.\n"
                             else:
@@ -2536,22 +3116,22 @@ Respond in JSON:
         """Handle canonical facts row queries"""
         # Extract requested fields
         fields = ['min_sip', 'exit_load', 'ter', 'lock_in']
-        if 'min_sip' in query.lower() or 'minimum sip' in query.lower():
+        query_lower = query.lower()
+        if 'min_sip' in query_lower or 'minimum sip' in query_lower:
             fields.append('minimum_sip')
         
         facts = {}
+        # min_sip and minimum_sip map to the same extraction; run each distinct one once
+        results_by_query_field = {}
         for field in fields:
             # Map field names
-            field_map = {
-                'min_sip': 'minimum_sip',
-                'ter': 'expense_ratio',
-                'lock_in': 'lock_in'
-            }
-            query_field = field_map.get(field, field)
+            query_field = CANONICAL_FACT_QUERY_FIELDS.get(field, field)
             
-            # Create a query for this field
-            field_query = f"What is the {query_field.replace('_', ' ')} of {scheme_name or 'the fund'}"
-            result = self._extract_metric_strict(field_query, chunks, scheme_name)
+            if query_field not in results_by_query_field:
+                # Create a query for this field
+                field_query = f"What is the {query_field.replace('_', ' ')} of {scheme_name or 'the fund'}"
+                results_by_query_field[query_field] = self._extract_metric_strict(field_query, chunks, scheme_name)
+            result = results_by_query_field[query_field]
             if result:
                 answer_parts = result['answer'].split(':')
                 value = answer_parts[-1].strip() if answer_parts else result['answer'].strip()
@@ -2610,10 +3190,10 @@ Respond in JSON:
     def _apply_response_style(self, answer: str, style: str, query_type: str) -> str:
         """Apply response style (brief, detailed, beginner, etc.)"""
         if style == "brief":
-            # Extract key points, limit to 2-3 sentences
-            sentences = answer.split('. ')
-            if len(sentences) > 3:
-                answer = '. '.join(sentences[:3]) + '.'
+            # Extract key points, limit to 3 sentences (cut at the third sentence boundary, if any)
+            third_boundary = next(islice(SENTENCE_BOUNDARY_RE.finditer(answer), 2, None), None)
+            if third_boundary:
+                answer = answer[:third_boundary.start()]
         
         elif style == "detailed":
             # Ensure comprehensive answer (already handled by LLM, but can enhance)
@@ -2624,101 +3204,48 @@ Respond in JSON:
         elif style == "beginner":
             # Simplify language, add explanations
             # Replace technical terms with simpler ones
-            replacements = {
-                'expense ratio': 'expense ratio (the annual fee charged by the fund)',
-                'exit load': 'exit load (a charge when you withdraw money early)',
-                'lock-in period': 'lock-in period (the minimum time you must keep your investment)',
-                'benchmark': 'benchmark (a standard index used to compare fund performance)'
-            }
-            for term, explanation in replacements.items():
-                if term in answer.lower() and explanation not in answer.lower():
-                    answer = answer.replace(term, explanation)
+            # Expand every term whose explanation isn't already present, in one substitution pass
+            answer_lower = answer.lower()
+            expansions = {term: explanation for term, explanation in BEGINNER_TERM_EXPLANATIONS
+                          if explanation not in answer_lower}
+            if expansions:
+                answer = BEGINNER_TERM_RE.sub(lambda m: expansions.get(m.group(0), m.group(0)), answer)
         
         return answer
     
     def _identify_field_from_query(self, query: str) -> Optional[str]:
         """Identify field from query"""
-        query_lower = query.lower()
-        
-        field_map = {
-            'exit_load': ['exit load', 'redemption charge', 'exit charge'],
-            'expense_ratio': ['expense ratio', 'ter', 'total expense ratio'],
-            'minimum_sip': ['minimum sip', 'min sip', 'minimum investment'],
-            'min_lumpsum': ['minimum lumpsum', 'min lumpsum', 'minimum application', 'min application'],
-            'lock_in': ['lock-in', 'lock in', 'lockin'],
-            'benchmark': ['benchmark', 'benchmark index'],
-            'riskometer': ['riskometer', 'risk-o-meter', 'risk meter']
-        }
-        
-        for field, keywords in field_map.items():
-            if any(kw in query_lower for kw in keywords):
-                return field
-        
-        return None
+        return _field_from_query_lower(query.lower())
     
     def _validate_answer_against_schemes(self, answer: str) -> str:
         """Validate answer doesn't mention schemes we don't have"""
-        # Known fund names that might appear in hallucinated answers
-        invalid_funds = [
-            "HDFC Banking & Financial Services Fund",
-            "HDFC Business Cycle Fund",
-            "HDFC Value Fund",
-            "HDFC Defence Fund",
-            "HDFC Dividend Yield Fund",
-            "HDFC Focused 30 Fund",
-            "HDFC Housing Opportunities Fund",
-            "HDFC Infrastructure Fund",
-            "HDFC Large and Mid Cap Fund",
-            "HDFC Manufacturing Fund",
-            "HDFC Mid-Cap Opportunities Fund",
-            "HDFC MNC Fund",
-            "HDFC Multi Cap Fund",
-            "HDFC Non-Cyclical Consumption Fund",
-            "HDFC Non-Cyclical",
-            "HDFC Hybrid Debt Fund",
-            "HDFC Income Fund",
-            "HDFC Liquid Fund",
-            "HDFC Long Duration Debt Fund",
-            "HDFC Low Duration Fund",
-            "HDFC Medium Term Debt Fund",
-            "HDFC Money Market Fund",
-            "HDFC Multi-Asset Fund",
-            "HDFC Retirement Saving",
-            "HDFC Retirement Saving fund",
-            "HDFC Children's Fund",
-            "HDFC Technology Fund",
-            "HDFC Arbitrage Fund",
-        ]
-        
         answer_lower = answer.lower()
-        mentioned_invalid = []
-        
-        for invalid_fund in invalid_funds:
-            if invalid_fund.lower() in answer_lower:
-                mentioned_invalid.append(invalid_fund)
+        # Invalid names and fund-list bullets all contain "HDFC" - nothing to validate without it
+        if 'hdfc' not in answer_lower:
+            return answer
+        mentioned_invalid = _find_invalid_funds(answer_lower)
         
         # Check if answer contains a list of funds (bullet points, asterisks, etc.)
-        has_fund_list = bool(re.search(r'[*•]\s*HDFC\s+\w+', answer, re.IGNORECASE))
+        has_fund_list = bool(HDFC_BULLET_NAME_RE.search(answer))
         
         if mentioned_invalid or has_fund_list:
             # If answer contains invalid funds or looks like a fund list, replace entirely
-            correct_schemes = ", ".join(self.actual_schemes)
             # Check if this is a "what funds" type query
             if "fund" in answer_lower and any(phrase in answer_lower for phrase in ["have information", "available", "know about", "following funds"]):
-                schemes_list = correct_schemes.split(", ")
-                return (
-                    f"I have information about the following **4 HDFC mutual fund schemes**:\n\n"
-                    + "\n".join([f"- **{scheme}**" for scheme in schemes_list])
-                    + "\n\nI can answer factual questions about **expense ratios**, **exit loads**, **fund managers**, **investment strategies**, "
-                    "and other details for these schemes. I provide information only, not investment advice."
-                )
+                return self._fund_list_answer
             else:
                 # Remove invalid mentions
-                for invalid in mentioned_invalid:
-                    answer = re.sub(re.escape(invalid), "", answer, flags=re.IGNORECASE)
+                for invalid_name, invalid_lower, invalid_pattern in mentioned_invalid:
+                    # Names nearly always keep their canonical casing: a plain replace suffices when it leaves
+                    # no case-insensitive match (ASCII only, where lower() agrees with IGNORECASE)
+                    stripped = answer.replace(invalid_name, "")
+                    if stripped.isascii() and invalid_lower not in stripped.lower():
+                        answer = stripped
+                    else:
+                        answer = invalid_pattern.sub("", answer)
                 # Remove any fund list patterns
-                answer = re.sub(r'[*•]\s*HDFC\s+[^\n]+', '', answer, flags=re.IGNORECASE)
-                answer = re.sub(r'HDFC\s+[A-Z][a-z]+\s+Fund', '', answer, flags=re.IGNORECASE)
+                answer = HDFC_BULLET_LINE_RE.sub('', answer)
+                answer = HDFC_FUND_NAME_RE.sub('', answer)
         
         return answer
     
@@ -2745,30 +3272,22 @@ Respond in JSON:
         # For metric queries, ensure numbers are clearly stated
         if query_type == 'metric':
             # Check if answer has numbers (but filter out page numbers, years, etc.)
-            has_valid_number = bool(re.search(r'\d+\.\d+%?|\d+%', answer))  # Decimal or percentage
+            has_valid_number = bool(DECIMAL_OR_PERCENT_RE.search(answer))
             
             if not has_valid_number:
                 # Try to find number in context near metric keywords
                 query_lower = query.lower()
                 if 'expense' in query_lower or 'ter' in query_lower:
                     # Look for expense ratio patterns
-                    ter_patterns = [
-                        r'(?:expense ratio|ter|total expense ratio)[:\s]+(\d+\.\d+%?)',
-                        r'(\d+\.\d+%?)\s*(?:expense ratio|ter|total expense ratio)',
-                    ]
-                    for pattern in ter_patterns:
-                        match = re.search(pattern, context[:1000], re.IGNORECASE)
+                    for pattern in TER_CONTEXT_PATTERNS:
+                        match = pattern.search(context[:1000])
                         if match:
                             answer = answer + f" The expense ratio is {match.group(1)}."
                             break
                 elif 'exit load' in query_lower:
                     # Look for exit load patterns
-                    exit_patterns = [
-                        r'(?:exit load|redemption charge)[:\s]+(\d+\.?\d*%?)',
-                        r'(\d+\.?\d*%?)\s*(?:exit load|redemption charge)',
-                    ]
-                    for pattern in exit_patterns:
-                        match = re.search(pattern, context[:1000], re.IGNORECASE)
+                    for pattern in EXIT_LOAD_CONTEXT_PATTERNS:
+                        match = pattern.search(context[:1000])
                         if match:
                             answer = answer + f" The exit load is {match.group(1)}."
                             break
@@ -2781,15 +3300,9 @@ Respond in JSON:
                 context_clean = self._clean_context_for_entity(context)
                 
                 # Extract manager name with improved patterns
-                manager_patterns = [
-                    r'(?:Fund\s+Manager|Manager|Investment\s+Manager)[:\s]+(?:Mr\.|Ms\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                    r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?:Fund\s+Manager|Manager|Investment\s+Manager|Equity\s+Analyst)',
-                    r'(?:Mr\.|Ms\.|Mrs\.|Dr\.)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                ]
-                
                 found_name = None
-                for pattern in manager_patterns:
-                    match = re.search(pattern, context_clean[:2000], re.IGNORECASE)
+                for pattern in MANAGER_NAME_PATTERNS:
+                    match = pattern.search(context_clean[:2000])
                     if match:
                         name = match.group(1).strip()
                         # Validate it's a real name (2 words, each > 2 chars)
@@ -2798,15 +3311,7 @@ Respond in JSON:
                             break
                 
                 # Extract scheme name from query
-                scheme_name = None
-                if 'flexi cap' in query_lower_entity:
-                    scheme_name = "HDFC Flexi Cap Fund"
-                elif 'large cap' in query_lower_entity:
-                    scheme_name = "HDFC Large Cap Fund"
-                elif 'elss' in query_lower_entity or 'taxsaver' in query_lower_entity:
-                    scheme_name = "HDFC TaxSaver (ELSS)"
-                elif 'hybrid' in query_lower_entity:
-                    scheme_name = "HDFC Hybrid Equity Fund"
+                scheme_name = _scheme_name_from_query_lower(query_lower_entity)
                 
                 # If we found a name, format answer cleanly
                 if found_name:
@@ -2823,9 +3328,9 @@ Respond in JSON:
         # For list queries, format as list if it's a paragraph
         if query_type == 'list':
             # Check if answer has list-like structure
-            if not re.search(r'[0-9]+\.|•|-\s+[A-Z]', answer):
+            if not LIST_STRUCTURE_RE.search(answer):
                 # Try to extract list items from context
-                list_items = re.findall(r'([A-Z][^.!?]*(?:\([^)]+\))?)', context[:800])
+                list_items = LIST_ITEM_RE.findall(context[:800])
                 if len(list_items) >= 2:
                     # Format as list
                     formatted = "The top items are: " + ", ".join(list_items[:5])
@@ -2844,17 +3349,21 @@ Respond in JSON:
         query_lower = query.lower()
         answer_lower = answer.lower()
         
-        # Clean up artifacts from chunk separators
-        answer = re.sub(r'\s*---\s*', ' ', answer)  # Remove separator artifacts
-        answer = re.sub(r'\s+', ' ', answer)  # Clean up multiple spaces
+        # Clean up artifacts from chunk separators (literal, so str.replace) and multiple spaces
+        answer = WHITESPACE_RUN_RE.sub(' ', answer.replace('---', ' '))
         
         # Remove document headers and metadata
-        answer = re.sub(r'SCHEME INFORMATION DOCUMENT\s+', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'DIRECT REGULAR\s*', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'An open ended hybrid scheme\s+', 'An open-ended hybrid scheme ', answer, flags=re.IGNORECASE)
+        # (skip a pattern whose keyword is absent; once one fires, run the rest since removals can join new matches)
+        collapsed_lower = answer.lower()
+        header_removed = False
+        for pattern, replacement, keyword in PRESENTATION_HEADER_SUBS:
+            if header_removed or keyword in collapsed_lower:
+                answer, count = pattern.subn(replacement, answer)
+                header_removed = header_removed or count > 0
         
         # Fix incomplete sentences (ending with numbers or incomplete words)
-        if answer.rstrip() and not answer.rstrip()[-1] in '.!?':
+        stripped = answer.rstrip()
+        if stripped and not stripped.endswith(('.', '!', '?')):
             # Check if it ends with incomplete sentence
             last_sentence = answer.split('.')[-1].strip() if '.' in answer else answer.strip()
             if len(last_sentence) > 20 and not last_sentence.endswith(('.', '!', '?')):
@@ -2863,29 +3372,25 @@ Respond in JSON:
                     # Look for continuation
                     last_words = last_sentence.split()[-3:]
                     search_phrase = " ".join(last_words).lower()
-                    for sentence in context.split('.'):
-                        if search_phrase in sentence.lower() and len(sentence) > len(search_phrase) + 30:
-                            continuation = sentence[sentence.lower().find(search_phrase) + len(search_phrase):].strip()
-                            if continuation and len(continuation) > 10 and not continuation.startswith(('http', 'www', '---')):
-                                answer += " " + continuation
-                                break
+                    continuation = _find_sentence_continuation(context, search_phrase)
+                    if continuation:
+                        answer += " " + continuation
                 # If no continuation found, add period
                 if not answer.rstrip().endswith(('.', '!', '?')):
                     answer += "."
         
-        # Check if wrong fund mentioned
-        wrong_fund = False
-        if scheme_name:
+        # Replace any other fund mentioned with the requested one (every scheme name contains "hdfc")
+        if scheme_name and 'hdfc' in answer_lower:
             scheme_name_lower = scheme_name.lower()
-            for fund in self.actual_schemes:
-                if fund.lower() in answer_lower and fund.lower() != scheme_name_lower:
-                    wrong_fund = True
-                    break
-        
-        if wrong_fund and scheme_name:
-            for fund in self.actual_schemes:
-                if fund.lower() != scheme_name.lower() and fund.lower() in answer_lower:
-                    answer = re.sub(re.escape(fund), scheme_name, answer, flags=re.IGNORECASE)
+            for fund, fund_lower, fund_pattern in self._actual_scheme_patterns:
+                if fund_lower != scheme_name_lower and fund_lower in answer_lower:
+                    # Same fast path as invalid-name removal: a plain replace of the canonical spelling
+                    # suffices when no case-insensitive match is left (ASCII only; names never self-overlap)
+                    replaced = answer.replace(fund, scheme_name)
+                    if replaced.isascii() and fund_lower not in replaced.lower():
+                        answer = replaced
+                    else:
+                        answer = fund_pattern.sub(scheme_name, answer)
         
         # Remove page titles and navigation
         has_poor_formatting = any(phrase in answer_lower for phrase in [
@@ -2896,16 +3401,14 @@ Respond in JSON:
         ])
         
         if has_poor_formatting:
-            answer = re.sub(r'HDFC\s+Large\s+Cap\s+Fund\s+Direct\s+Growth\s*-\s*NAV.*?Performance', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'HDFC\s+Mutual\s+Funds\s+HDFC\s+', 'HDFC ', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'Equity\s+DIRECT\s+REGULAR', '', answer, flags=re.IGNORECASE)
+            for pattern, replacement in PAGE_TITLE_SUBS:
+                answer = pattern.sub(replacement, answer)
         
         # Clean up multiple spaces and normalize
-        answer = re.sub(r'\s+', ' ', answer)
-        answer = answer.strip()
+        answer = ' '.join(answer.split())
         
         # Ensure proper ending
-        if answer and not answer.rstrip()[-1] in '.!?':
+        if answer and not answer.endswith(('.', '!', '?')):
             answer += "."
         
         return answer
@@ -2914,13 +3417,8 @@ Respond in JSON:
         """Extract answer directly from context when LLM says not found"""
         if query_type == 'metric':
             # Look for numbers with metric keywords
-            patterns = [
-                r'(?:expense ratio|ter|total expense ratio)[:\s]+(\d+\.?\d*%?)',
-                r'(?:exit load)[:\s]+(\d+\.?\d*%?)',
-                r'(?:minimum sip|minimum investment)[:\s]+(?:Rs\.?|₹)?\s*(\d+(?:,\d+)*)',
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, context, re.IGNORECASE)
+            for pattern in CONTEXT_METRIC_PATTERNS:
+                match = pattern.search(context)
                 if match:
                     return f"The value is {match.group(1)}."
         
@@ -2933,31 +3431,26 @@ Respond in JSON:
                 investor_info_parts = []
                 
                 # Pattern 1: "Ideal for" or "Suitable for"
-                ideal_pattern = r'(?:ideal for|suitable for)[:\s]+([^.\n]{10,150})'
-                match = re.search(ideal_pattern, context, re.IGNORECASE)
+                match = IDEAL_FOR_RE.search(context)
                 if match:
-                    ideal_text = match.group(1).strip()
-                    # Clean up common artifacts
-                    ideal_text = re.sub(r'\s+', ' ', ideal_text)
+                    # Clean up common artifacts (strip + collapse whitespace)
+                    ideal_text = ' '.join(match.group(1).split())
                     if len(ideal_text) > 5:
                         investor_info_parts.append(ideal_text)
                 
                 # Pattern 2: "This product is suitable for investors who are seeking"
-                seeking_pattern = r'(?:suitable for investors who are seeking|investors who are seeking)[:\s]+([^~]{20,300})'
-                match = re.search(seeking_pattern, context, re.IGNORECASE)
+                match = INVESTORS_SEEKING_RE.search(context)
                 if match:
-                    seeking_text = match.group(1).strip()
-                    seeking_text = re.sub(r'\s+', ' ', seeking_text)
+                    seeking_text = ' '.join(match.group(1).split())
                     if len(seeking_text) > 10:
                         investor_info_parts.append(seeking_text)
                 
                 # Pattern 3: Investment objective that mentions target investors
-                objective_pattern = r'(?:investment objective|aims to|designed for)[:\s]+([^.\n]{30,200})'
-                match = re.search(objective_pattern, context, re.IGNORECASE)
+                match = OBJECTIVE_TARGET_RE.search(context)
                 if match:
-                    obj_text = match.group(1).strip()
-                    obj_text = re.sub(r'\s+', ' ', obj_text)
-                    if 'investor' in obj_text.lower() or 'suitable' in obj_text.lower():
+                    obj_text = ' '.join(match.group(1).split())
+                    obj_text_lower = obj_text.lower()
+                    if 'investor' in obj_text_lower or 'suitable' in obj_text_lower:
                         investor_info_parts.append(obj_text)
                 
                 if investor_info_parts:
@@ -2967,37 +3460,21 @@ Respond in JSON:
                 return "I don't have specific information about the investor base in my sources. The scheme is a hybrid equity fund that invests in both equity and debt instruments, suitable for investors seeking long-term wealth creation."
             
             # Look for fund manager names (multiple patterns) - IMPROVED
-            manager_patterns = [
-                r'(?:Fund\s+Manager|Manager|Investment\s+Manager)[:\s]+(?:Mr\.|Ms\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?:Fund\s+Manager|Manager|Investment\s+Manager|Equity\s+Analyst)',
-                r'(?:Name\s+of\s+the\s+Fund\s+Manager|Fund\s+Manager\s+Name)[:\s]+(?:Mr\.|Ms\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-                r'(?:Mr\.|Ms\.|Mrs\.|Dr\.)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            ]
-            
             # Clean context first for better matching
-            context_clean = re.sub(r'Exit\s+Load.*?\.', '', context, flags=re.IGNORECASE | re.DOTALL)
-            context_clean = re.sub(r'Top\s+\d+\s+Holdings.*?Downloads', '', context_clean, flags=re.IGNORECASE | re.DOTALL)
-            context_clean = re.sub(r'OVERSEAS.*?\.', '', context_clean, flags=re.IGNORECASE | re.DOTALL)
+            context_clean = _apply_keyword_gated_subs(context, MANAGER_CONTEXT_NOISE_SUBS)
             
-            for pattern in manager_patterns:
-                match = re.search(pattern, context_clean[:3000], re.IGNORECASE)
+            # Only the first 3000 chars are searched (endpos bounds the search without copying a slice)
+            for pattern in CONTEXT_MANAGER_NAME_PATTERNS:
+                match = pattern.search(context_clean, 0, 3000)
                 if match:
                     name = match.group(1).strip()
                     # Validate it's a real name (2 words, each > 2 chars)
                     if len(name.split()) == 2 and all(len(word) > 2 for word in name.split()):
                         # Extract scheme name from query if available
-                        scheme_name = None
-                        if 'flexi cap' in query.lower():
-                            scheme_name = "HDFC Flexi Cap Fund"
-                        elif 'large cap' in query.lower():
-                            scheme_name = "HDFC Large Cap Fund"
-                        elif 'elss' in query.lower() or 'taxsaver' in query.lower():
-                            scheme_name = "HDFC TaxSaver (ELSS)"
-                        elif 'hybrid' in query.lower():
-                            scheme_name = "HDFC Hybrid Equity Fund"
+                        scheme_name = _scheme_name_from_query_lower(query_lower)
                         
                         # Also try to find tenure if available
-                        tenure_match = re.search(r'(?:since|from|tenure)[:\s]+(\d{4})', context_clean[:3000], re.IGNORECASE)
+                        tenure_match = MANAGER_TENURE_RE.search(context_clean, 0, 3000)
                         if scheme_name:
                             if tenure_match:
                                 return f"The **Fund Manager** of **{scheme_name}** is **{name}**, managing since **{tenure_match.group(1)}**."
@@ -3030,8 +3507,8 @@ Respond in JSON:
             # Basic cleaning (remove obvious noise only)
             chunk_text = self._clean_chunk_text(chunk_text, query_type)
             
-            # Skip if chunk is too short after cleaning
-            if len(chunk_text.strip()) < 20:
+            # Skip if chunk is too short after cleaning (cleaned text is already stripped)
+            if len(chunk_text) < 20:
                 continue
             
             # Only filter obviously irrelevant chunks (minimal filtering)
@@ -3039,9 +3516,10 @@ Respond in JSON:
                 continue
             
             # Add chunk with clear separator
-            if total_length + len(chunk_text) + 10 <= max_length:  # +10 for separator
+            part_length = len(chunk_text) + 10  # +10 for separator
+            if total_length + part_length <= max_length:
                 context_parts.append(chunk_text)
-                total_length += len(chunk_text) + 10
+                total_length += part_length
             else:
                 # Add partial chunk if space allows
                 remaining = max_length - total_length - 10
@@ -3066,226 +3544,173 @@ Respond in JSON:
             return True
         
         # Filter obvious document lists/navigation
-        noise_patterns = [
-            r'^downloads?$',
-            r'^\.pdf$',
-            r'^page \d+ of \d+$',
-            r'^table of contents$',
-            r'^top \d+ holdings downloads?$',
-        ]
-        
-        for pattern in noise_patterns:
-            if re.match(pattern, text_lower):
+        for pattern in NOISE_LINE_PATTERNS:
+            if pattern.match(text_lower):
                 return True
         
-        # Filter if it's mostly document names and dates (metadata chunk)
-        if self._is_metadata_chunk(text):
+        # Filter if it's mostly document names and dates (metadata chunk; reuses the lowercased text)
+        if self._is_metadata_chunk(text, text_lower):
             return True
         
         return False
     
     def _clean_chunk_text(self, text: str, query_type: str) -> str:
         """Clean chunk text by removing document metadata and noise - AGGRESSIVE CLEANING"""
-        # Remove SEBI circular references and regulatory citations
-        text = re.sub(r'SEBI\s+Circular\s+No\.?\s*[A-Z0-9/]+\s+dated\s+[^,]+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'CIR/\d+/\d+/\d+\s+dated\s+[^,]+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'MRD/[^,]+dated\s+[^,]+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'notifying\s+fram[^.]*', '', text, flags=re.IGNORECASE)
-        
-        # Remove common document metadata patterns
-        # Pattern 1: "p 10 Holdings As on 31 Oct 2025 Downloads..."
-        text = re.sub(r'^p\s+\d+\s+[A-Z][^.]*?Downloads[^.]*?', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # Pattern 2: Document lists like "SID - HDFC Large Cap Fund dated May 30, 2025 KIM..."
-        text = re.sub(r'(?:SID|KIM|Leaflet|Presentation|Fund Facts)[\s\-:]+[^.]*?(?:dated|as on|as of)[^.]*?(?:\d{4}|\d{1,2}\s+\w+\s+\d{4})[^.]*?', '', text, flags=re.IGNORECASE)
-        
-        # Pattern 2b: PDF file names and document references - MORE AGGRESSIVE
-        text = re.sub(r'[A-Z][^.]*?\.pdf', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Fund\s+Facts\s*-\s*[^.]*?\.pdf', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Presentation\s+[^.]*?\.pdf', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Leaflet\s*\([^)]+\)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\.pdf', '', text, flags=re.IGNORECASE)
-        
-        # Pattern 3: "As on 31 Oct 2025" or "As of September 2025" standalone
-        text = re.sub(r'As\s+on\s+\d{1,2}\s+\w+\s+\d{4}', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'As\s+of\s+\w+\s+\d{4}', '', text, flags=re.IGNORECASE)
-        
-        # Pattern 4: Remove standalone dates at start of line
-        text = re.sub(r'^\d{1,2}\s+\w+\s+\d{4}\s*', '', text, flags=re.MULTILINE)
-        
-        # Pattern 5: Remove "Holdings" headers with dates and "Top 10 Holdings Downloads"
-        text = re.sub(r'Holdings\s+As\s+on[^.]*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Top\s+\d+\s+Holdings\s+Downloads?', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'Downloads?\s*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        text = re.sub(r'Top\s+\d+\s+Holdings', '', text, flags=re.IGNORECASE)
-        
-        # For entity queries, remove exit load and other irrelevant info
-        if query_type == 'entity':
-            text = re.sub(r'Exit\s+Load[^.]*\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-            text = re.sub(r'In\s+respect\s+of\s+each\s+purchase[^.]*\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-            text = re.sub(r'OVERSEAS[^.]*\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-            text = re.sub(r'is\s+payable\s+if[^.]*\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-            text = re.sub(r'redeemed\s+/\s+switched-out[^.]*\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-            text = re.sub(r'within\s+\d+\s+year[^.]*\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove position/role metadata that's not relevant
-        text = re.sub(r'Last\s+Position\s+Held:\s*[^.]*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\*\s*excluding\s+[^.]*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\^\s*Cut-off\s+date[^.]*', '', text, flags=re.IGNORECASE)
-        
-        # Clean up multiple spaces and fragments
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\.\,\:\-\(\)]', '', text)  # Remove special chars except basic punctuation
-        text = text.strip()
-        
-        return text
+        # Only the entity branch differs by query type, so key the shared cache on that
+        return _clean_chunk_text_cached(text, query_type == 'entity')
     
     def _clean_context_for_entity(self, context: str) -> str:
         """Special cleaning for entity queries - removes all irrelevant info"""
-        text = context
-        # Remove all document metadata
-        text = re.sub(r'Top\s+\d+\s+Holdings.*?Downloads', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'Fund\s+Facts.*?\.pdf', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'Exit\s+Load.*?\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'OVERSEAS.*?\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'is\s+payable\s+if.*?\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'In\s+respect\s+of.*?\.', '', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Remove all document metadata (patterns whose keyword is absent are skipped)
+        text = _apply_keyword_gated_subs(context, ENTITY_CONTEXT_NOISE_SUBS)
+        return ' '.join(text.split())
     
     def _clean_answer_metadata(self, answer: str) -> str:
         """Remove metadata, SEBI circulars, and regulatory citations from answer - AGGRESSIVE"""
         if not answer:
             return answer
         
-        # Remove SEBI circular references
-        answer = re.sub(r'SEBI\s+Circular\s+No\.?\s*[A-Z0-9/]+\s+dated\s+[^,\.]+', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'CIR/\d+/\d+/\d+\s+dated\s+[^,\.]+', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'MRD/[^,\.]+dated\s+[^,\.]+', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'notifying\s+fram[^\.]*', '', answer, flags=re.IGNORECASE)
-        
-        # Remove document metadata patterns - MORE AGGRESSIVE
-        answer = re.sub(r'Top\s+\d+\s+Holdings\s+Downloads?', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'Fund\s+Facts\s*-\s*[^\.]*?\.pdf', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'Presentation\s+[^\.]*?\.pdf', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'Leaflet\s*\([^)]+\)', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'[A-Z][^\.]*?\.pdf', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'\.pdf', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'As\s+of\s+\w+\s+\d{4}', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'As\s+on\s+\d{1,2}\s+\w+\s+\d{4}', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'Downloads?\s*$', '', answer, flags=re.IGNORECASE | re.MULTILINE)
-        answer = re.sub(r'Top\s+\d+\s+Holdings', '', answer, flags=re.IGNORECASE)
-        
-        # Remove position/role metadata
-        answer = re.sub(r'Last\s+Position\s+Held:\s*[^\.]*', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'\*\s*excluding\s+[^\.]*', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'\^\s*Cut-off\s+date[^\.]*', '', answer, flags=re.IGNORECASE)
-        answer = re.sub(r'Franklin\s+Templeton[^\.]*', '', answer, flags=re.IGNORECASE)
+        # SEBI circulars, document metadata and role metadata (patterns without their keywords are skipped)
+        answer = _apply_keyword_gated_subs(answer, ANSWER_METADATA_SUBS)
         
         # Remove exit load and irrelevant info when asking about fund managers
-        if 'manager' in answer.lower() or 'manages' in answer.lower():
-            answer = re.sub(r'\s+Exit\s+Load[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+In\s+respect\s+of\s+each\s+purchase[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+OVERSEAS[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+is\s+payable\s+if[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+redeemed\s+/\s+switched-out[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\s+within\s+\d+\s+year[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            # Remove fragments like "nd Manager - Equities" or ")00%"
-            answer = re.sub(r'nd\s+Manager[^\.]*\.', '', answer, flags=re.IGNORECASE)
-            answer = re.sub(r'\)\d+%', '', answer)
-            answer = re.sub(r'Equity\s+Analyst\s+and\s+Fund\s+Manager\s+for\s+Overseas', '', answer, flags=re.IGNORECASE)
+        answer_lower = answer.lower()
+        if 'manager' in answer_lower or 'manages' in answer_lower:
+            answer = _apply_keyword_gated_subs(answer, MANAGER_ANSWER_NOISE_SUBS)
         
         # Remove trailing commas and clean up
-        answer = re.sub(r',\s*,', ',', answer)  # Remove double commas
-        answer = re.sub(r'\s+', ' ', answer)  # Multiple spaces to single
-        answer = answer.strip()
+        answer = DOUBLE_COMMA_RE.sub(',', answer)  # Remove double commas
+        answer = ' '.join(answer.split())  # Multiple spaces to single, trimmed
         
         # Remove leading/trailing punctuation artifacts and fragments
-        answer = re.sub(r'^[,\.\s]+', '', answer)
-        answer = re.sub(r'[,\.\s]+$', '', answer)
+        answer = LEADING_PUNCT_RE.sub('', answer)
+        answer = TRAILING_PUNCT_RE.sub('', answer)
         # Remove single character fragments at start
-        answer = re.sub(r'^[a-z]\s+', '', answer, flags=re.IGNORECASE)
+        answer = LEADING_LETTER_FRAGMENT_RE.sub('', answer)
         
         return answer
     
-    def _is_metadata_chunk(self, text: str) -> bool:
+    def _is_metadata_chunk(self, text: str, text_lower: Optional[str] = None) -> bool:
         """Check if chunk is just metadata/document list"""
-        text_lower = text.lower()
-        
-        # If it's mostly document names and dates, it's metadata
-        doc_patterns = [
-            r'sid\s*-\s*.*?\s+dated',
-            r'kim\s*-\s*.*?\s+dated',
-            r'leaflet.*?presentation',
-            r'fund facts.*?october',
-            r'holdings\s+as\s+on.*?downloads',
-        ]
-        
-        doc_matches = sum(1 for pattern in doc_patterns if re.search(pattern, text_lower))
-        
-        # If more than 2 document patterns, likely metadata
-        if doc_matches >= 2:
-            return True
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # If it's mostly document names and dates, it's metadata: more than 2 document patterns,
+        # or a single one in a very short chunk (stop scanning as soon as the verdict is known)
+        is_short = len(text) < 100
+        doc_matches = 0
+        for keyword, pattern in METADATA_DOC_PATTERNS:
+            if keyword in text_lower and pattern.search(text_lower):
+                doc_matches += 1
+                if doc_matches >= 2 or is_short:
+                    return True
         
         # If it's very short and contains mostly dates/document names
-        if len(text) < 100 and (doc_matches >= 1 or re.search(r'\d{1,2}\s+\w+\s+\d{4}', text_lower)):
+        if is_short and DAY_MONTH_YEAR_RE.search(text_lower):
             return True
         
         return False
     
+    def _direct_metric_answer(self, field: str, scheme_name: Optional[str]) -> Optional[Dict]:
+        """Format a metric answer straight from the direct chunk index, memoized per (field, scheme_name)"""
+        cache_key = (field, scheme_name)
+        if cache_key in self._metric_answer_cache:
+            return self._metric_answer_cache[cache_key]
+        
+        result = None
+        direct_chunk = self._get_direct_chunk_from_file(field, scheme_name)
+        if direct_chunk:
+            chunk_text = direct_chunk.get('chunk_text', '')
+            value_match = METRIC_VALUE_PATTERNS[0].search(chunk_text)
+            if value_match:
+                value = ' '.join(value_match.group(1).split())  # Strip + collapse whitespace
+                
+                # Format answer - clean and beautiful
+                field_display = FIELD_DISPLAY_NAMES.get(field, field.replace('_', ' ').title())
+                
+                scheme_name_used = scheme_name or direct_chunk.get('scheme_tag', '').replace('_', ' ')
+                if scheme_name_used:
+                    answer = f"The {field_display.lower()} for {scheme_name_used} is {value}."
+                else:
+                    answer = f"The {field_display.lower()} is {value}."
+                
+                # Format date
+                last_updated = direct_chunk.get('last_fetched_date', '2025-11-17')
+                formatted_date = self._format_date(last_updated)
+                
+                formatted_answer = answer
+                if formatted_date:
+                    formatted_answer += f"\n\nLast updated: {formatted_date}"
+                
+                source_type = direct_chunk.get('source_type', '')
+                result = {
+                    'answer': formatted_answer,
+                    'source_type': source_type,
+                    'source_id': direct_chunk.get('source_id', ''),
+                    'source_url': direct_chunk.get('source_url', ''),
+                    'refused': False,
+                    'query_type': 'metric'
+                }
+        
+        self._metric_answer_cache[cache_key] = result
+        return result
+    
+    def _load_direct_chunk_index(self) -> Dict:
+        """Index field-tagged rows of chunks_clean.jsonl once (replaces a full file scan per lookup)"""
+        from pathlib import Path
+        from rag_retriever import intern_record
+        
+        index = {
+            'by_scheme': {},     # (field, SCHEME_TAG) -> first matching chunk
+            'first_other': {},   # field -> first non-"ALL" chunk (used when no scheme given)
+            'last_all': {},      # field -> last "ALL" chunk (fallback)
+        }
+        
+        chunks_file = Path("chunks_clean/chunks_clean.jsonl")
+        if not chunks_file.exists():
+            return index
+        
+        with open(chunks_file, 'rb') as f:
+            lines = f.read().splitlines()
+        for line in lines:
+            if not line.strip():
+                continue
+            row = _json_loads(line)
+            # Lookups always name a field, so rows without one can never be returned
+            if not row.get('field'):
+                continue
+            # Intern keys and enumerated values (rows are long-lived and looked up per metric query)
+            chunk = intern_record(row)
+            chunk_field = chunk['field']
+            chunk_scheme = chunk.get('scheme_tag', '').upper()
+            
+            if chunk_scheme == 'ALL':
+                index['last_all'][chunk_field] = chunk
+            else:
+                index['by_scheme'].setdefault((chunk_field, chunk_scheme), chunk)
+                index['first_other'].setdefault(chunk_field, chunk)
+        
+        return index
+    
     def _get_direct_chunk_from_file(self, field: str, scheme_name: Optional[str] = None) -> Optional[Dict]:
         """Directly load chunk from chunks_clean.jsonl file (bypasses retrieval)"""
         try:
-            import json
-            from pathlib import Path
-            
-            chunks_file = Path("chunks_clean/chunks_clean.jsonl")
-            if not chunks_file.exists():
-                return None
+            if self._direct_chunk_index is None:
+                self._direct_chunk_index = self._load_direct_chunk_index()
+            index = self._direct_chunk_index
             
             # Map scheme_name to scheme_tag
             scheme_tag = None
             if scheme_name:
-                scheme_name_lower = scheme_name.lower()
-                if 'large cap' in scheme_name_lower:
-                    scheme_tag = 'LARGE_CAP'
-                elif 'flexi cap' in scheme_name_lower:
-                    scheme_tag = 'FLEXI_CAP'
-                elif 'elss' in scheme_name_lower or 'taxsaver' in scheme_name_lower or 'tax saver' in scheme_name_lower:
-                    scheme_tag = 'ELSS'
-                elif 'hybrid' in scheme_name_lower:
-                    scheme_tag = 'HYBRID'
-            
-            # Read chunks file and find matching chunk
-            # Priority: scheme-specific chunks first, then "ALL" chunks
-            scheme_specific_chunk = None
-            all_chunk = None
-            
-            with open(chunks_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    chunk = json.loads(line)
-                    chunk_field = chunk.get('field', '')
-                    chunk_scheme = chunk.get('scheme_tag', '')
-                    
-                    # Match field
-                    if chunk_field == field:
-                        if scheme_tag and chunk_scheme.upper() == scheme_tag.upper():
-                            # Found scheme-specific chunk - return immediately
-                            return chunk
-                        elif chunk_scheme.upper() == 'ALL':
-                            # Store "ALL" chunk as fallback
-                            all_chunk = chunk
-                        elif not scheme_tag:
-                            # No scheme specified, return first match
-                            return chunk
+                scheme_tag = _scheme_tag_from_name_lower(scheme_name.lower())
             
-            # If no scheme-specific chunk found, return "ALL" chunk if available
-            if all_chunk:
-                return all_chunk
+            # Priority: scheme-specific chunk first (or first match if no scheme), then "ALL" chunk
+            if scheme_tag:
+                chunk = index['by_scheme'].get((field, scheme_tag))
+            else:
+                chunk = index['first_other'].get(field)
             
-            return None
+            return chunk or index['last_all'].get(field)
         except Exception as e:
             import logging
             logging.getLogger(__name__).warning(f"Direct chunk lookup failed: {e}")
@@ -3296,56 +3721,33 @@ Respond in JSON:
         query_lower = query.lower()
         
         # Determine scheme from query
-        scheme_name = None
-        overview_file = None
-        
-        if 'flexi cap' in query_lower:
-            scheme_name = "HDFC Flexi Cap Fund"
-            overview_file = "data_processed/amc_flexicap_overview.txt"
-        elif 'large cap' in query_lower:
-            scheme_name = "HDFC Large Cap Fund"
-            overview_file = "data_processed/amc_largecap_overview.txt"
-        elif 'elss' in query_lower or 'taxsaver' in query_lower:
-            scheme_name = "HDFC TaxSaver (ELSS)"
-            overview_file = "data_processed/amc_elss_overview.txt"
-        elif 'hybrid' in query_lower:
-            scheme_name = "HDFC Hybrid Equity Fund"
-            overview_file = "data_processed/amc_hybrid_overview.txt"
-        else:
-            return None
-        
-        if not overview_file:
+        scheme_name = _scheme_name_from_query_lower(query_lower)
+        if not scheme_name:
             return None
         
+        # Result depends only on the scheme's overview file, so lookalike queries share one read
+        if scheme_name not in self._manager_answer_cache:
+            self._manager_answer_cache[scheme_name] = self._read_manager_from_overview(
+                scheme_name, SCHEME_OVERVIEW_FILES[scheme_name]
+            )
+        return self._manager_answer_cache[scheme_name]
+    
+    def _read_manager_from_overview(self, scheme_name: str, overview_file: str) -> Optional[str]:
+        """Read an overview file and format its first listed fund manager"""
         try:
-            # Read overview file and search for manager
-            with open(overview_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read overview file (cached) and search for manager
+            content = _read_overview_text(overview_file)
             
             # Look for manager patterns - prioritize first manager listed (usually Senior Fund Manager)
             # Pattern 1: "Fund Managers\nMs. Roshi Jain\nSenior Fund Manager"
-            pattern1 = r'Fund\s+Managers?\s+(?:Ms\.|Mr\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)'
-            match1 = re.search(pattern1, content, re.IGNORECASE | re.MULTILINE)
-            if match1:
-                name = match1.group(1).strip()
-                if len(name.split()) == 2 and all(len(word) > 2 for word in name.split()):
-                    return f"The **Fund Manager** of **{scheme_name}** is **{name}**."
-            
             # Pattern 2: "Ms. Roshi Jain\nSenior Fund Manager"
-            pattern2 = r'(?:Ms\.|Mr\.|Mrs\.|Dr\.)\s*([A-Z][a-z]+\s+[A-Z][a-z]+)\s*\n\s*Senior\s+Fund\s+Manager'
-            match2 = re.search(pattern2, content, re.IGNORECASE | re.MULTILINE)
-            if match2:
-                name = match2.group(1).strip()
-                if len(name.split()) == 2 and all(len(word) > 2 for word in name.split()):
-                    return f"The **Fund Manager** of **{scheme_name}** is **{name}**."
-            
             # Pattern 3: Fallback - any name followed by "Fund Manager"
-            pattern3 = r'(?:Ms\.|Mr\.|Mrs\.|Dr\.)?\s*([A-Z][a-z]+\s+[A-Z][a-z]+)[^.]*?(?:Senior\s+)?Fund\s+Manager'
-            match3 = re.search(pattern3, content, re.IGNORECASE | re.DOTALL)
-            if match3:
-                name = match3.group(1).strip()
-                if len(name.split()) == 2 and all(len(word) > 2 for word in name.split()):
-                    return f"The **Fund Manager** of **{scheme_name}** is **{name}**."
+            for pattern in OVERVIEW_MANAGER_PATTERNS:
+                match = pattern.search(content)
+                if match:
+                    name = match.group(1).strip()
+                    if len(name.split()) == 2 and all(len(word) > 2 for word in name.split()):
+                        return f"The **Fund Manager** of **{scheme_name}** is **{name}**."
         except Exception as e:
             # If file read fails, return None
             pass
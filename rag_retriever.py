@@ -2,17 +2,42 @@
 RAG Retriever - Handles vector search and chunk retrieval with hybrid search
 Enhanced with hierarchical retrieval (Scheme → Section → Chunk)
 """
-import json
+import heapq
 import re
+import sys
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import List, Optional, Dict, Tuple
 import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
 from query_classifier import QueryClassifier
 from reranker import Reranker
-from constants import SCHEME_TAG_MAP, FIELD_FILTER_THRESHOLD, SOURCE_AUTHORITY
+from constants import SCHEME_TAG_MAP, FIELD_FILTER_THRESHOLD, SOURCE_AUTHORITY, IVF_DEFAULT_NPROBE, IVF_NPROBE_BY_QUERY_TYPE
+from constants import json_loads as _json_loads
+
+# Per-query-type boost patterns, scored once per chunk in _precompute_scoring_features
+ENTITY_ROLE_RE = re.compile(r'\b(fund manager|manager|investment manager|name|tenure)\b', re.IGNORECASE)
+PROPER_NAME_RE = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b')
+METRIC_NUMBER_RE = re.compile(r'\b(expense|ter|exit load|sip|minimum|lock-in)\b.*\d+|\d+.*\b(expense|ter|exit load|sip|minimum|lock-in)\b', re.IGNORECASE)
+LIST_DATA_RE = re.compile(r'\d+%|\d+\.\d+%|top\s+\d+', re.IGNORECASE)
+DECIMAL_NUMBER_RE = re.compile(r'\d+\.\d+')
+
+# Low-cardinality metadata values shared across many chunks
+INTERNED_FIELDS = ('source_id', 'authority', 'scheme_tag', 'source_type', 'field', 'snippet_keyword', 'last_fetched_date')
+
+
+def intern_record(record: Dict) -> Dict:
+    """Intern JSON-decoded keys and enumerated values so dict lookups and comparisons hit the identity fast path"""
+    record = {sys.intern(key): value for key, value in record.items()}
+    for field in INTERNED_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str):
+            record[field] = sys.intern(value)
+    return record
 
 
 class RAGRetriever:
@@ -22,18 +47,22 @@ class RAGRetriever:
         self.metadata_path = self.embeddings_dir / "faiss_metadata.json"
         
         print("Loading FAISS index...")
-        self.index = faiss.read_index(str(self.index_path))
+        # Memory-map the stored vector codes instead of copying them onto the heap (flag absent in older faiss builds)
+        self.index = faiss.read_index(str(self.index_path), getattr(faiss, 'IO_FLAG_MMAP_IFC', 0))
+        # IVF view of the index if it was built as IVF-PQ (None for exact flat search)
+        self.ivf_index = faiss.try_extract_index_ivf(self.index)
         
         print("Loading metadata...")
-        with open(self.metadata_path) as f:
-            self.metadata = json.load(f)
+        with open(self.metadata_path, 'rb') as f:
+            self.metadata = [intern_record(meta) for meta in _json_loads(f.read())]
         
-        print("Loading embedding model...")
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Embedding model and re-ranker load lazily on first use (see the cached properties below)
+        # Per-instance LRU over query embeddings (repeat queries skip the transformer forward pass)
+        self._encode_normalized_query = lru_cache(maxsize=1024)(self._encode_normalized_query)
         
         print("Loading source URL mapping...")
-        with open("data_raw/sources_loaded.json") as f:
-            sources = json.load(f)
+        with open("data_raw/sources_loaded.json", 'rb') as f:
+            sources = _json_loads(f.read())
         self.source_url_map = {s['source_id']: s['source_url'] for s in sources}
         
         # Initialize query classifier
@@ -45,13 +74,35 @@ class RAGRetriever:
         # Build index maps for fast hierarchical filtering
         self._build_index_maps()
         
-        # Initialize re-ranker (optional, can be disabled if model not available)
-        self.reranker = Reranker()
-        self.use_reranker = self.reranker.model_loaded
+        # Precompute lowercase text and token sets once (chunk text is immutable after indexing)
+        self._precompute_text_features()
+        
+        # Precompute query-independent scoring terms (source authority, per-type boosts) per chunk
+        self._precompute_scoring_features()
+        
+        # Keyword -> {chunk position: score contribution}; boost keywords come from a fixed vocabulary, so this stays small
+        self.keyword_postings = {}
         
         print(f"✓ Retriever ready: {self.index.ntotal} vectors indexed")
-        if self.use_reranker:
+    
+    @cached_property
+    def embedding_model(self) -> SentenceTransformer:
+        """Query encoder, loaded on the first query that misses the embedding cache"""
+        print("Loading embedding model...")
+        return SentenceTransformer('all-MiniLM-L6-v2')
+    
+    @cached_property
+    def reranker(self) -> Reranker:
+        """Cross-encoder re-ranker (optional, disabled if model not available), loaded the first time re-ranking is requested"""
+        reranker = Reranker()
+        if reranker.model_loaded:
             print("✓ Re-ranker enabled for improved retrieval quality")
+        return reranker
+    
+    @property
+    def use_reranker(self) -> bool:
+        """Whether the re-ranker model is available (loads it on first check)"""
+        return self.reranker.model_loaded
     
     def _build_index_maps(self):
         """Build maps for hierarchical retrieval (scheme → field → indices)"""
@@ -82,6 +133,88 @@ class RAGRetriever:
                 if source_id not in self.source_indices:
                     self.source_indices[source_id] = []
                 self.source_indices[source_id].append(idx)
+        
+        # Boolean masks over chunk positions: retrieve() combines these into the ID selector that restricts the FAISS search
+        n_chunks = len(self.metadata)
+        self.scheme_masks = {tag: self._indices_mask(indices, n_chunks) for tag, indices in self.scheme_indices.items()}
+        self.field_masks = {key: self._indices_mask(indices, n_chunks) for key, indices in self.field_indices.items()}
+        self.all_mask = np.ones(n_chunks, dtype=bool)
+        self.all_mask.setflags(write=False)
+    
+    @staticmethod
+    def _indices_mask(indices: List[int], size: int) -> np.ndarray:
+        """Read-only boolean mask with True at the given positions"""
+        mask = np.zeros(size, dtype=bool)
+        mask[indices] = True
+        mask.setflags(write=False)
+        return mask
+    
+    def _precompute_text_features(self):
+        """Cache lowercase text, token set and overview-injection digit checks on each metadata entry"""
+        # Column lists (indexed by chunk position) for the fields the scoring loop reads on every hit
+        self.texts_lower = []
+        self.text_fingerprints = []
+        for meta in self.metadata:
+            text = meta['text']
+            text_lower = text.lower()
+            self.texts_lower.append(text_lower)
+            self.text_fingerprints.append(text[:100])  # First 100 chars identify duplicate chunks
+            meta['_text_lower'] = text_lower
+            meta['_token_set'] = frozenset(text_lower.split())
+            # Digit/decimal flags for the whole text and its first 300 chars (overview injection heuristics)
+            head = text[:300]
+            meta['_has_digit'] = any(char.isdigit() for char in text)
+            meta['_head_has_digit'] = any(char.isdigit() for char in head)
+            meta['_head_has_decimal'] = bool(DECIMAL_NUMBER_RE.search(head))
+    
+    def _precompute_scoring_features(self):
+        """Score source authority and per-query-type boosts for every chunk once; both depend only on chunk text and source"""
+        self.source_scores = []
+        self.type_boosts = {'entity': [], 'metric': [], 'list': []}
+        for meta in self.metadata:
+            text = meta['text']
+            text_lower = meta['_text_lower']
+            source_id = meta['source_id']
+            self.source_scores.append(self._get_source_authority_score(source_id))
+            
+            # Entity: boost chunks with names, titles, "Fund Manager" mentions, and person names
+            type_boost = 0.0
+            if ENTITY_ROLE_RE.search(text):
+                type_boost += 0.2
+            if PROPER_NAME_RE.search(text):
+                type_boost += 0.15
+            self.type_boosts['entity'].append(type_boost)
+            
+            # Metric: boost chunks with numbers near metric keywords, and overview sources for current metrics
+            type_boost = 0.0
+            if METRIC_NUMBER_RE.search(text):
+                type_boost += 0.2
+            if 'overview' in source_id:
+                type_boost += 0.1
+            self.type_boosts['metric'].append(type_boost)
+            
+            # List: boost chunks with structured data (numbers, lists, percentages)
+            type_boost = 0.0
+            if LIST_DATA_RE.search(text):
+                type_boost += 0.15
+            if 'portfolio' in text_lower or 'holdings' in text_lower:
+                type_boost += 0.1
+            self.type_boosts['list'].append(type_boost)
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Unit-norm float32 query embedding of shape (1, d), cached per normalized query"""
+        # all-MiniLM-L6-v2 uses an uncased tokenizer that ignores runs of whitespace, so
+        # case and spacing variants of a query share one embedding
+        return self._encode_normalized_query(' '.join(query.lower().split()))
+    
+    def _encode_normalized_query(self, normalized_query: str) -> np.ndarray:
+        """Encode one normalized query (wrapped in an LRU cache in __init__)"""
+        query_vector = np.ascontiguousarray(
+            self.embedding_model.encode([normalized_query], normalize_embeddings=True), dtype='float32'
+        )
+        # Cached arrays are shared between calls, so guard against in-place modification
+        query_vector.setflags(write=False)
+        return query_vector
     
     def _identify_scheme_from_query(self, query: str) -> Optional[str]:
         """Identify scheme from query (hierarchical step 1)"""
@@ -119,18 +252,28 @@ class RAGRetriever:
         
         return None
     
-    def _calculate_keyword_score(self, text: str, keywords: List[str]) -> float:
-        """Calculate BM25-style keyword matching score"""
-        text_lower = text.lower()
+    def _get_keyword_postings(self, keyword_lower: str) -> Dict[int, float]:
+        """Chunk position -> keyword score contribution for every chunk containing the keyword (built on first use)"""
+        postings = self.keyword_postings.get(keyword_lower)
+        if postings is None:
+            postings = {}
+            for idx, text_lower in enumerate(self.texts_lower):
+                # Count occurrences
+                count = text_lower.count(keyword_lower)
+                if count > 0:
+                    # BM25-like scoring: more occurrences = higher score, but with diminishing returns
+                    postings[idx] = count * (1.0 / (1.0 + count * 0.5))
+            self.keyword_postings[keyword_lower] = postings
+        return postings
+    
+    def _calculate_keyword_score(self, idx: int, keyword_postings: List[Dict[int, float]]) -> float:
+        """Calculate BM25-style keyword matching score for one chunk from the query keywords' postings"""
         score = 0.0
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            # Count occurrences
-            count = text_lower.count(keyword_lower)
-            if count > 0:
-                # BM25-like scoring: more occurrences = higher score, but with diminishing returns
-                score += count * (1.0 / (1.0 + count * 0.5))
+        for postings in keyword_postings:
+            contribution = postings.get(idx)
+            if contribution is not None:
+                score += contribution
         
         return score
     
@@ -161,16 +304,79 @@ class RAGRetriever:
         Returns:
             List of dicts with 'text', 'source_id', 'source_url', 'authority', 'similarity'
         """
+        plan = self._plan_search(query, top_k, use_hierarchical)
+        
+        # Vector search
+        query_vector = self._encode_query(query)
+        distances, indices = self._search(query_vector, plan['search_k'], plan['nprobe'], plan['search_mask'])
+        
+        return self._rank_hits(query, plan, distances, indices, top_k, include_overview, use_reranking)
+    
+    def retrieve_batch(self, queries: List[str], top_k: int = 3, include_overview: bool = True, use_hierarchical: bool = True, use_reranking: bool = True) -> List[List[Dict]]:
+        """Retrieve for several queries at once, batching the FAISS searches of queries that share search settings"""
+        if not queries:
+            return []
+        
+        plans = [self._plan_search(query, top_k, use_hierarchical) for query in queries]
+        query_vectors = np.vstack([self._encode_query(query) for query in queries])
+        
+        # Queries sharing a candidate mask (e.g. the same scheme) and nprobe share one restricted search, so every
+        # query scans exactly the vectors (and IVF lists) that retrieve() would scan for it
+        search_groups = {}
+        for row, plan in enumerate(plans):
+            search_groups.setdefault((id(plan['search_mask']), plan['nprobe']), []).append(row)
+        
+        hits = [None] * len(queries)
+        for (_, nprobe), rows in search_groups.items():
+            group_plans = [plans[row] for row in rows]
+            # One search at the widest k; hits come back best-first over the same scanned set, so each row's
+            # prefix is its own top-k (only the order of exactly tied scores at the cut-off can differ)
+            max_search_k = max(plan['search_k'] for plan in group_plans)
+            distances, indices = self._search(query_vectors[rows], max_search_k, nprobe, group_plans[0]['search_mask'])
+            for position, row in enumerate(rows):
+                search_k = plans[row]['search_k']
+                hits[row] = (distances[position:position + 1, :search_k], indices[position:position + 1, :search_k])
+        
+        def rank(row: int) -> List[Dict]:
+            distances, indices = hits[row]
+            return self._rank_hits(queries[row], plans[row], distances, indices, top_k, include_overview, use_reranking)
+        
+        # Cross-encoder re-ranking dominates per-query cost (and releases the GIL), so run it concurrently
+        if use_reranking and len(queries) > 1 and self.use_reranker:
+            with ThreadPoolExecutor(max_workers=min(len(queries), 4)) as executor:
+                return list(executor.map(rank, range(len(queries))))
+        return [rank(row) for row in range(len(queries))]
+    
+    def _search(self, query_vectors: np.ndarray, search_k: int, nprobe: int, search_mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """FAISS search over the chunks in search_mask (None = all); IVF indexes probe nprobe inverted lists"""
+        selector = None
+        if search_mask is not None:
+            # Bit i set = chunk i is a candidate; FAISS skips distance computations for everything else
+            bitmap = np.packbits(search_mask, bitorder='little')
+            selector = faiss.IDSelectorBitmap(len(search_mask), faiss.swig_ptr(bitmap))
+        
+        if self.ivf_index is not None:
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=nprobe)
+        elif selector is not None:
+            params = faiss.SearchParameters(sel=selector)
+        else:
+            return self.index.search(query_vectors, search_k)
+        return self.index.search(query_vectors, search_k, params=params)
+    
+    def _plan_search(self, query: str, top_k: int, use_hierarchical: bool) -> Dict:
+        """Classify the query and work out its hierarchical candidate mask and FAISS search breadth"""
         # Classify query
         query_type = self.query_classifier.classify(query)
         query_lower = query.lower()
         
         # Get expanded keywords for boosting (synonyms + type-specific)
         boost_keywords = self.query_classifier.get_expanded_keywords(query)
+        # Lowercase once per query rather than once per keyword per candidate
+        boost_keywords_lower = [keyword.lower() for keyword in boost_keywords]
         
         # HIERARCHICAL STEP 1: Identify scheme
         scheme_tag = None
-        candidate_indices = None
+        candidate_mask = None
         
         if use_hierarchical:
             scheme_tag = self._identify_scheme_from_query(query)
@@ -178,14 +384,14 @@ class RAGRetriever:
             # Map to actual scheme tags used in metadata (from constants)
             actual_scheme_tag = SCHEME_TAG_MAP.get(scheme_tag, scheme_tag) if scheme_tag else None
             
-            if actual_scheme_tag and actual_scheme_tag in self.scheme_indices:
-                candidate_indices = set(self.scheme_indices[actual_scheme_tag])
+            if actual_scheme_tag and actual_scheme_tag in self.scheme_masks:
+                candidate_mask = self.scheme_masks[actual_scheme_tag]
             elif scheme_tag:
                 # Scheme identified but not in index - might be "ALL" or missing, search all
-                candidate_indices = set(range(len(self.metadata)))
+                candidate_mask = self.all_mask
             else:
                 # No scheme identified, search all chunks
-                candidate_indices = set(range(len(self.metadata)))
+                candidate_mask = self.all_mask
         
         # HIERARCHICAL STEP 2: Identify field (for metric queries)
         if use_hierarchical and query_type == 'metric' and actual_scheme_tag:
@@ -195,29 +401,23 @@ class RAGRetriever:
                 # Use the actual scheme tag (LARGE_CAP format)
                 field_key = (actual_scheme_tag, field)
                 
-                field_indices = None
-                if field_key in self.field_indices:
-                    field_indices = set(self.field_indices[field_key])
+                field_indices = self.field_indices.get(field_key)
                 
                 if field_indices and len(field_indices) > 0:
                     # Only filter if we have enough chunks (threshold from constants)
                     if len(field_indices) >= FIELD_FILTER_THRESHOLD:
-                        candidate_indices = candidate_indices & field_indices
+                        candidate_mask = candidate_mask & self.field_masks[field_key]
                     # else: Too few field-specific chunks, use scheme-level only
                 else:
                     # Field not found for this scheme, also check "ALL" scheme
                     all_field_key = ('ALL', field)
                     if all_field_key in self.field_indices:
-                        all_field_indices = set(self.field_indices[all_field_key])
+                        all_field_indices = self.field_indices[all_field_key]
                         if len(all_field_indices) > 0:
                             # Add "ALL" chunks to candidate set
-                            candidate_indices = candidate_indices | all_field_indices
+                            candidate_mask = candidate_mask | self.field_masks[all_field_key]
         
-        # Vector search
-        query_vector = self.embedding_model.encode(
-            [query], 
-            normalize_embeddings=True
-        ).astype('float32')
+        candidate_count = int(np.count_nonzero(candidate_mask)) if candidate_mask is not None else 0
         
         # Adjust search breadth based on query type
         if query_type == 'entity':
@@ -229,76 +429,61 @@ class RAGRetriever:
         else:
             search_k = min(top_k * 3, 25)
         
-        # If hierarchical filtering, search more broadly then filter
-        if use_hierarchical and candidate_indices:
-            # Search more chunks, then filter
+        # If hierarchical filtering, search more broadly within the candidates
+        if use_hierarchical and candidate_count:
             search_k = min(search_k * 2, len(self.metadata))
         
-        distances, indices = self.index.search(query_vector, search_k)
+        # Only pass a selector to FAISS when the mask actually excludes chunks
+        search_mask = candidate_mask if use_hierarchical and 0 < candidate_count < len(self.metadata) else None
+        
+        return {
+            'query_type': query_type,
+            'query_lower': query_lower,
+            'boost_keywords_lower': boost_keywords_lower,
+            'search_k': search_k,
+            'search_mask': search_mask,
+            'nprobe': IVF_NPROBE_BY_QUERY_TYPE.get(query_type, IVF_DEFAULT_NPROBE)
+        }
+    
+    def _rank_hits(self, query: str, plan: Dict, distances: np.ndarray, indices: np.ndarray, top_k: int, include_overview: bool, use_reranking: bool):
+        """Hybrid-score and (optionally) re-rank the FAISS hits for one query"""
+        query_type = plan['query_type']
+        query_lower = plan['query_lower']
+        boost_keywords_lower = plan['boost_keywords_lower']
         
         # Check if search returned results
         if distances.size == 0 or indices.size == 0 or len(distances[0]) == 0 or len(indices[0]) == 0:
             return []
         
-        # Apply hierarchical filtering if enabled
-        if use_hierarchical and candidate_indices and len(candidate_indices) < len(self.metadata):
-            filtered_results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx in candidate_indices:
-                    filtered_results.append((dist, idx))
-            
-            if filtered_results:
-                # Re-sort filtered results
-                filtered_results.sort(key=lambda x: x[0], reverse=True)
-                distances = np.array([[d for d, _ in filtered_results[:search_k]]])
-                indices = np.array([[i for _, i in filtered_results[:search_k]]])
-            # else: Fallback - hierarchical filtering too strict, use all results from search
-        
         seen_indices = set()
         seen_texts = set()  # Avoid duplicate text chunks
         
         # Hybrid scoring: vector similarity + keyword matching + source authority
-        scored_results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            meta = self.metadata[idx]
-            text = meta['text']
-            text_snippet = text[:100]  # Use first 100 chars as fingerprint
+        source_scores = self.source_scores
+        type_boosts = self.type_boosts.get(query_type)
+        keyword_postings = [self._get_keyword_postings(keyword) for keyword in boost_keywords_lower]
+        text_fingerprints = self.text_fingerprints
+        scored_hits = []
+        for dist, idx in zip(distances[0].tolist(), indices[0].tolist()):
+            if idx < 0:
+                continue  # FAISS pads with -1 when fewer than k chunks are eligible (restricted or IVF search)
+            text_snippet = text_fingerprints[idx]
             
             # Skip if we've seen this exact text before (duplicate chunk)
             if text_snippet in seen_texts:
                 continue
             
             # Vector similarity score (cosine distance, higher is better)
-            vector_score = float(dist)
+            vector_score = dist
             
             # Keyword matching score (BM25-style)
-            keyword_score = self._calculate_keyword_score(text, boost_keywords)
+            keyword_score = self._calculate_keyword_score(idx, keyword_postings)
             
-            # Source authority score
-            source_score = self._get_source_authority_score(meta['source_id'])
+            # Source authority score (precomputed per chunk)
+            source_score = source_scores[idx]
             
-            # Special boosts for query types
-            type_boost = 0.0
-            if query_type == 'entity':
-                # Boost chunks with names, titles, "Fund Manager" mentions
-                if re.search(r'\b(fund manager|manager|investment manager|name|tenure)\b', text, re.IGNORECASE):
-                    type_boost += 0.2
-                # Boost if contains person names (capitalized words that might be names)
-                if re.search(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b', text):
-                    type_boost += 0.15
-            elif query_type == 'metric':
-                # Boost chunks with numbers near metric keywords
-                if re.search(r'\b(expense|ter|exit load|sip|minimum|lock-in)\b.*\d+|\d+.*\b(expense|ter|exit load|sip|minimum|lock-in)\b', text, re.IGNORECASE):
-                    type_boost += 0.2
-                # Boost overview sources for current metrics
-                if 'overview' in meta['source_id']:
-                    type_boost += 0.1
-            elif query_type == 'list':
-                # Boost chunks with structured data (numbers, lists, percentages)
-                if re.search(r'\d+%|\d+\.\d+%|top\s+\d+', text, re.IGNORECASE):
-                    type_boost += 0.15
-                if 'portfolio' in text.lower() or 'holdings' in text.lower():
-                    type_boost += 0.1
+            # Special boosts for query types (precomputed per chunk; 0.0 for other types)
+            type_boost = type_boosts[idx] if type_boosts is not None else 0.0
             
             # Combined relevance score
             # Weight: vector (0.5) + keywords (0.3) + source (0.15) + type boost (0.05)
@@ -309,50 +494,36 @@ class RAGRetriever:
                 type_boost * 0.2
             )
             
-            scored_results.append({
-                'text': text,
-                'chunk_text': text,  # Also include as chunk_text for compatibility
+            # Keep just the scores and position; result dicts are built only for the selected candidates
+            scored_hits.append((relevance_score, vector_score, idx))
+            seen_texts.add(text_snippet)
+            seen_indices.add(idx)
+        
+        # Take top_k results by combined relevance score (or more if re-ranking will be applied);
+        # nlargest matches a stable descending sort + slice without ordering the discarded tail
+        candidate_count = top_k * 2 if use_reranking and self.use_reranker else top_k
+        results = []
+        for relevance_score, vector_score, idx in heapq.nlargest(candidate_count, scored_hits, key=itemgetter(0)):
+            meta = self.metadata[idx]
+            results.append({
+                'text': meta['text'],
+                'chunk_text': meta['text'],  # Also include as chunk_text for compatibility
                 'source_id': meta['source_id'],
                 'source_url': self.source_url_map.get(meta['source_id'], ''),
                 'authority': meta.get('authority', ''),
                 'scheme_tag': meta['scheme_tag'],
                 'field': meta.get('field', ''),  # Include field for direct lookup
-                'snippet_keyword': meta.get('snippet_keyword', ''),
                 'source_type': meta.get('source_type', ''),
                 'last_fetched_date': meta.get('last_fetched_date', ''),
+                'snippet_keyword': meta.get('snippet_keyword', ''),
                 'similarity': vector_score,
                 'relevance_score': relevance_score,
-                'keyword_score': keyword_score,
-                'index': idx
-            })
-            seen_texts.add(text_snippet)
-            seen_indices.add(idx)
-        
-        # Sort by combined relevance score
-        scored_results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        # Take top_k results (or more if re-ranking will be applied)
-        candidate_count = top_k * 2 if use_reranking and self.use_reranker else top_k
-        results = []
-        for result in scored_results[:candidate_count]:
-            results.append({
-                'text': result['text'],
-                'chunk_text': result.get('chunk_text', result['text']),  # Include chunk_text
-                'source_id': result['source_id'],
-                'source_url': result['source_url'],
-                'authority': result['authority'],
-                'scheme_tag': result['scheme_tag'],
-                'field': result.get('field', ''),  # Include field for direct lookup
-                'source_type': result.get('source_type', ''),
-                'last_fetched_date': result.get('last_fetched_date', ''),
-                'snippet_keyword': result['snippet_keyword'],
-                'similarity': result['similarity'],
-                'relevance_score': result['relevance_score']
+                '_text_lower': meta['_text_lower'],
+                '_token_set': meta['_token_set']
             })
         
         # For metric queries, also include overview chunks that might have the actual values
         if include_overview:
-            query_lower = query.lower()
             is_metric_query = any(term in query_lower for term in ['expense ratio', 'ter', 'exit load', 'sip', 'lock-in'])
             
             if is_metric_query:
@@ -368,21 +539,22 @@ class RAGRetriever:
                     fund_name = 'hybrid'
                 
                 if fund_name:
-                    # Search for overview chunks from this fund that contain the metric
+                    # Search for overview chunks from this fund that contain the metric (source index, in order)
                     overview_source = f'amc_{fund_name}_overview'
-                    for idx, meta in enumerate(self.metadata):
-                        if idx not in seen_indices and meta['source_id'] == overview_source:
-                            chunk_text_lower = meta['text'].lower()
+                    for idx in self.source_indices.get(overview_source, ()):
+                        meta = self.metadata[idx]
+                        if idx not in seen_indices:
+                            chunk_text_lower = meta['_text_lower']
                             # Check if this chunk has the metric we're looking for
                             if 'expense' in query_lower or 'ter' in query_lower:
                                 # Look for chunks with "Total Expense Ratio" or TER followed by a number
-                                has_ter_pattern = ('total expense ratio' in chunk_text_lower or 'ter' in chunk_text_lower) and any(char.isdigit() for char in meta['text'])
+                                has_ter_pattern = ('total expense ratio' in chunk_text_lower or 'ter' in chunk_text_lower) and meta['_has_digit']
                                 # Or chunks that contain common expense ratio values (like 0.97, 1.5, etc.)
-                                has_expense_value = 'expense' in chunk_text_lower and any(char.isdigit() for char in meta['text'][:300])
+                                has_expense_value = 'expense' in chunk_text_lower and meta['_head_has_digit']
                                 
                                 if has_ter_pattern or has_expense_value:
                                     # Prefer chunks that have both TER/expense AND a decimal number (likely the actual ratio)
-                                    has_decimal = bool(re.search(r'\d+\.\d+', meta['text'][:300]))
+                                    has_decimal = meta['_head_has_decimal']
                                     if has_decimal or 'total expense ratio' in chunk_text_lower:
                                         results.append({
                                             'text': meta['text'],
@@ -395,7 +567,9 @@ class RAGRetriever:
                                             'source_type': meta.get('source_type', ''),
                                             'last_fetched_date': meta.get('last_fetched_date', ''),
                                             'snippet_keyword': meta['snippet_keyword'],
-                                            'similarity': 0.5  # Lower similarity since it's added manually
+                                            'similarity': 0.5,  # Lower similarity since it's added manually
+                                            '_text_lower': meta['_text_lower'],
+                                            '_token_set': meta['_token_set']
                                         })
                                         seen_indices.add(idx)
                                         break  # Just add one overview chunk
@@ -3,7 +3,7 @@ Main RAG System - Combines retrieval and Q&A
 """
 from rag_retriever import RAGRetriever
 from rag_qa import RAGQA
-from rag_qa_llm import RAGQALLM
+from rag_qa_llm import RAGQALLM, UNRELATED_TOPIC_ANSWER
 from conversation_manager import ConversationManager
 from safety_filters import SafetyFilters
 from access_control import AccessControl, UserRole
@@ -13,12 +13,36 @@ from access_control import AccessControl, UserRole
 # from proactive_assistant import ProactiveAssistant
 from typing import Optional
 import os
+import re
 
 # Load config from environment variables only (security best practice)
 # Do NOT load from config.py file to avoid exposing API keys
 DEFAULT_USE_LLM = os.getenv("USE_LLM", "true").lower() == "true" if os.getenv("USE_LLM") else None
 DEFAULT_LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gemini")
 
+# Clearly unrelated queries (president, politics, general knowledge, etc.), one alternation scanned once per query
+UNRELATED_QUERY_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'president\s+of\s+(india|usa|america|united\s+states|us|u\.s\.)',
+    r'prime\s+minister\s+of',
+    r'capital\s+of\s+(india|delhi|mumbai|bangalore)',
+    r'who\s+is\s+(?:the\s+)?(president|prime\s+minister|ceo)\s+of',
+    r'weather\s+in',
+    r'news\s+about',
+    r'sports\s+(score|match|game)',
+    r'(movie|film)\s+(review|rating)',
+    r'recipe\s+for',
+)), re.IGNORECASE)
+WHO_IS_RE = re.compile(r'who\s+is\s+(?:the\s+)?(\w+)')
+WHO_IS_MF_ROLES = frozenset(['manager', 'fund', 'portfolio', 'investment'])
+WHO_IS_UNRELATED_ROLES = frozenset(['president', 'prime', 'minister', 'ceo', 'king', 'queen', 'leader'])
+
+# Mutual-fund keywords (plain substrings, as matched by `kw in query_lower`)
+MF_KEYWORD_RE = re.compile('|'.join(re.escape(keyword) for keyword in (
+    'mutual fund', 'fund', 'scheme', 'hdfc', 'elss', 'sip', 'nav', 'expense ratio',
+    'exit load', 'redemption', 'investment', 'portfolio', 'manager', 'benchmark',
+    'riskometer', 'lock-in', 'lockin', 'minimum', 'allotment', 'units', 'groww'
+)))
+
 # Validate API keys are set
 if DEFAULT_USE_LLM:
     if DEFAULT_LLM_PROVIDER == "gemini" and not os.getenv("GEMINI_API_KEY"):
@@ -64,7 +88,7 @@ class RAGSystem:
         if use_llm:
             if not api_key:
                 api_key = os.getenv("OPENAI_API_KEY") if llm_provider == "openai" else os.getenv("GEMINI_API_KEY")
-            self.qa = RAGQALLM(llm_provider=llm_provider, api_key=api_key)
+            self.qa = RAGQALLM(llm_provider=llm_provider, api_key=api_key, retriever=self.retriever)
         else:
             self.qa = RAGQA()
         
@@ -103,49 +127,28 @@ class RAGSystem:
         self.conversation_manager.add_message(session_id, 'user', user_query)
         
         # FIRST: Check for unrelated queries BEFORE retrieving chunks (early exit)
-        import re
         query_lower = user_query.lower()
         
-        # Check for clearly unrelated queries (president, politics, general knowledge, etc.)
-        unrelated_patterns = [
-            r'president\s+of\s+(india|usa|america|united\s+states|us|u\.s\.)',
-            r'prime\s+minister\s+of',
-            r'capital\s+of\s+(india|delhi|mumbai|bangalore)',
-            r'who\s+is\s+(?:the\s+)?(president|prime\s+minister|ceo)\s+of',
-            r'weather\s+in',
-            r'news\s+about',
-            r'sports\s+(score|match|game)',
-            r'(movie|film)\s+(review|rating)',
-            r'recipe\s+for',
-        ]
+        # Check if query is about mutual funds at all (if so it is never refused here)
+        is_about_mf = MF_KEYWORD_RE.search(query_lower) is not None
         
         is_unrelated = False
-        for pattern in unrelated_patterns:
-            if re.search(pattern, query_lower, re.IGNORECASE):
-                is_unrelated = True
-                break
-        
-        # Also check for "who is the X" where X is not fund-related
-        if re.search(r'who\s+is\s+(?:the\s+)?(\w+)', query_lower):
-            match = re.search(r'who\s+is\s+(?:the\s+)?(\w+)', query_lower)
+        if not is_about_mf:
+            # Check for clearly unrelated queries (president, politics, general knowledge, etc.)
+            is_unrelated = UNRELATED_QUERY_RE.search(query_lower) is not None
+            
+            # Also check for "who is the X" where X is not fund-related
+            match = WHO_IS_RE.search(query_lower)
             if match:
                 word_after = match.group(1).lower()
-                mf_roles = ['manager', 'fund', 'portfolio', 'investment']
-                unrelated_roles = ['president', 'prime', 'minister', 'ceo', 'king', 'queen', 'leader']
-                if word_after in unrelated_roles:
+                if word_after in WHO_IS_UNRELATED_ROLES:
                     is_unrelated = True
-                elif 'of' in query_lower and word_after not in mf_roles:
+                elif 'of' in query_lower and word_after not in WHO_IS_MF_ROLES:
                     is_unrelated = True
         
-        # Check if query is about mutual funds at all
-        mf_keywords = ['mutual fund', 'fund', 'scheme', 'hdfc', 'elss', 'sip', 'nav', 'expense ratio', 
-                       'exit load', 'redemption', 'investment', 'portfolio', 'manager', 'benchmark', 
-                       'riskometer', 'lock-in', 'lockin', 'minimum', 'allotment', 'units', 'groww']
-        is_about_mf = any(kw in query_lower for kw in mf_keywords)
-        
         if is_unrelated and not is_about_mf:
             return {
-                'answer': "I only provide information about HDFC Mutual Funds. I don't have information about that topic. Please ask me about HDFC schemes, expense ratios, exit loads, fund managers, or other mutual fund-related questions.",
+                'answer': UNRELATED_TOPIC_ANSWER,
                 'source_url': None,
                 'refused': True,
                 'query_type': 'general'
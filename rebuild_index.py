@@ -2,10 +2,15 @@
 Rebuild FAISS index from clean chunks
 """
 import json
+import os
 import numpy as np
 import faiss
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
+from constants import IVF_PQ_MIN_VECTORS, IVF_PQ_NLIST, IVF_PQ_M, IVF_PQ_NBITS, IVF_DEFAULT_NPROBE
+
+# FAISS_QUANT=int8 stores 8-bit scalar-quantized vectors (4x smaller than float32) instead of exact float32/PQ codes
+FAISS_QUANT = os.getenv("FAISS_QUANT", "").lower()
 
 # Paths
 CHUNKS_CLEAN = Path("chunks_clean/chunks_clean.jsonl")
@@ -39,16 +44,47 @@ print(f"Generated {len(embeddings)} embeddings (dimension: {embeddings.shape[1]}
 
 # Create FAISS index
 dimension = embeddings.shape[1]
-index = faiss.IndexFlatIP(dimension)  # Inner product for cosine similarity (normalized vectors)
+if len(embeddings) >= IVF_PQ_MIN_VECTORS:
+    # Large corpus: inverted lists + product (or int8 scalar) quantization (RAGRetriever sets nprobe per query type)
+    quantizer = faiss.IndexFlatIP(dimension)
+    if FAISS_QUANT == "int8":
+        index = faiss.IndexIVFScalarQuantizer(quantizer, dimension, IVF_PQ_NLIST, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+        index_type = "ivf_sq8"
+    else:
+        index = faiss.IndexIVFPQ(quantizer, dimension, IVF_PQ_NLIST, IVF_PQ_M, IVF_PQ_NBITS, faiss.METRIC_INNER_PRODUCT)
+        index_type = "ivf_pq"
+    print(f"Training {index_type} index (nlist={IVF_PQ_NLIST})...")
+    index.train(embeddings)
+    index.nprobe = IVF_DEFAULT_NPROBE
+elif FAISS_QUANT == "int8":
+    # Flat scan over 8-bit codes; training only learns the per-dimension value range
+    index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+    index.train(embeddings)
+    index_type = "sq8"
+else:
+    index = faiss.IndexFlatIP(dimension)  # Inner product for cosine similarity (normalized vectors)
+    index_type = "flat"
 
 # Add vectors to index
 index.add(embeddings)
 
 print(f"Index created with {index.ntotal} vectors")
 
-# Save index
+if index_type != "flat":
+    # Recall@10 against exact search, using a sample of the chunk embeddings as queries
+    exact_index = faiss.IndexFlatIP(dimension)
+    exact_index.add(embeddings)
+    sample = embeddings[::max(1, len(embeddings) // 500)]
+    _, exact_ids = exact_index.search(sample, 10)
+    _, approx_ids = index.search(sample, 10)
+    recall = np.mean([len(set(approx) & set(exact)) / 10 for approx, exact in zip(approx_ids, exact_ids)])
+    print(f"Recall@10 vs exact search: {recall:.3f}")
+
+# Save index (write then rename, so a running retriever that memory-maps the old file keeps a valid mapping)
 index_path = EMBEDDINGS_DIR / "faiss_index.bin"
-faiss.write_index(index, str(index_path))
+tmp_index_path = index_path.with_suffix(".bin.tmp")
+faiss.write_index(index, str(tmp_index_path))
+os.replace(tmp_index_path, index_path)
 print(f"Saved index to {index_path}")
 
 # Create metadata (matching format expected by RAGRetriever)
@@ -73,6 +109,7 @@ print(f"Saved metadata to {metadata_path}")
 # Save index metadata
 index_metadata = {
     "vector_db": "faiss",
+    "index_type": index_type,
     "index_path": str(index_path),
     "metadata_path": str(metadata_path),
     "distance_metric": "cosine",